@@ -0,0 +1,87 @@
+"""
+Account Memory Benchmark for Synergy Network
+
+This script measures the memory taken per externally owned account in the
+in-memory state (Account object, 66-character address and accounts dict
+entry), and compares it with the previous layout that used a per-instance
+__dict__ and allocated empty storage and validator data dictionaries.
+
+Usage:
+    python bench_account_memory.py [--accounts N ...]
+"""
+
+import argparse
+import gc
+import os
+import tracemalloc
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from implementation.core.state.state import Account
+
+class DictAccount:
+    """Account with the previous layout, kept for comparison."""
+
+    def __init__(self, address: str, balance: int = 0, nonce: int = 0):
+        self.address = address
+        self.balance = balance
+        self.nonce = nonce
+        self.code = None
+        self.storage = {}
+        self.is_validator = False
+        self.validator_data = {}
+
+def measure(account_class, num_accounts: int) -> float:
+    """
+    Measure the memory taken per account.
+
+    Args:
+        account_class: Account class to instantiate
+        num_accounts: Number of accounts to create
+
+    Returns:
+        Bytes per account
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    accounts = {}
+    for i in range(num_accounts):
+        # Addresses are 66 characters long, like generated sYnQ/sYnU addresses
+        address = f"sYnQsyn1{i:058d}"
+        accounts[address] = account_class(address=address, balance=1000 + i, nonce=i % 100)
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del accounts
+    gc.collect()
+
+    return current / num_accounts
+
+def run(counts) -> None:
+    """
+    Run the benchmark for each account count.
+
+    Args:
+        counts: Numbers of accounts to measure
+    """
+    print(f"{'accounts':>12} {'slots (B/acct)':>15} {'total':>10} {'__dict__ (B/acct)':>18} {'total':>10}")
+
+    for count in counts:
+        slotted = measure(Account, count)
+        legacy = measure(DictAccount, count)
+
+        print(
+            f"{count:>12,} {slotted:>15.0f} {slotted * count / 2 ** 20:>8.0f}MB "
+            f"{legacy:>18.0f} {legacy * count / 2 ** 20:>8.0f}MB"
+        )
+
+# Example usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure memory per account")
+    parser.add_argument("--accounts", type=int, nargs="+", default=[100000, 1000000], help="Account counts")
+    args = parser.parse_args()
+
+    run(args.accounts)
@@ -0,0 +1,158 @@
+"""
+Codec Benchmark for Synergy Network
+
+This script checks that transactions, block headers and blocks round-trip
+through the binary codec, and compares the size and the encode, decode and
+hash throughput of the binary encoding with the previous sorted-key JSON
+encoding.
+
+Usage:
+    python bench_codec.py [--transactions N] [--rounds N]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+from implementation.core.transaction.transaction import Transaction, TransactionType
+from implementation.core.blockchain.block import Block, BlockHeader
+
+# Size of a Dilithium3 signature
+SIGNATURE_SIZE = 3293
+
+def make_block(num_transactions: int) -> Block:
+    """
+    Create a block of signed-looking transfer transactions.
+
+    Args:
+        num_transactions: Number of transactions
+
+    Returns:
+        Block instance
+    """
+    rng = random.Random(42)
+    block = Block(header=BlockHeader(height=1, synergy_points={"validator_1": 100}))
+
+    for i in range(num_transactions):
+        tx = Transaction(
+            tx_type=TransactionType.TRANSFER,
+            from_address=f"sYnQsyn1{i % 500:058d}",
+            to_address=f"sYnQsyn1{rng.randrange(10 ** 6):058d}",
+            amount=rng.randrange(1, 10 ** 12),
+            fee=rng.randrange(1, 1000),
+            nonce=i // 500 + 1,
+            signature=rng.randbytes(SIGNATURE_SIZE)
+        )
+        block.add_transaction(tx.to_dict())
+
+    block.header.validator_signature = rng.randbytes(SIGNATURE_SIZE)
+    return block
+
+def json_encode_block(block: Block) -> bytes:
+    """Encode a block with the previous JSON encoding."""
+    return json.dumps(block.to_dict(), sort_keys=True).encode("utf-8")
+
+def json_decode_block(data: bytes) -> Block:
+    """Decode a block from the previous JSON encoding."""
+    block_dict = json.loads(data.decode("utf-8"))
+    return Block(header=BlockHeader.from_dict(block_dict["header"]), transactions=block_dict["transactions"])
+
+def check_round_trip(block: Block) -> None:
+    """
+    Check that the block, its header and its transactions round-trip.
+
+    Args:
+        block: Block to check
+    """
+    decoded = Block.deserialize(block.serialize())
+    assert decoded.header.to_dict() == block.header.to_dict(), "header mismatch"
+    assert decoded.transactions == block.transactions, "transaction mismatch"
+    assert decoded.get_hash() == block.get_hash(), "block hash mismatch"
+    assert decoded.calculate_merkle_root() == block.header.merkle_root, "Merkle root mismatch"
+
+    header = BlockHeader.deserialize(block.header.serialize())
+    assert header.to_dict() == block.header.to_dict(), "header round trip mismatch"
+
+    for tx_dict in block.transactions[:100]:
+        tx = Transaction.from_dict(tx_dict)
+        decoded_tx = Transaction.deserialize(tx.serialize())
+        assert decoded_tx.to_dict() == tx_dict, "transaction round trip mismatch"
+        assert decoded_tx.get_hash() == tx.get_hash(), "transaction hash mismatch"
+
+def timed(function, rounds: int) -> float:
+    """
+    Time a function.
+
+    Args:
+        function: Function to call
+        rounds: Number of calls
+
+    Returns:
+        Best time of one call in seconds
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(num_transactions: int, rounds: int) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        num_transactions: Transactions per block
+        rounds: Timing rounds per measurement
+    """
+    block = make_block(num_transactions)
+    check_round_trip(block)
+    print(f"Round trip: OK ({num_transactions} transactions)")
+
+    binary = block.serialize()
+    legacy = json_encode_block(block)
+    print(f"Block size: binary {len(binary) / 1024:.0f} KiB, JSON {len(legacy) / 1024:.0f} KiB "
+          f"({len(binary) / len(legacy):.0%})")
+
+    transactions = [Transaction.from_dict(tx) for tx in block.transactions]
+
+    def json_tx_hashes():
+        for tx in transactions:
+            tx_dict = tx.to_dict()
+            tx_dict.pop("signature")
+            HashFunctions.hash_transaction(tx_dict)
+
+    def binary_tx_hashes():
+        for tx in transactions:
+            # Drop the memoized hash, so each round hashes the encoding
+            tx.invalidate_hash()
+            tx.get_hash()
+
+    measurements = [
+        ("encode block", lambda: json_encode_block(block), block.serialize),
+        ("decode block", lambda: json_decode_block(legacy), lambda: Block.deserialize(binary)),
+        ("hash transactions", json_tx_hashes, binary_tx_hashes),
+    ]
+
+    print(f"{'operation':>18} {'JSON (ms)':>10} {'binary (ms)':>12} {'speedup':>8} {'binary tx/s':>12}")
+    for name, json_function, binary_function in measurements:
+        json_time = timed(json_function, rounds)
+        binary_time = timed(binary_function, rounds)
+        print(
+            f"{name:>18} {json_time * 1000:>10.1f} {binary_time * 1000:>12.1f} "
+            f"{json_time / binary_time:>7.1f}x {num_transactions / binary_time:>12,.0f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the binary codec against JSON")
+    parser.add_argument("--transactions", type=int, default=2000, help="Transactions per block")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds per measurement")
+    args = parser.parse_args()
+
+    run(args.transactions, args.rounds)
@@ -0,0 +1,97 @@
+"""
+Hashing Benchmark for Synergy Network
+
+This script compares the batched hashing API of HashFunctions with hashing
+one input at a time, and the iterative merkle_root_batched with the previous
+recursive Merkle root implementation, checking that the results match.
+
+Usage:
+    python bench_hashing.py [--leaves N ...] [--size BYTES] [--threads N]
+"""
+
+import argparse
+import os
+import time
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+
+def recursive_merkle_root(hashes: list) -> bytes:
+    """Previous recursive Merkle root implementation, kept for comparison."""
+    if not hashes:
+        return bytes(32)
+
+    if len(hashes) == 1:
+        return hashes[0]
+
+    if len(hashes) % 2 == 1:
+        hashes.append(hashes[-1])
+
+    next_level = []
+    for i in range(0, len(hashes), 2):
+        next_level.append(HashFunctions.sha3_256(hashes[i] + hashes[i + 1]))
+
+    return recursive_merkle_root(next_level)
+
+def timed(function, rounds: int = 5) -> float:
+    """
+    Time a function.
+
+    Args:
+        function: Function to call
+        rounds: Number of calls
+
+    Returns:
+        Best time of one call in seconds
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(leaf_counts, size: int, threads: int) -> None:
+    """
+    Run the benchmark for each number of leaves.
+
+    Args:
+        leaf_counts: Numbers of inputs per batch
+        size: Size of each input in bytes
+        threads: Threads for the parallel hash_many measurement
+    """
+    print(f"{'inputs':>10} {'one by one':>11} {'hash_many':>10} {f'{threads} threads':>11} "
+          f"{'recursive root':>15} {'batched root':>13} {'speedup':>8}")
+
+    for count in leaf_counts:
+        inputs = [os.urandom(size) for _ in range(count)]
+
+        single = [HashFunctions.sha3_256(data) for data in inputs]
+        assert HashFunctions.hash_many(inputs) == single, "hash_many mismatch"
+        assert HashFunctions.hash_many(inputs, threads=threads) == single, "threaded hash_many mismatch"
+
+        leaves = list(single)
+        assert HashFunctions.merkle_root_batched(leaves) == recursive_merkle_root(list(leaves)), "root mismatch"
+        assert leaves == single, "merkle_root_batched modified its input"
+
+        one_by_one = timed(lambda: [HashFunctions.sha3_256(data) for data in inputs])
+        batched = timed(lambda: HashFunctions.hash_many(inputs))
+        parallel = timed(lambda: HashFunctions.hash_many(inputs, threads=threads))
+        recursive_root = timed(lambda: recursive_merkle_root(list(leaves)))
+        batched_root = timed(lambda: HashFunctions.merkle_root_batched(leaves))
+
+        print(
+            f"{count:>10,} {one_by_one * 1000:>9.1f}ms {batched * 1000:>8.1f}ms {parallel * 1000:>9.1f}ms "
+            f"{recursive_root * 1000:>13.1f}ms {batched_root * 1000:>11.1f}ms {recursive_root / batched_root:>7.1f}x"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched hashing and Merkle roots")
+    parser.add_argument("--leaves", type=int, nargs="+", default=[1000, 10000, 100000], help="Inputs per batch")
+    parser.add_argument("--size", type=int, default=3400, help="Size of each input in bytes")
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1, help="Threads for parallel hashing")
+    args = parser.parse_args()
+
+    run(args.leaves, args.size, args.threads)
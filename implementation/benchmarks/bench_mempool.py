@@ -0,0 +1,128 @@
+"""
+Mempool Benchmark for Synergy Network
+
+This script fills a TransactionPool with pending transactions and compares
+the fee-indexed top-K retrieval with the previous implementation, which
+sorted every pending transaction on each call. It also measures insertion,
+nonce-ordered retrieval of ready transactions, their confirmation and
+lowest-fee eviction, and checks that both top-K retrievals agree.
+
+Usage:
+    python bench_mempool.py [--pending N ...] [--limit K]
+"""
+
+import argparse
+import random
+import time
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from implementation.core.transaction.transaction import Transaction, TransactionPool, TransactionType
+
+def sorted_pending_transactions(pool: TransactionPool, limit: int):
+    """Previous get_pending_transactions implementation, kept for comparison."""
+    sorted_txs = sorted(
+        pool.pending_transactions.values(),
+        key=lambda tx: tx.fee,
+        reverse=True
+    )
+
+    return sorted_txs[:limit]
+
+def make_transactions(count: int, seed: int = 42):
+    """
+    Create transfer transactions with random fees.
+
+    Args:
+        count: Number of transactions
+        seed: Random seed
+
+    Returns:
+        List of Transaction instances
+    """
+    rng = random.Random(seed)
+    return [
+        Transaction(
+            tx_type=TransactionType.TRANSFER,
+            from_address=f"sYnQsyn1{i % 10000:058d}",
+            to_address=f"sYnQsyn1{rng.randrange(10 ** 6):058d}",
+            amount=rng.randrange(1, 10 ** 9),
+            fee=rng.randrange(1, 10 ** 6),
+            nonce=i // 10000 + 1,
+            tx_id=f"tx-{seed}-{i}"
+        )
+        for i in range(count)
+    ]
+
+def timed(function, rounds: int = 5) -> float:
+    """
+    Time a function.
+
+    Args:
+        function: Function to call
+        rounds: Number of calls
+
+    Returns:
+        Best time of one call in seconds
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(pending_counts, limit: int) -> None:
+    """
+    Run the benchmark for each pool size.
+
+    Args:
+        pending_counts: Numbers of pending transactions
+        limit: Number of transactions retrieved per call (K)
+    """
+    print(f"{'pending':>10} {'add/tx':>8} {'sorted top-K':>13} {'heap top-K':>11} {'speedup':>8} "
+          f"{'ready K':>9} {'confirm K':>10} {'evict K':>9}")
+
+    for count in pending_counts:
+        transactions = make_transactions(count)
+        # Unbounded, so that no transaction is evicted while filling the pool
+        pool = TransactionPool(max_pending=None, max_pending_bytes=None)
+
+        start = time.perf_counter()
+        for tx in transactions:
+            pool.add_transaction(tx)
+        add_time = (time.perf_counter() - start) / count
+
+        assert pool.get_pending_transactions(limit) == sorted_pending_transactions(pool, limit), "top-K mismatch"
+
+        rounds = 3 if count >= 1000000 else 5
+        sorted_time = timed(lambda: sorted_pending_transactions(pool, limit), rounds)
+        heap_time = timed(lambda: pool.get_pending_transactions(limit), rounds)
+
+        # Confirm the K best ready transactions, as after including them in a block
+        ready_time = timed(lambda: pool.get_ready_transactions(limit), rounds)
+        best = pool.get_ready_transactions(limit)
+        start = time.perf_counter()
+        for tx in best:
+            pool.mark_as_confirmed(tx.tx_id)
+        confirm_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        evicted = pool.evict_transactions(limit)
+        evict_time = time.perf_counter() - start
+        assert len(evicted) == limit and len(pool.pending_transactions) == count - 2 * limit, "eviction mismatch"
+
+        print(
+            f"{count:>10,} {add_time * 1e6:>6.1f}us {sorted_time * 1000:>11.2f}ms {heap_time * 1000:>9.3f}ms "
+            f"{sorted_time / heap_time:>7.0f}x {ready_time * 1000:>7.3f}ms {confirm_time * 1000:>8.3f}ms {evict_time * 1000:>7.3f}ms"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TransactionPool priority retrieval")
+    parser.add_argument("--pending", type=int, nargs="+", default=[10000, 100000, 1000000], help="Pending transactions")
+    parser.add_argument("--limit", type=int, default=100, help="Transactions retrieved per call")
+    args = parser.parse_args()
+
+    run(args.pending, args.limit)
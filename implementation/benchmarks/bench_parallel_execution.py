@@ -0,0 +1,148 @@
+"""
+Parallel Execution Benchmark for Synergy Network
+
+This script compares serial block application (StateManager.apply_block) with
+optimistic parallel execution (ParallelBlockExecutor) for blocks of transfers
+at increasing contention levels, and checks that both produce identical state.
+
+Besides wall-clock times it reports the CPU time the coordinating process
+spends on the block and the CPU time spent speculating in workers, and the
+speedup these project for a machine with one idle core per worker. The
+measured speedup only approaches the projected one when the machine has
+that many cores to spare.
+
+Usage:
+    python bench_parallel_execution.py [--transactions N] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from implementation.core.state.state import StateManager
+from implementation.core.state.parallel import ParallelBlockExecutor
+from implementation.core.transaction.transaction import Transaction, TransactionType
+from implementation.core.blockchain.block import Block
+
+# Fraction of transactions sending to a small set of hot accounts
+CONTENTION_LEVELS = [0.0, 0.1, 0.25, 0.5, 1.0]
+HOT_ACCOUNTS = 4
+
+def create_manager(num_accounts: int) -> StateManager:
+    """
+    Create a state manager with funded accounts.
+
+    Args:
+        num_accounts: Number of accounts to fund
+
+    Returns:
+        StateManager instance
+    """
+    manager = StateManager()
+
+    for i in range(num_accounts):
+        manager.state.set_balance(f"sYnQbench{i}", 10 ** 9)
+
+    manager.state.set_balance(StateManager.FEE_RECIPIENT, 0)
+    manager.commit()
+
+    return manager
+
+def create_block(num_transactions: int, num_accounts: int, contention: float, seed: int = 0) -> Block:
+    """
+    Create a block of transfers.
+
+    Every transaction has its own sender and recipient, except that with
+    probability `contention` the recipient is one of a few hot accounts that
+    also send in the block.
+
+    Args:
+        num_transactions: Number of transactions
+        num_accounts: Number of funded accounts
+        contention: Fraction of transactions sent to hot accounts
+        seed: Random seed
+
+    Returns:
+        Block instance
+    """
+    rng = random.Random(seed)
+    transactions = []
+
+    for i in range(num_transactions):
+        sender = f"sYnQbench{i}"
+
+        if rng.random() < contention:
+            recipient = f"sYnQbench{rng.randrange(HOT_ACCOUNTS)}"
+        else:
+            recipient = f"sYnQbench{num_transactions + i}"
+
+        transactions.append(Transaction(TransactionType.TRANSFER, sender, recipient, 10, 1, 1))
+
+    return Block(transactions=transactions)
+
+def run(num_transactions: int, workers: int) -> None:
+    """
+    Run the benchmark at every contention level.
+
+    Args:
+        num_transactions: Number of transactions per block
+        workers: Number of parallel workers
+    """
+    num_accounts = num_transactions * 2
+
+    print(f"{num_transactions} transfers per block, {workers} workers, {os.cpu_count()} CPUs")
+    print(
+        f"{'contention':>10} {'serial (s)':>11} {'parallel (s)':>13} {'speedup':>8} "
+        f"{'coordinator (s)':>16} {'workers (s)':>12} {'projected':>10} {'re-executed':>12}"
+    )
+
+    for contention in CONTENTION_LEVELS:
+        block = create_block(num_transactions, num_accounts, contention)
+
+        serial = create_manager(num_accounts)
+        start = time.perf_counter()
+        serial_receipts = serial.apply_block(block)
+        serial_time = time.perf_counter() - start
+
+        parallel = create_manager(num_accounts)
+        with ParallelBlockExecutor(parallel, max_workers=workers) as executor:
+            executor.start()
+
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            parallel_receipts = executor.apply_block(block)
+            parallel_time = time.perf_counter() - start
+            coordinator_time = time.process_time() - cpu_start
+
+            # Thread workers run in the coordinating process
+            speculation_time = executor.stats["speculation_time"]
+            if not executor.use_processes:
+                coordinator_time -= speculation_time
+
+            reexecuted = executor.stats["reexecuted"]
+
+        assert serial_receipts == parallel_receipts
+        assert json.dumps(serial.state.to_dict(), sort_keys=True) == json.dumps(parallel.state.to_dict(), sort_keys=True)
+
+        # Assume no overlap between speculating and committing
+        projected_time = coordinator_time + speculation_time / workers
+
+        print(
+            f"{contention:>10.2f} {serial_time:>11.3f} {parallel_time:>13.3f} "
+            f"{serial_time / parallel_time:>7.2f}x {coordinator_time:>16.3f} {speculation_time:>12.3f} "
+            f"{serial_time / projected_time:>9.2f}x {reexecuted:>12}"
+        )
+
+# Example usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel transaction execution")
+    parser.add_argument("--transactions", type=int, default=5000, help="Transactions per block")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of workers")
+    args = parser.parse_args()
+
+    run(args.transactions, args.workers)
@@ -2,7 +2,7 @@
 Core Module for Synergy Network
 
 This package contains the core components of the Synergy Network blockchain,
-including blockchain, transaction, state, and network modules.
+including blockchain, transaction, state, network, and encoding modules.
 """
 
-__all__ = ['blockchain', 'transaction', 'state', 'network']
+__all__ = ['blockchain', 'transaction', 'state', 'network', 'encoding']
@@ -6,5 +6,10 @@ including block structure and related functionality.
 """
 
 from .block import Block, BlockHeader, GenesisBlock, BlockBuilder
+from .merkle import MerkleAccumulator, MerkleProof, transaction_leaf, verify_transaction_proof
+from .store import BlockStore
+from .compact import CompactBlock
+from .template import BlockTemplate
+from .validation import BlockValidator
 
-__all__ = ['Block', 'BlockHeader', 'GenesisBlock', 'BlockBuilder']
+__all__ = ['Block', 'BlockHeader', 'GenesisBlock', 'BlockBuilder', 'MerkleAccumulator', 'MerkleProof', 'transaction_leaf', 'verify_transaction_proof', 'BlockStore', 'CompactBlock', 'BlockTemplate', 'BlockValidator']
@@ -6,18 +6,27 @@ for the Synergy Network blockchain.
 """
 
 import time
-import json
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import sys
 import os
 
 # Add parent directory to path to import from cryptography package
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
 from implementation.cryptography.pqc.hash import HashFunctions
+from implementation.core.blockchain.merkle import MerkleAccumulator, MerkleProof, transaction_leaf
+from implementation.core.encoding.codec import (
+    encode_header, decode_header, encode_block, split_block, encode_block_entry, decode_block_entry, to_json
+)
 
 class BlockHeader:
     """Class representing a block header in the Synergy Network."""
     
+    # Fields covered by the header hash (everything but the signature)
+    HASHED_FIELDS = frozenset([
+        "version", "previous_hash", "merkle_root", "timestamp", "height",
+        "validator_cluster_id", "synergy_points", "difficulty", "nonce", "state_root"
+    ])
+    
     def __init__(
         self,
         version: int = 1,
@@ -29,7 +38,8 @@ class BlockHeader:
         validator_cluster_id: str = None,
         synergy_points: Dict[str, int] = None,
         difficulty: int = 1,
-        nonce: bytes = None
+        nonce: bytes = None,
+        state_root: bytes = None
     ):
         """
         Initialize a BlockHeader instance.
@@ -45,7 +55,11 @@ class BlockHeader:
             synergy_points: Dictionary mapping validator IDs to Synergy Points
             difficulty: Block difficulty target
             nonce: Nonce value for the block
+            state_root: Root of the authenticated state after applying the block
         """
+        # Memoized hash, cleared whenever a hashed field is assigned
+        self._hash: Optional[bytes] = None
+        
         self.version = version
         self.previous_hash = previous_hash or bytes(32)  # Default to zero hash
         self.merkle_root = merkle_root or bytes(32)  # Default to zero hash
@@ -56,6 +70,22 @@ class BlockHeader:
         self.synergy_points = synergy_points or {}
         self.difficulty = difficulty
         self.nonce = nonce or bytes(32)  # Default to zero bytes
+        self.state_root = state_root or bytes(32)  # Default to zero hash
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the memoized hash if it is hashed."""
+        if name in self.HASHED_FIELDS:
+            self.__dict__["_hash"] = None
+        object.__setattr__(self, name, value)
+    
+    def invalidate_hash(self) -> None:
+        """
+        Invalidate the memoized hash.
+        
+        Must be called after modifying the Synergy Points dictionary in
+        place, as only attribute assignments are detected.
+        """
+        self._hash = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -74,7 +104,8 @@ class BlockHeader:
             "validator_cluster_id": self.validator_cluster_id,
             "synergy_points": self.synergy_points,
             "difficulty": self.difficulty,
-            "nonce": self.nonce.hex()
+            "nonce": self.nonce.hex(),
+            "state_root": self.state_root.hex()
         }
     
     @classmethod
@@ -98,31 +129,60 @@ class BlockHeader:
             validator_cluster_id=data.get("validator_cluster_id"),
             synergy_points=data.get("synergy_points", {}),
             difficulty=data.get("difficulty", 1),
-            nonce=bytes.fromhex(data["nonce"]) if "nonce" in data else None
+            nonce=bytes.fromhex(data["nonce"]) if "nonce" in data else None,
+            state_root=bytes.fromhex(data["state_root"]) if "state_root" in data else None
         )
     
     def get_hash(self) -> bytes:
         """
         Compute the hash of the block header.
         
+        The hash is computed once and memoized until a hashed field changes.
+        
         Returns:
             32-byte hash digest
         """
-        # Create a dictionary representation without the signature
-        header_dict = self.to_dict()
-        header_dict.pop("validator_signature", None)
+        header_hash = self._hash
+        if header_hash is None:
+            # Hash the canonical encoding without the signature
+            header_hash = HashFunctions.sha3_256(encode_header(self, include_signature=False))
+            self._hash = header_hash
         
-        # Use the hash function from the cryptography package
-        return HashFunctions.hash_block(header_dict)
+        return header_hash
     
     def serialize(self) -> bytes:
         """
-        Serialize the block header to bytes.
+        Serialize the block header to its canonical binary encoding.
         
         Returns:
             Serialized block header
         """
-        return json.dumps(self.to_dict(), sort_keys=True).encode('utf-8')
+        return encode_header(self)
+    
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'BlockHeader':
+        """
+        Deserialize bytes to a BlockHeader.
+        
+        Args:
+            data: Serialized block header
+        
+        Returns:
+            BlockHeader instance
+        
+        Raises:
+            CodecError: If the data is not a valid encoded block header
+        """
+        return cls(**decode_header(data))
+    
+    def to_json(self) -> str:
+        """
+        Render the block header as JSON for debugging.
+        
+        Returns:
+            Indented JSON string
+        """
+        return to_json(self.to_dict())
 
 class Block:
     """Class representing a block in the Synergy Network."""
@@ -141,6 +201,11 @@ class Block:
         """
         self.header = header or BlockHeader()
         self.transactions = transactions or []
+        
+        # Merkle accumulator over the transaction hashes, built on first use,
+        # and the transaction list and last transaction it was built over
+        self.merkle: Optional[MerkleAccumulator] = None
+        self.merkle_source: Tuple[Optional[List], Any] = (None, None)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -172,12 +237,12 @@ class Block:
     
     def serialize(self) -> bytes:
         """
-        Serialize the block to bytes.
+        Serialize the block to its canonical binary encoding.
         
         Returns:
             Serialized block
         """
-        return json.dumps(self.to_dict(), sort_keys=True).encode('utf-8')
+        return encode_block(self.header, [encode_block_entry(tx) for tx in self.transactions])
     
     @classmethod
     def deserialize(cls, data: bytes) -> 'Block':
@@ -189,9 +254,24 @@ class Block:
         
         Returns:
             Block instance
+        
+        Raises:
+            CodecError: If the data is not a valid encoded block
+        """
+        header, entries = split_block(data)
+        return cls(
+            header=BlockHeader(**header),
+            transactions=[decode_block_entry(entry) for entry in entries]
+        )
+    
+    def to_json(self) -> str:
+        """
+        Render the block as JSON for debugging.
+        
+        Returns:
+            Indented JSON string
         """
-        block_dict = json.loads(data.decode('utf-8'))
-        return cls.from_dict(block_dict)
+        return to_json(self.to_dict())
     
     def get_hash(self) -> bytes:
         """
@@ -206,42 +286,93 @@ class Block:
         """
         Calculate the Merkle root of the block's transactions.
         
+        Every transaction is rehashed and the Merkle accumulator is rebuilt.
+        
         Returns:
             32-byte Merkle root hash
         """
         # If no transactions, return zero hash
         if not self.transactions:
+            self.merkle = MerkleAccumulator()
+            self.merkle_source = (self.transactions, None)
             return bytes(32)
         
-        # Calculate transaction hashes
-        tx_hashes = []
-        for tx in self.transactions:
-            tx_hash = HashFunctions.hash_transaction(tx)
-            tx_hashes.append(tx_hash)
-        
-        # Calculate Merkle root
-        merkle_root = HashFunctions.merkle_root(tx_hashes)
+        # Rebuild the accumulator from the transaction hashes
+        self.merkle = MerkleAccumulator(
+            HashFunctions.hash_many([encode_block_entry(tx) for tx in self.transactions])
+        )
+        self.merkle_source = (self.transactions, self.transactions[-1])
         
-        # Update header's Merkle root
-        self.header.merkle_root = merkle_root
+        # Update header's Merkle root (unchanged roots keep the memoized hash)
+        merkle_root = self.merkle.root()
+        if merkle_root != self.header.merkle_root:
+            self.header.merkle_root = merkle_root
         
         return merkle_root
     
+    def get_merkle_accumulator(self) -> MerkleAccumulator:
+        """
+        Get the Merkle accumulator of the block's transactions.
+        
+        The accumulator is rebuilt if the transaction list was replaced,
+        changed in length or got a different last transaction since it was
+        last updated. Other in-place changes to the transactions are not
+        detected; call calculate_merkle_root() after making them.
+        
+        Returns:
+            MerkleAccumulator instance
+        """
+        transactions, last = self.merkle_source
+        
+        if (
+            self.merkle is None
+            or transactions is not self.transactions
+            or len(self.merkle) != len(self.transactions)
+            or (self.transactions and self.transactions[-1] is not last)
+        ):
+            self.calculate_merkle_root()
+        
+        return self.merkle
+    
+    def get_merkle_proof(self, index: int) -> MerkleProof:
+        """
+        Build the Merkle inclusion proof of a transaction.
+        
+        The proof can be checked against the header's Merkle root with
+        verify_transaction_proof, without the other transactions.
+        
+        Args:
+            index: Index of the transaction in the block
+        
+        Returns:
+            MerkleProof instance
+        
+        Raises:
+            IndexError: If the index is out of range
+        """
+        return self.get_merkle_accumulator().proof(index)
+    
     def add_transaction(self, transaction: Dict[str, Any]) -> bool:
         """
         Add a transaction to the block.
         
+        The Merkle root is updated incrementally in O(log N) hashes.
+        
         Args:
             transaction: Transaction data
         
         Returns:
             True if transaction was added, False otherwise
         """
+        accumulator = self.get_merkle_accumulator()
+        
         # Add transaction to list
         self.transactions.append(transaction)
         
-        # Recalculate Merkle root
-        self.calculate_merkle_root()
+        # Update Merkle root
+        accumulator.append(transaction_leaf(transaction))
+        self.merkle_source = (self.transactions, transaction)
+        self.header.merkle_root = accumulator.root()
         
         return True
     
@@ -358,6 +489,23 @@ class BlockBuilder:
         """
         return self.block.add_transaction(transaction)
     
+    def add_template(self, template) -> int:
+        """
+        Add the transactions of a block template.
+        
+        Args:
+            template: BlockTemplate instance
+        
+        Returns:
+            Number of transactions added
+        """
+        added = 0
+        for transaction in template.get_transactions():
+            if self.block.add_transaction(transaction.to_dict()):
+                added += 1
+        
+        return added
+    
     def sign_block(self, private_key: bytes) -> bool:
         """
         Sign the block with the validator's private key.
@@ -389,8 +537,8 @@ class BlockBuilder:
         Returns:
             Finalized Block instance
         """
-        # Recalculate Merkle root
-        self.block.calculate_merkle_root()
+        # Update Merkle root from the accumulator maintained while adding
+        self.block.header.merkle_root = self.block.get_merkle_accumulator().root()
         
         return self.block
 
@@ -455,3 +603,8 @@ if __name__ == "__main__":
     
     # Verify blocks match
     print(f"\nHashes match: {block.get_hash() == deserialized.get_hash()}")
+    
+    # Prove a transaction against the header only
+    from implementation.core.blockchain.merkle import verify_transaction_proof
+    proof = block.get_merkle_proof(1)
+    print(f"Transaction proof valid: {verify_transaction_proof(block.transactions[1], proof, block.header)}")
@@ -0,0 +1,303 @@
+"""
+Compact Block Module for Synergy Network
+
+This module implements compact blocks, which relay a block as its header and
+a short ID per transaction. Peers rebuild the block from the transactions
+already in their pool, and fetch only the ones they are missing.
+
+Short IDs are the first 6 bytes of a BLAKE2b hash of the transaction hash,
+keyed with a hash of the block hash and a nonce chosen by the relaying node,
+so that colliding transactions cannot be crafted ahead of a block. Coinbase
+transactions, entries that are not transactions and transactions whose short
+IDs collide are sent in full ("prefilled").
+"""
+
+import hashlib
+import random
+from typing import Dict, List, Any, Optional, Iterable
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+from implementation.core.encoding.codec import ENTRY_TRANSACTION, encode_block_entry, decode_block_entry
+from implementation.core.transaction.transaction import Transaction, TransactionType
+from implementation.core.blockchain.block import Block, BlockHeader
+
+SHORT_ID_SIZE = 6
+
+def short_id_key(block_hash: bytes, nonce: int) -> bytes:
+    """
+    Compute the key of the short transaction IDs of a compact block.
+
+    Args:
+        block_hash: Block hash
+        nonce: Nonce chosen by the relaying node
+
+    Returns:
+        16-byte key
+    """
+    return HashFunctions.sha3_256(block_hash + nonce.to_bytes(8, "big"))[:16]
+
+def short_transaction_id(key: bytes, tx_hash: bytes) -> bytes:
+    """
+    Compute the short ID of a transaction.
+
+    Args:
+        key: Key from short_id_key
+        tx_hash: Transaction hash (Transaction.get_hash)
+
+    Returns:
+        Short transaction ID
+    """
+    return hashlib.blake2b(tx_hash, digest_size=SHORT_ID_SIZE, key=key).digest()
+
+class CompactBlock:
+    """Class representing a block as its header and short transaction IDs."""
+
+    def __init__(
+        self,
+        header: BlockHeader,
+        nonce: int,
+        short_ids: List[bytes],
+        prefilled: Dict[int, bytes] = None
+    ):
+        """
+        Initialize a CompactBlock instance.
+
+        Args:
+            header: Block header
+            nonce: Nonce keying the short IDs
+            short_ids: Short IDs of the transactions that are not prefilled,
+                in block order
+            prefilled: Encoded block entries (encode_block_entry) sent in
+                full, by transaction index
+        """
+        self.header = header
+        self.nonce = nonce
+        self.short_ids = short_ids
+        self.prefilled = prefilled or {}
+
+        # Encoded block entries being reconstructed (None where missing)
+        self.entries: Optional[List[Optional[bytes]]] = None
+
+    @classmethod
+    def from_block(cls, block: Block, nonce: int = None) -> 'CompactBlock':
+        """
+        Create the compact form of a block.
+
+        Args:
+            block: Block to relay
+            nonce: Nonce keying the short IDs (random if None)
+
+        Returns:
+            CompactBlock instance
+        """
+        if nonce is None:
+            nonce = random.getrandbits(64)
+
+        key = short_id_key(block.get_hash(), nonce)
+        short_ids = []
+        prefilled = {}
+        seen = set()
+
+        for index, tx in enumerate(block.transactions):
+            entry = encode_block_entry(tx)
+
+            if entry[0] == ENTRY_TRANSACTION:
+                transaction = tx if isinstance(tx, Transaction) else Transaction.from_dict(tx)
+                if transaction.tx_type != TransactionType.COINBASE:
+                    short_id = short_transaction_id(key, transaction.get_hash())
+                    if short_id not in seen:
+                        seen.add(short_id)
+                        short_ids.append(short_id)
+                        continue
+
+            prefilled[index] = entry
+
+        return cls(header=block.header, nonce=nonce, short_ids=short_ids, prefilled=prefilled)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert CompactBlock to dictionary, as carried by a compact_block message.
+
+        Returns:
+            Dictionary representation of the compact block
+        """
+        return {
+            "header": self.header.serialize(),
+            "nonce": self.nonce,
+            "short_ids": b"".join(self.short_ids),
+            "prefilled": [[index, entry] for index, entry in sorted(self.prefilled.items())]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactBlock':
+        """
+        Create CompactBlock from dictionary.
+
+        Args:
+            data: Dictionary representation of the compact block
+
+        Returns:
+            CompactBlock instance
+
+        Raises:
+            ValueError: If the dictionary is not a valid compact block
+        """
+        try:
+            header = BlockHeader.deserialize(data["header"])
+            nonce = data["nonce"]
+            short_ids = data["short_ids"]
+            prefilled = {index: entry for index, entry in data.get("prefilled", [])}
+        except Exception as e:
+            raise ValueError(f"Invalid compact block: {e}")
+
+        if not isinstance(nonce, int) or not 0 <= nonce < 2 ** 64:
+            raise ValueError("Invalid compact block nonce")
+
+        if not isinstance(short_ids, bytes) or len(short_ids) % SHORT_ID_SIZE:
+            raise ValueError("Invalid compact block short IDs")
+
+        count = len(short_ids) // SHORT_ID_SIZE + len(prefilled)
+        for index, entry in prefilled.items():
+            if not isinstance(index, int) or not 0 <= index < count or not isinstance(entry, bytes):
+                raise ValueError("Invalid prefilled transaction")
+
+        return cls(
+            header=header,
+            nonce=nonce,
+            short_ids=[short_ids[i:i + SHORT_ID_SIZE] for i in range(0, len(short_ids), SHORT_ID_SIZE)],
+            prefilled=prefilled
+        )
+
+    def get_hash(self) -> bytes:
+        """
+        Compute the hash of the block.
+
+        Returns:
+            32-byte hash digest
+        """
+        return self.header.get_hash()
+
+    def get_transaction_count(self) -> int:
+        """Get the number of transactions of the block."""
+        return len(self.short_ids) + len(self.prefilled)
+
+    def reconstruct(self, transactions: Iterable[Transaction]) -> List[int]:
+        """
+        Start rebuilding the block from known transactions, e.g. the pending
+        transactions of the TransactionPool.
+
+        Transactions whose short ID matches several known transactions are
+        treated as missing.
+
+        Args:
+            transactions: Known transactions
+
+        Returns:
+            Indexes of the missing transactions, to request from the peer
+        """
+        key = short_id_key(self.get_hash(), self.nonce)
+        wanted = set(self.short_ids)
+        matches: Dict[bytes, Optional[Transaction]] = {}
+
+        for transaction in transactions:
+            short_id = short_transaction_id(key, transaction.get_hash())
+            if short_id in wanted:
+                # Ambiguous short IDs match nothing
+                matches[short_id] = None if short_id in matches else transaction
+
+        self.entries = []
+        missing = []
+        short_ids = iter(self.short_ids)
+
+        for index in range(self.get_transaction_count()):
+            entry = self.prefilled.get(index)
+
+            if entry is None:
+                transaction = matches.get(next(short_ids))
+                if transaction is not None:
+                    entry = encode_block_entry(transaction)
+                else:
+                    missing.append(index)
+
+            self.entries.append(entry)
+
+        return missing
+
+    def fill(self, indexes: List[int], entries: List[bytes]) -> List[int]:
+        """
+        Add transactions received from the peer.
+
+        Args:
+            indexes: Indexes of the transactions
+            entries: Encoded block entries of the transactions
+
+        Returns:
+            Indexes of the transactions still missing
+        """
+        for index, entry in zip(indexes, entries):
+            if 0 <= index < len(self.entries) and isinstance(entry, bytes):
+                self.entries[index] = entry
+
+        return [index for index, entry in enumerate(self.entries) if entry is None]
+
+    def to_block(self) -> Optional[Block]:
+        """
+        Build the block once all transactions are known.
+
+        Returns:
+            Block instance, or None if the transactions do not match the
+            header's Merkle root (e.g. a short ID collided with another
+            transaction, or an entry is not a valid block entry)
+        """
+        if self.entries is None or any(entry is None for entry in self.entries):
+            return None
+
+        merkle_root = HashFunctions.merkle_root_batched(HashFunctions.hash_many(self.entries))
+        if merkle_root != self.header.merkle_root:
+            return None
+
+        try:
+            transactions = [decode_block_entry(entry) for entry in self.entries]
+        except Exception:
+            return None
+
+        return Block(header=self.header, transactions=transactions)
+
+# Example usage
+if __name__ == "__main__":
+    from implementation.core.encoding.codec import encode_value
+    from implementation.core.transaction.transaction import TransactionPool
+
+    pool = TransactionPool()
+    block = Block(header=BlockHeader(height=1))
+    block.add_transaction({"type": "coinbase", "amount": 50})
+
+    for i in range(2000):
+        tx = Transaction(
+            tx_type=TransactionType.TRANSFER,
+            from_address=f"sYnQsyn1{i:058d}",
+            to_address=f"sYnQsyn1{i + 1:058d}",
+            amount=i,
+            nonce=1,
+            signature=os.urandom(3293)
+        )
+        block.add_transaction(tx.to_dict())
+
+        # The receiving node has seen all but a few of the transactions
+        if i % 500:
+            pool.add_transaction(tx)
+
+    compact = CompactBlock.from_block(block)
+    print(f"Block: {len(block.serialize())} bytes, compact block: {len(encode_value(compact.to_dict()))} bytes")
+
+    received = CompactBlock.from_dict(compact.to_dict())
+    missing = received.reconstruct(pool.pending_transactions.values())
+    print(f"Missing transactions: {missing}")
+
+    remaining = received.fill(missing, [encode_block_entry(block.transactions[index]) for index in missing])
+    rebuilt = received.to_block()
+    print(f"Reconstructed: {rebuilt is not None and rebuilt.get_hash() == block.get_hash() and not remaining}")
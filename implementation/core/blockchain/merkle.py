@@ -0,0 +1,282 @@
+"""
+Merkle Module for Synergy Network
+
+This module implements the incremental Merkle accumulator used to maintain the
+transaction Merkle root of a block while transactions are added. Appending a
+leaf costs O(log N) hashes and computing the root costs O(log N) hashes, and
+the root is identical to the one computed by HashFunctions.merkle_root.
+
+It also implements Merkle inclusion proofs, which let light clients check that
+a transaction is in a block using only the block header.
+"""
+
+from typing import Dict, List, Any, Optional
+import sys
+import os
+
+# Add parent directory to path to import from cryptography package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+from implementation.core.encoding.codec import encode_block_entry
+
+def transaction_leaf(transaction: Any) -> bytes:
+    """
+    Compute the Merkle leaf of a block transaction.
+
+    Args:
+        transaction: Transaction data (or Transaction instance)
+
+    Returns:
+        32-byte hash of the transaction's block encoding
+    """
+    return HashFunctions.sha3_256(encode_block_entry(transaction))
+
+class MerkleAccumulator:
+    """Class implementing an append-only Merkle tree over 32-byte leaf hashes."""
+
+    def __init__(self, leaves: List[bytes] = None):
+        """
+        Initialize a MerkleAccumulator instance.
+
+        Args:
+            leaves: Initial leaf hashes
+        """
+        self.leaves: List[bytes] = []
+
+        # Tree levels above the leaves, built on the first proof request
+        self.levels: Optional[List[List[bytes]]] = None
+
+        # frontier[i] holds the root of the last complete subtree of 2^i
+        # leaves that is still waiting for a right sibling (bit i of the count)
+        self.frontier: List[Optional[bytes]] = []
+
+        for leaf in leaves or []:
+            self.append(leaf)
+
+    def __len__(self) -> int:
+        """Get the number of leaves."""
+        return len(self.leaves)
+
+    def append(self, leaf: bytes) -> None:
+        """
+        Append a leaf hash.
+
+        Args:
+            leaf: 32-byte leaf hash
+        """
+        self.leaves.append(leaf)
+        self.levels = None
+
+        node = leaf
+        level = 0
+        while level < len(self.frontier) and self.frontier[level] is not None:
+            node = HashFunctions.sha3_256(self.frontier[level] + node)
+            self.frontier[level] = None
+            level += 1
+
+        if level == len(self.frontier):
+            self.frontier.append(node)
+        else:
+            self.frontier[level] = node
+
+    def root(self) -> bytes:
+        """
+        Compute the Merkle root of the leaves.
+
+        Levels with an odd number of nodes pair their last node with itself,
+        as in HashFunctions.merkle_root; a single leaf is its own root.
+
+        Returns:
+            32-byte Merkle root hash (zero hash if there are no leaves)
+        """
+        count = len(self.leaves)
+        if count == 0:
+            return bytes(32)
+
+        # node is the rightmost, incomplete node of the current level (None if
+        # the level only holds complete subtrees)
+        node = None
+        level = 0
+        while (count + (1 << level) - 1) >> level > 1:
+            left = self.frontier[level]
+
+            if node is not None:
+                node = HashFunctions.sha3_256((left if left is not None else node) + node)
+            elif left is not None:
+                node = HashFunctions.sha3_256(left + left)
+
+            level += 1
+
+        return node if node is not None else self.frontier[level]
+
+    def proof(self, index: int) -> 'MerkleProof':
+        """
+        Build the inclusion proof of a leaf.
+
+        Args:
+            index: Index of the leaf
+
+        Returns:
+            MerkleProof instance
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if not 0 <= index < len(self.leaves):
+            raise IndexError(f"Leaf index {index} out of range")
+
+        if self.levels is None:
+            self.levels = self._build_levels()
+
+        siblings = []
+        position = index
+        for nodes in ([self.leaves] + self.levels)[:-1]:
+            # The last node of an odd level is paired with itself
+            sibling = position ^ 1
+            siblings.append(nodes[sibling] if sibling < len(nodes) else nodes[position])
+            position >>= 1
+
+        return MerkleProof(index=index, leaf_count=len(self.leaves), siblings=siblings)
+
+    def _build_levels(self) -> List[List[bytes]]:
+        """
+        Build the levels of the tree above the leaves, up to the root.
+
+        Returns:
+            List of levels, each a list of node hashes
+        """
+        levels = []
+        nodes = self.leaves
+
+        while len(nodes) > 1:
+            nodes = [
+                HashFunctions.sha3_256(nodes[i] + nodes[i + 1 if i + 1 < len(nodes) else i])
+                for i in range(0, len(nodes), 2)
+            ]
+            levels.append(nodes)
+
+        return levels
+
+class MerkleProof:
+    """Class representing the inclusion proof of a leaf in a Merkle tree."""
+
+    def __init__(self, index: int, leaf_count: int, siblings: List[bytes]):
+        """
+        Initialize a MerkleProof instance.
+
+        Args:
+            index: Index of the leaf
+            leaf_count: Number of leaves in the tree
+            siblings: Sibling hashes from the leaf level up to below the root
+        """
+        self.index = index
+        self.leaf_count = leaf_count
+        self.siblings = siblings
+
+    def compute_root(self, leaf: bytes) -> Optional[bytes]:
+        """
+        Compute the Merkle root implied by the proof for a leaf.
+
+        Args:
+            leaf: 32-byte leaf hash
+
+        Returns:
+            32-byte Merkle root hash, or None if the proof is malformed
+        """
+        if not 0 <= self.index < self.leaf_count:
+            return None
+
+        # The tree has one level per halving of the leaf count
+        depth = (self.leaf_count - 1).bit_length()
+        if len(self.siblings) != depth:
+            return None
+
+        node = leaf
+        position = self.index
+        count = self.leaf_count
+        for sibling in self.siblings:
+            if position % 2 == 0:
+                # The last node of an odd level must be paired with itself
+                if position == count - 1 and sibling != node:
+                    return None
+                node = HashFunctions.sha3_256(node + sibling)
+            else:
+                node = HashFunctions.sha3_256(sibling + node)
+
+            position >>= 1
+            count = (count + 1) // 2
+
+        return node
+
+    def verify(self, leaf: bytes, merkle_root: bytes) -> bool:
+        """
+        Verify that a leaf is included in a tree with a given root.
+
+        Args:
+            leaf: 32-byte leaf hash
+            merkle_root: Expected 32-byte Merkle root hash
+
+        Returns:
+            True if the proof is valid, False otherwise
+        """
+        return self.compute_root(leaf) == merkle_root
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert MerkleProof to dictionary.
+
+        Returns:
+            Dictionary representation of the proof
+        """
+        return {
+            "index": self.index,
+            "leaf_count": self.leaf_count,
+            "siblings": [sibling.hex() for sibling in self.siblings]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MerkleProof':
+        """
+        Create MerkleProof from dictionary.
+
+        Args:
+            data: Dictionary representation of the proof
+
+        Returns:
+            MerkleProof instance
+        """
+        return cls(
+            index=data["index"],
+            leaf_count=data["leaf_count"],
+            siblings=[bytes.fromhex(sibling) for sibling in data.get("siblings", [])]
+        )
+
+def verify_transaction_proof(transaction: Dict[str, Any], proof: MerkleProof, header) -> bool:
+    """
+    Verify that a transaction is included in a block, using only its header.
+
+    Args:
+        transaction: Transaction data
+        proof: Inclusion proof of the transaction
+        header: Header of the block (BlockHeader instance)
+
+    Returns:
+        True if the transaction is included in the block, False otherwise
+    """
+    return proof.verify(transaction_leaf(transaction), header.merkle_root)
+
+# Example usage
+if __name__ == "__main__":
+    hashes = [HashFunctions.sha3_256(f"Transaction {i}".encode()) for i in range(7)]
+
+    accumulator = MerkleAccumulator()
+    for tx_hash in hashes:
+        accumulator.append(tx_hash)
+
+    print(f"Accumulator root: {accumulator.root().hex()}")
+    print(f"Matches merkle_root: {accumulator.root() == HashFunctions.merkle_root(list(hashes))}")
+
+    proof = accumulator.proof(6)
+    print(f"Proof of leaf 6: {len(proof.siblings)} siblings")
+    print(f"Proof valid: {proof.verify(hashes[6], accumulator.root())}")
+    print(f"Proof valid for another leaf: {proof.verify(hashes[5], accumulator.root())}")
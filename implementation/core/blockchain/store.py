@@ -0,0 +1,452 @@
+"""
+Block Store Module for Synergy Network
+
+This module implements the append-only block store. Blocks are appended in
+height order, in their binary encoding, to segment files; every record carries
+the block height, the block hash and a CRC32 of the block so that the index
+can be rebuilt and a torn tail detected without decoding blocks. Reads go
+through memory maps of the segments, and fsyncs are batched over several
+appended blocks.
+
+Record layout:
+    length (uint32) | height (uint64) | block hash (32 bytes) | crc32 (uint32) | block
+"""
+
+import mmap
+import os
+import struct
+import zlib
+import logging
+from typing import Dict, List, Optional, Tuple
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.core.blockchain.block import Block
+
+logger = logging.getLogger("synergy.blockchain")
+
+RECORD_HEADER = struct.Struct("<IQ32sI")
+
+class BlockStore:
+    """Class implementing a segmented, append-only, memory-mapped block store."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 256 * 1024 * 1024,
+        sync_interval: int = 64,
+        verify: bool = False
+    ):
+        """
+        Initialize a BlockStore instance.
+
+        Existing segments in the directory are scanned to rebuild the indexes.
+        Records of the last segment are checked against their CRC32, and a
+        torn or corrupt tail is truncated.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_size: Size in bytes after which a new segment is started
+            sync_interval: Number of appended blocks between fsyncs (blocks
+                appended since the last fsync may be lost on a crash)
+            verify: Whether to check the CRC32 of the records of all segments
+                on open, not only the last one
+
+        Raises:
+            ValueError: If verify is set and a segment before the last one
+                is corrupt
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_interval = max(1, sync_interval)
+
+        # Segment ID -> open file, memory map and size, in segment order
+        self.segments: Dict[int, object] = {}
+        self.maps: Dict[int, mmap.mmap] = {}
+        self.segment_sizes: Dict[int, int] = {}
+        self.active_segment = 0
+
+        # Index: (segment, offset, length) of each block by height, and height by hash
+        self.base_height: Optional[int] = None
+        self.positions: List[Tuple[int, int, int]] = []
+        self.heights_by_hash: Dict[bytes, int] = {}
+
+        self.unsynced = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_segments(verify)
+
+        if not self.segments:
+            self._open_segment(1)
+
+    def __len__(self) -> int:
+        """Get the number of stored blocks."""
+        return len(self.positions)
+
+    def __enter__(self) -> 'BlockStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def get_tip_height(self) -> Optional[int]:
+        """
+        Get the height of the last stored block.
+
+        Returns:
+            Block height, or None if the store is empty
+        """
+        if not self.positions:
+            return None
+
+        return self.base_height + len(self.positions) - 1
+
+    def append(self, block: Block) -> bool:
+        """
+        Append a block.
+
+        Blocks must be appended in height order without gaps; the first block
+        may have any height.
+
+        Args:
+            block: Block to append
+
+        Returns:
+            True if the block was appended, False if its height is not the
+            next one or it is already stored
+        """
+        height = block.header.height
+        block_hash = block.get_hash()
+
+        if self.positions and height != self.base_height + len(self.positions):
+            return False
+
+        if block_hash in self.heights_by_hash:
+            return False
+
+        data = block.serialize()
+
+        if self.segment_sizes[self.active_segment] >= self.segment_size:
+            self._seal_active_segment()
+            self._open_segment(self.active_segment + 1)
+
+        segment = self.active_segment
+        offset = self.segment_sizes[segment]
+        handle = self.segments[segment]
+        handle.write(RECORD_HEADER.pack(len(data), height, block_hash, zlib.crc32(data)))
+        handle.write(data)
+        self.segment_sizes[segment] = offset + RECORD_HEADER.size + len(data)
+
+        if self.base_height is None:
+            self.base_height = height
+
+        self.positions.append((segment, offset + RECORD_HEADER.size, len(data)))
+        self.heights_by_hash[block_hash] = height
+
+        self.unsynced += 1
+        if self.unsynced >= self.sync_interval:
+            self.sync()
+
+        return True
+
+    def get_block_bytes(self, height: int) -> Optional[bytes]:
+        """
+        Get the encoded block at a height.
+
+        Args:
+            height: Block height
+
+        Returns:
+            Encoded block, or None if there is no block at that height
+        """
+        if self.base_height is None:
+            return None
+
+        index = height - self.base_height
+        if not 0 <= index < len(self.positions):
+            return None
+
+        segment, offset, length = self.positions[index]
+        return self._map(segment, offset + length)[offset:offset + length]
+
+    def get_block(self, height: int) -> Optional[Block]:
+        """
+        Get the block at a height.
+
+        Args:
+            height: Block height
+
+        Returns:
+            Block instance, or None if there is no block at that height
+        """
+        data = self.get_block_bytes(height)
+        return Block.deserialize(data) if data is not None else None
+
+    def get_height(self, block_hash: bytes) -> Optional[int]:
+        """
+        Get the height of a block by hash.
+
+        Args:
+            block_hash: Block hash
+
+        Returns:
+            Block height, or None if the block is not stored
+        """
+        return self.heights_by_hash.get(block_hash)
+
+    def has_block(self, block_hash: bytes) -> bool:
+        """
+        Check whether a block is stored.
+
+        Args:
+            block_hash: Block hash
+
+        Returns:
+            True if the block is stored, False otherwise
+        """
+        return block_hash in self.heights_by_hash
+
+    def get_block_by_hash(self, block_hash: bytes) -> Optional[Block]:
+        """
+        Get a block by hash.
+
+        Args:
+            block_hash: Block hash
+
+        Returns:
+            Block instance, or None if the block is not stored
+        """
+        height = self.heights_by_hash.get(block_hash)
+        return self.get_block(height) if height is not None else None
+
+    def get_range_bytes(self, start_height: int, count: int, max_bytes: int = None) -> List[bytes]:
+        """
+        Get consecutive encoded blocks, for streaming them to peers.
+
+        Args:
+            start_height: Height of the first block
+            count: Maximum number of blocks
+            max_bytes: Maximum total size in bytes (at least one block is
+                returned if available; unbounded if None)
+
+        Returns:
+            List of encoded blocks in height order
+        """
+        if self.base_height is None or count <= 0:
+            return []
+
+        start = max(start_height - self.base_height, 0)
+        end = min(start + count, len(self.positions))
+
+        blocks = []
+        total = 0
+        for segment, offset, length in self.positions[start:end]:
+            if max_bytes is not None and blocks and total + length > max_bytes:
+                break
+
+            blocks.append(self._map(segment, offset + length)[offset:offset + length])
+            total += length
+
+        return blocks
+
+    def get_range(self, start_height: int, count: int) -> List[Block]:
+        """
+        Get consecutive blocks.
+
+        Args:
+            start_height: Height of the first block
+            count: Maximum number of blocks
+
+        Returns:
+            List of Block instances in height order
+        """
+        return [Block.deserialize(data) for data in self.get_range_bytes(start_height, count)]
+
+    def sync(self) -> None:
+        """Flush the active segment and fsync it to disk."""
+        handle = self.segments[self.active_segment]
+        handle.flush()
+        os.fsync(handle.fileno())
+        self.unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close all segment files and memory maps."""
+        if not self.segments:
+            return
+
+        self.sync()
+
+        for memory_map in self.maps.values():
+            memory_map.close()
+
+        for handle in self.segments.values():
+            handle.close()
+
+        self.maps = {}
+        self.segments = {}
+
+    def _segment_path(self, segment: int) -> str:
+        """Get the path of a segment file."""
+        return os.path.join(self.directory, f"blocks-{segment:08d}.dat")
+
+    def _open_segment(self, segment: int) -> None:
+        """
+        Start a new active segment.
+
+        Args:
+            segment: Segment ID
+        """
+        self.segments[segment] = open(self._segment_path(segment), "a+b")
+        self.segment_sizes[segment] = 0
+        self.active_segment = segment
+
+    def _seal_active_segment(self) -> None:
+        """Sync the active segment before a new one is started."""
+        self.sync()
+
+        # The map of a sealed segment must cover all of it
+        memory_map = self.maps.pop(self.active_segment, None)
+        if memory_map is not None:
+            memory_map.close()
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """
+        Get the memory map of a segment covering the bytes up to an offset.
+
+        The active segment is flushed and remapped when it grew past its map.
+
+        Args:
+            segment: Segment ID
+            end: Offset the map must cover
+
+        Returns:
+            Memory map of the segment
+        """
+        memory_map = self.maps.get(segment)
+        if memory_map is not None and len(memory_map) >= end:
+            return memory_map
+
+        handle = self.segments[segment]
+        handle.flush()
+
+        if memory_map is not None:
+            memory_map.close()
+
+        memory_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.maps[segment] = memory_map
+        return memory_map
+
+    def _load_segments(self, verify: bool) -> None:
+        """
+        Open the existing segment files and rebuild the indexes from them.
+
+        Args:
+            verify: Whether to check the CRC32 of the records of all segments
+
+        Raises:
+            ValueError: If a segment before the last one is corrupt
+        """
+        segment_ids = sorted(
+            int(name[len("blocks-"):-len(".dat")])
+            for name in os.listdir(self.directory)
+            if name.startswith("blocks-") and name.endswith(".dat")
+        )
+
+        for position, segment in enumerate(segment_ids):
+            handle = open(self._segment_path(segment), "a+b")
+            size = os.fstat(handle.fileno()).st_size
+
+            self.segments[segment] = handle
+            self.segment_sizes[segment] = size
+            self.active_segment = segment
+
+            is_last = position == len(segment_ids) - 1
+            valid_size = self._scan_segment(segment, size, verify or is_last)
+
+            if valid_size != size and not is_last:
+                # Sealed segments are only corrupted by damage, not by a
+                # crash; keep the files for inspection rather than dropping
+                # the valid blocks of the later segments
+                self.close()
+                raise ValueError(f"Corrupt record in block store segment {segment} at offset {valid_size}")
+
+            if valid_size != size:
+                # A torn or corrupt tail of the last segment: drop it
+                logger.warning(f"Truncating block store segment {segment} at offset {valid_size}")
+
+                memory_map = self.maps.pop(segment, None)
+                if memory_map is not None:
+                    memory_map.close()
+
+                handle.truncate(valid_size)
+                handle.flush()
+                os.fsync(handle.fileno())
+                self.segment_sizes[segment] = valid_size
+
+    def _scan_segment(self, segment: int, size: int, check_crc: bool) -> int:
+        """
+        Index the records of a segment.
+
+        Args:
+            segment: Segment ID
+            size: Size of the segment file
+            check_crc: Whether to check the CRC32 of each record
+
+        Returns:
+            Size of the valid prefix of the segment
+        """
+        if size == 0:
+            return 0
+
+        data = self._map(segment, size)
+        offset = 0
+
+        while offset + RECORD_HEADER.size <= size:
+            length, height, block_hash, crc = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + length
+
+            if end > size:
+                break
+
+            if self.positions and height != self.base_height + len(self.positions):
+                break
+
+            if check_crc and zlib.crc32(data[start:end]) != crc:
+                break
+
+            if self.base_height is None:
+                self.base_height = height
+
+            self.positions.append((segment, start, length))
+            self.heights_by_hash[block_hash] = height
+            offset = end
+
+        return offset
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from implementation.core.blockchain.block import GenesisBlock, BlockBuilder
+
+    with tempfile.TemporaryDirectory() as directory:
+        with BlockStore(directory) as store:
+            block = GenesisBlock.create()
+            store.append(block)
+
+            for i in range(1000):
+                builder = BlockBuilder(block, "validator_1", "cluster_1")
+                builder.add_transaction({"type": "transfer", "amount": i})
+                block = builder.finalize()
+                store.append(block)
+
+            print(f"Stored blocks: {len(store)}, tip height: {store.get_tip_height()}")
+
+        # Reopen and stream the chain
+        with BlockStore(directory) as store:
+            start = time.time()
+            blocks = store.get_range_bytes(0, len(store))
+            print(f"Streamed {len(blocks)} blocks in {time.time() - start:.4f}s")
+            print(f"Block 500 by hash: {store.get_block_by_hash(store.get_block(500).get_hash()).header.height}")
@@ -0,0 +1,315 @@
+"""
+Block Template Module for Synergy Network
+
+This module implements the block template, the set of pending transactions a
+block producer would include in its next block. Transactions are queued per
+sender in nonce order, and the template is filled by merging the senders'
+queues by fee: a sender's next transaction only becomes a candidate once all
+of its lower nonces are included, so no transaction is packed before its
+predecessors.
+
+The template follows the transaction pool: transactions arriving with the
+next nonce of their sender are appended while the template has room, and the
+template is only re-merged when a better candidate is left out or an
+included transaction leaves the pool.
+"""
+
+import heapq
+from typing import Dict, List, Any, Optional, Callable, Tuple
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.core.encoding.codec import encode_block_entry
+from implementation.core.transaction.transaction import Transaction, TransactionType, TransactionPool
+
+# Default limits of a block template
+DEFAULT_MAX_TRANSACTIONS = 1000
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+class BlockTemplate:
+    """Class maintaining a fee-ordered, nonce-valid selection of pending transactions."""
+
+    def __init__(
+        self,
+        nonce_provider: Callable[[str], int],
+        pool: TransactionPool = None,
+        max_transactions: int = DEFAULT_MAX_TRANSACTIONS,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Initialize a BlockTemplate instance.
+
+        Args:
+            nonce_provider: Function mapping a sender address to the nonce of
+                its last applied transaction, e.g. StateManager.get_nonce
+            pool: TransactionPool to follow (its pending transactions are
+                loaded and later changes are applied to the template)
+            max_transactions: Maximum number of transactions in the template
+            max_bytes: Maximum total encoded size of the transactions
+        """
+        self.nonce_provider = nonce_provider
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+
+        # Sender -> nonce -> transaction, and encoded size by transaction ID
+        self.queues: Dict[str, Dict[int, Transaction]] = {}
+        self.sizes: Dict[str, int] = {}
+
+        # Sender -> next nonce the state expects, cached from the nonce provider
+        self.base_nonces: Dict[str, int] = {}
+
+        # Current template
+        self.transactions: List[Transaction] = []
+        self.included: Dict[str, int] = {}  # sender -> next nonce after its included transactions
+        self.total_size = 0
+        self.total_fees = 0
+        self.min_fee: Optional[int] = None
+        self.dirty = False
+
+        if pool is not None:
+            for transaction in pool.pending_transactions.values():
+                self.add_transaction(transaction)
+            pool.add_listener(self.on_pool_event)
+
+    def add_transaction(self, transaction: Transaction) -> bool:
+        """
+        Add a pending transaction.
+
+        A transaction with the next nonce of its sender is appended to the
+        template if it fits, together with the sender's queued transactions
+        that follow it.
+
+        Args:
+            transaction: Pending transaction
+
+        Returns:
+            True if transaction was queued, False if it cannot be included
+            (coinbase, stale nonce, or a transaction with its nonce and an
+            equal or higher fee is queued)
+        """
+        sender = transaction.from_address
+        if transaction.tx_type == TransactionType.COINBASE or sender is None:
+            return False
+
+        if transaction.nonce < self._base_nonce(sender):
+            return False
+
+        queue = self.queues.setdefault(sender, {})
+        replaced = queue.get(transaction.nonce)
+        if replaced is not None:
+            # Keep the higher-fee transaction of a nonce
+            if transaction.fee <= replaced.fee:
+                return False
+
+            del self.sizes[replaced.tx_id]
+            if transaction.nonce < self.included.get(sender, 0):
+                self.dirty = True
+
+        queue[transaction.nonce] = transaction
+        self.sizes[transaction.tx_id] = len(encode_block_entry(transaction))
+
+        if self.dirty:
+            return True
+
+        next_nonce = self.included.get(sender, self._base_nonce(sender))
+        if transaction.nonce != next_nonce:
+            # A gap remains; the transaction waits in its sender's queue
+            return True
+
+        while next_nonce in queue and self._fits(queue[next_nonce]):
+            self._include(queue[next_nonce])
+            next_nonce += 1
+
+        if next_nonce in queue and self.min_fee is not None and queue[next_nonce].fee > self.min_fee:
+            # A better candidate did not fit
+            self.dirty = True
+
+        return True
+
+    def remove_transaction(self, transaction: Transaction) -> bool:
+        """
+        Remove a transaction that left the pool (confirmed, rejected or removed).
+
+        The sender's nonce is reloaded from the nonce provider on next use,
+        so transactions confirmed by a block should be removed after the
+        block is applied to the state.
+
+        Args:
+            transaction: Transaction to remove
+
+        Returns:
+            True if transaction was removed, False if it was not queued
+        """
+        sender = transaction.from_address
+
+        # The state may have moved past the sender's queued transactions,
+        # even if this one was not queued (another had its nonce)
+        self.base_nonces.pop(sender, None)
+        if sender in self.included:
+            self.dirty = True
+
+        queue = self.queues.get(sender)
+        if queue is None or queue.get(transaction.nonce) is not transaction:
+            return False
+
+        del queue[transaction.nonce]
+        del self.sizes[transaction.tx_id]
+        if not queue:
+            del self.queues[sender]
+
+        return True
+
+    def on_pool_event(self, event: str, transaction: Transaction) -> None:
+        """
+        Apply a TransactionPool change (registered with TransactionPool.add_listener).
+
+        Args:
+            event: TransactionPool.ADDED or TransactionPool.REMOVED
+            transaction: Transaction added to or removed from the pending set
+        """
+        if event == TransactionPool.ADDED:
+            self.add_transaction(transaction)
+        elif event == TransactionPool.REMOVED:
+            self.remove_transaction(transaction)
+
+    def refresh_sender(self, sender: str) -> None:
+        """
+        Reload a sender's nonce after the state changed outside the pool.
+
+        Args:
+            sender: Sender address
+        """
+        self.base_nonces.pop(sender, None)
+        self.dirty = True
+
+    def get_transactions(self) -> List[Transaction]:
+        """
+        Get the transactions of the template, in block order.
+
+        Returns:
+            List of transactions
+        """
+        if self.dirty:
+            self._rebuild()
+
+        return list(self.transactions)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the template.
+
+        Returns:
+            Dictionary with statistics
+        """
+        if self.dirty:
+            self._rebuild()
+
+        return {
+            "transactions": len(self.transactions),
+            "size": self.total_size,
+            "fees": self.total_fees,
+            "queued": len(self.sizes),
+            "senders": len(self.queues)
+        }
+
+    def _base_nonce(self, sender: str) -> int:
+        """
+        Get the next nonce the state expects from a sender, dropping the
+        sender's queued transactions with lower nonces.
+
+        Args:
+            sender: Sender address
+
+        Returns:
+            Next nonce
+        """
+        base = self.base_nonces.get(sender)
+        if base is None:
+            base = self.nonce_provider(sender) + 1
+            self.base_nonces[sender] = base
+
+            queue = self.queues.get(sender)
+            if queue:
+                for nonce in [nonce for nonce in queue if nonce < base]:
+                    del self.sizes[queue.pop(nonce).tx_id]
+                if not queue:
+                    del self.queues[sender]
+
+        return base
+
+    def _fits(self, transaction: Transaction) -> bool:
+        """Check whether a transaction fits in the template's limits."""
+        return (
+            len(self.transactions) < self.max_transactions
+            and self.total_size + self.sizes[transaction.tx_id] <= self.max_bytes
+        )
+
+    def _include(self, transaction: Transaction) -> None:
+        """Append a transaction to the template."""
+        self.transactions.append(transaction)
+        self.included[transaction.from_address] = transaction.nonce + 1
+        self.total_size += self.sizes[transaction.tx_id]
+        self.total_fees += transaction.fee
+
+        if self.min_fee is None or transaction.fee < self.min_fee:
+            self.min_fee = transaction.fee
+
+    def _rebuild(self) -> None:
+        """Refill the template by merging the senders' queues by fee."""
+        self.transactions = []
+        self.included = {}
+        self.total_size = 0
+        self.total_fees = 0
+        self.min_fee = None
+        self.dirty = False
+
+        # Candidate heap of each sender's next transaction: highest fee first,
+        # then oldest
+        heap: List[Tuple[int, int, str, str, int]] = []
+        for sender in list(self.queues):
+            nonce = self._base_nonce(sender)
+            transaction = self.queues.get(sender, {}).get(nonce)
+            if transaction is not None:
+                heap.append((-transaction.fee, transaction.timestamp, transaction.tx_id, sender, nonce))
+        heapq.heapify(heap)
+
+        while heap and len(self.transactions) < self.max_transactions:
+            _, _, _, sender, nonce = heapq.heappop(heap)
+            queue = self.queues[sender]
+            transaction = queue[nonce]
+
+            if not self._fits(transaction):
+                # The sender's later transactions cannot be included without it
+                continue
+
+            self._include(transaction)
+
+            following = queue.get(nonce + 1)
+            if following is not None:
+                heapq.heappush(heap, (-following.fee, following.timestamp, following.tx_id, sender, nonce + 1))
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    nonces = {"sYnQsyn1alice": 0, "sYnQsyn1bob": 4}
+    pool = TransactionPool()
+    template = BlockTemplate(lambda address: nonces.get(address, 0), pool=pool, max_transactions=4)
+
+    # Bob's high-fee transaction has a future nonce until nonce 5 arrives
+    for sender, nonce, fee in [("sYnQsyn1alice", 1, 5), ("sYnQsyn1bob", 6, 50), ("sYnQsyn1alice", 2, 1), ("sYnQsyn1bob", 5, 2)]:
+        pool.add_transaction(Transaction(
+            tx_type=TransactionType.TRANSFER,
+            from_address=sender,
+            to_address="sYnQsyn1carol",
+            amount=10,
+            fee=fee,
+            nonce=nonce
+        ))
+        print(f"Template: {[(tx.from_address[-5:], tx.nonce, tx.fee) for tx in template.get_transactions()]}")
+
+    start = time.perf_counter()
+    transactions = template.get_transactions()
+    print(f"Template ready in {(time.perf_counter() - start) * 1e6:.1f} us: {template.get_stats()}")
@@ -0,0 +1,357 @@
+"""
+Validation Module for Synergy Network
+
+This module implements the pipelined block validator used to sync ranges of
+blocks. Validation runs in three stages:
+
+1. Header checks (linkage to the previous header and difficulty) run first,
+   serially, for the whole range; they are cheap and cut the range at the
+   first invalid header.
+2. Body checks (Merkle root and the Dilithium signature of every transaction)
+   run across a worker pool, on the blocks' binary encodings.
+3. State application runs in block order in the calling process, each block
+   as soon as its body checks are done, while later bodies are still being
+   checked.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+from implementation.cryptography.pqc.dilithium import DilithiumSigner
+from implementation.core.encoding.codec import split_block, decode_block_entry
+from implementation.core.transaction.transaction import Transaction, TransactionType
+from implementation.core.state.state import ReceiptStatus
+from implementation.core.blockchain.block import Block, BlockHeader
+
+def check_difficulty(block_hash: bytes, difficulty: int) -> bool:
+    """
+    Check that a block hash meets a difficulty (leading zero bytes), as Block.verify does.
+
+    Args:
+        block_hash: Block hash
+        difficulty: Required number of leading zero bytes
+
+    Returns:
+        True if the hash meets the difficulty, False otherwise
+    """
+    leading_zeros = len(block_hash) - len(block_hash.lstrip(b"\x00"))
+    return leading_zeros >= difficulty
+
+def verify_block_body(job: Tuple[bytes, List[Optional[bytes]]]) -> Optional[str]:
+    """
+    Check the Merkle root and transaction signatures of an encoded block.
+
+    Runs in the worker processes.
+
+    Args:
+        job: Tuple of (encoded block, public key per transaction or None to
+            skip the transaction's signature check)
+
+    Returns:
+        Error message, or None if the body is valid
+    """
+    data, public_keys = job
+    header, entries = split_block(data)
+
+    merkle_root = HashFunctions.merkle_root_batched(HashFunctions.hash_many(entries))
+    if merkle_root != header["merkle_root"]:
+        return "Merkle root mismatch"
+
+    messages = []
+    signatures = []
+    keys = []
+    indexes = []
+
+    for index, (entry, public_key) in enumerate(zip(entries, public_keys)):
+        if public_key is None:
+            continue
+
+        tx = Transaction.from_dict(decode_block_entry(entry))
+        if tx.signature is None:
+            return f"Transaction {index} is not signed"
+
+        messages.append(tx.get_hash())
+        signatures.append(tx.signature)
+        keys.append(public_key)
+        indexes.append(index)
+
+    for index, valid in zip(indexes, DilithiumSigner.batch_verify(messages, signatures, keys)):
+        if not valid:
+            return f"Invalid signature on transaction {index}"
+
+    return None
+
+class BlockValidator:
+    """Class validating and applying ranges of blocks with a parallel pipeline."""
+
+    def __init__(
+        self,
+        apply_block: Callable[[Block], List[Dict[str, Any]]] = None,
+        public_key_resolver: Callable[[str], Optional[bytes]] = None,
+        max_workers: int = None,
+        use_processes: bool = True,
+        window: int = None
+    ):
+        """
+        Initialize a BlockValidator instance.
+
+        Args:
+            apply_block: Function applying a block to the state and returning
+                its receipts, e.g. StateManager.apply_block or
+                ParallelBlockExecutor.apply_block (state is not applied if None)
+            public_key_resolver: Function mapping a sender address to its
+                public key, or None if unknown (signatures are not checked if
+                None). It is called before the blocks of the range are applied,
+                so it must not depend on them.
+            max_workers: Number of workers (defaults to the CPU count)
+            use_processes: Whether to check bodies in worker processes rather
+                than threads
+            window: Maximum number of blocks whose bodies are checked ahead of
+                state application (defaults to four per worker)
+        """
+        self.apply_block = apply_block
+        self.public_key_resolver = public_key_resolver
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.window = window or 4 * self.max_workers
+        self.executor: Optional[Executor] = None
+
+        # Statistics of the last validated range
+        self.stats = {"blocks": 0, "transactions": 0, "signatures": 0}
+
+    def validate_headers(self, blocks: List[Block], previous_header: BlockHeader = None) -> Tuple[int, Optional[str]]:
+        """
+        Check the linkage and difficulty of a range of block headers.
+
+        Args:
+            blocks: Blocks in height order
+            previous_header: Header of the block preceding the range (linkage
+                of the first block is not checked if None)
+
+        Returns:
+            Tuple of (number of leading blocks with valid headers, error
+            message of the first invalid header or None)
+        """
+        previous = previous_header
+
+        for index, block in enumerate(blocks):
+            header = block.header
+
+            if previous is not None:
+                if header.previous_hash != previous.get_hash():
+                    return index, f"Block {header.height} does not link to the previous block"
+                if header.height != previous.height + 1:
+                    return index, f"Block {header.height} does not follow height {previous.height}"
+
+            if not check_difficulty(header.get_hash(), header.difficulty):
+                return index, f"Block {header.height} does not meet its difficulty"
+
+            previous = header
+
+        return len(blocks), None
+
+    def validate_range(
+        self,
+        blocks: List[Union[Block, bytes]],
+        previous_header: BlockHeader = None
+    ) -> Dict[str, Any]:
+        """
+        Validate a range of blocks and apply them to the state in order.
+
+        Validation stops at the first invalid block; the blocks before it are
+        applied.
+
+        Args:
+            blocks: Blocks (Block instances or encoded blocks) in height order
+            previous_header: Header of the block preceding the range (linkage
+                of the first block is not checked if None)
+
+        Returns:
+            Dictionary with the number of "validated" blocks, the "error" of the
+            first invalid block (None if all are valid) and its "height"
+        """
+        encoded = [block if isinstance(block, (bytes, bytearray)) else None for block in blocks]
+        blocks = [Block.deserialize(block) if isinstance(block, (bytes, bytearray)) else block for block in blocks]
+
+        self.stats = {"blocks": 0, "transactions": 0, "signatures": 0}
+
+        # Stage 1: headers
+        valid_count, error = self.validate_headers(blocks, previous_header)
+        result = {"validated": 0, "error": error, "height": blocks[valid_count].header.height if error else None}
+
+        # Stage 2: bodies, checked ahead of stage 3 within the window
+        pending = deque()
+        next_index = 0
+
+        try:
+            for index in range(valid_count):
+                while next_index < valid_count and len(pending) < self.window:
+                    pending.append(self._submit(blocks[next_index], encoded[next_index]))
+                    next_index += 1
+
+                body_error = self._result(pending.popleft())
+                block = blocks[index]
+
+                if body_error is None:
+                    # Stage 3: state, in order
+                    body_error = self._apply(block)
+
+                if body_error is not None:
+                    result.update(error=f"Block {block.header.height}: {body_error}", height=block.header.height)
+                    break
+
+                result["validated"] += 1
+                self.stats["blocks"] += 1
+                self.stats["transactions"] += len(block.transactions)
+        finally:
+            for future in pending:
+                if not isinstance(future, str) and future is not None:
+                    future.cancel()
+
+        return result
+
+    def start(self) -> None:
+        """Start the worker pool (it is otherwise started by the first range)."""
+        if self.executor is None and self.max_workers > 1:
+            pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self.executor = pool_class(max_workers=self.max_workers)
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self) -> 'BlockValidator':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _public_keys(self, block: Block) -> List[Optional[bytes]]:
+        """
+        Resolve the public keys to check the transaction signatures of a block with.
+
+        Coinbase transactions and entries that are not transactions are not
+        checked.
+
+        Args:
+            block: Block
+
+        Returns:
+            Public key (or None to skip the check) per transaction
+
+        Raises:
+            ValueError: If the key of a sender cannot be resolved
+        """
+        if self.public_key_resolver is None:
+            return [None] * len(block.transactions)
+
+        keys = []
+        for index, tx in enumerate(block.transactions):
+            if isinstance(tx, dict):
+                tx_type = tx.get("tx_type")
+                sender = tx.get("from_address")
+            else:
+                tx_type = tx.tx_type
+                sender = tx.from_address
+
+            if tx_type is None or tx_type == TransactionType.COINBASE:
+                keys.append(None)
+                continue
+
+            public_key = self.public_key_resolver(sender)
+            if public_key is None:
+                raise ValueError(f"Unknown public key for the sender of transaction {index}")
+
+            keys.append(public_key)
+            self.stats["signatures"] += 1
+
+        return keys
+
+    def _submit(self, block: Block, data: Optional[bytes]) -> Any:
+        """
+        Submit the body checks of a block.
+
+        Args:
+            block: Block
+            data: Encoded block, if already available
+
+        Returns:
+            Future of the error message, or the error message itself
+        """
+        try:
+            job = (data if data is not None else block.serialize(), self._public_keys(block))
+        except ValueError as e:
+            return str(e)
+
+        if self.max_workers <= 1:
+            return verify_block_body(job)
+
+        self.start()
+        return self.executor.submit(verify_block_body, job)
+
+    def _result(self, pending: Any) -> Optional[str]:
+        """Wait for the body checks of a block."""
+        if pending is None or isinstance(pending, str):
+            return pending
+
+        return pending.result()
+
+    def _apply(self, block: Block) -> Optional[str]:
+        """
+        Apply a block to the state.
+
+        Args:
+            block: Block with valid header and body
+
+        Returns:
+            Error message, or None if all transactions were applied
+        """
+        if self.apply_block is None:
+            return None
+
+        for receipt in self.apply_block(block):
+            if receipt["status"] != ReceiptStatus.APPLIED:
+                return f"Transaction {receipt['index']} failed: {receipt.get('error')}"
+
+        return None
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from implementation.core.blockchain.block import GenesisBlock
+
+    # Mine a short chain at difficulty 1
+    chain = []
+    genesis = GenesisBlock.create()
+    previous = genesis
+
+    for height in range(1, 201):
+        block = Block(header=BlockHeader(
+            previous_hash=previous.get_hash(),
+            height=height,
+            difficulty=1
+        ))
+        for i in range(20):
+            block.add_transaction({"type": "transfer", "height": height, "index": i})
+
+        nonce = 0
+        while not check_difficulty(block.get_hash(), 1):
+            nonce += 1
+            block.header.nonce = nonce.to_bytes(32, "big")
+
+        chain.append(block)
+        previous = block
+
+    with BlockValidator(max_workers=4) as validator:
+        start = time.time()
+        result = validator.validate_range([block.serialize() for block in chain], genesis.header)
+        print(f"Result: {result} in {time.time() - start:.3f}s")
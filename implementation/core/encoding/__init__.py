@@ -0,0 +1,29 @@
+"""
+Encoding Module for Synergy Network
+
+This package contains the canonical binary encoding used for hashing, signing
+and transferring transactions, block headers and blocks.
+"""
+
+from .codec import (
+    CODEC_VERSION, CodecError, encode_value, decode_value, encode_transaction, decode_transaction,
+    encode_header, decode_header, encode_block_entry, decode_block_entry, encode_block, decode_block,
+    split_block, to_json
+)
+
+__all__ = [
+    'CODEC_VERSION',
+    'CodecError',
+    'encode_value',
+    'decode_value',
+    'encode_transaction',
+    'decode_transaction',
+    'encode_header',
+    'decode_header',
+    'encode_block_entry',
+    'decode_block_entry',
+    'encode_block',
+    'decode_block',
+    'split_block',
+    'to_json'
+]
@@ -0,0 +1,794 @@
+"""
+Codec Module for Synergy Network
+
+This module implements the canonical binary encoding of transactions, block
+headers and blocks. The encoding is deterministic, so it is used both for
+hashing and signing and as the wire and storage format; JSON is only kept as
+a debug view.
+
+Every encoded object starts with the codec version byte. Integers are
+zigzag-encoded LEB128 varints of at most MAX_VARINT_BYTES bytes, strings are UTF-8 and, like byte strings, are
+prefixed with their varint length. Fields of unfixed shape (transaction data,
+Synergy Points) use a tagged value encoding whose dictionaries are sorted by
+key, so equal values always encode to equal bytes.
+
+Transaction layout:
+    version | tx_type | tx_id | from_address? | to_address? | amount | fee |
+    nonce | timestamp | data | signature?
+
+Block header layout:
+    version | header version | previous_hash | merkle_root | timestamp |
+    height | validator_signature? | validator_cluster_id? | synergy_points |
+    difficulty | nonce | state_root
+
+Block layout:
+    version | header length | header | transaction count |
+    (entry length | entry)*
+
+A block entry is a kind byte followed by either a transaction (for entries in
+the Transaction dictionary form) or a tagged value. Optional fields (?) are
+prefixed with a presence byte; the signatures are left out when encoding for
+hashing.
+"""
+
+import json
+import struct
+from typing import Dict, List, Any, Optional, Tuple
+
+# Version of the binary encoding
+CODEC_VERSION = 1
+
+# Tags of the value encoding
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_BYTES = 6
+TAG_LIST = 7
+TAG_DICT = 8
+
+# Kinds of block entries
+ENTRY_VALUE = 0
+ENTRY_TRANSACTION = 1
+
+# Fields of the Transaction dictionary form
+TRANSACTION_FIELDS = frozenset([
+    "tx_id", "tx_type", "from_address", "to_address", "amount", "fee",
+    "nonce", "data", "timestamp", "signature"
+])
+
+DOUBLE = struct.Struct(">d")
+
+# Longest varint accepted (enough for any 64-bit value), which keeps decoding
+# linear in the size of the data
+MAX_VARINT_BYTES = 10
+
+class CodecError(Exception):
+    """Exception raised for malformed or unsupported encoded data."""
+    pass
+
+def write_varint(out: bytearray, value: int) -> None:
+    """
+    Append an unsigned LEB128 varint.
+
+    Args:
+        out: Output buffer
+        value: Non-negative integer below 2 ** (7 * MAX_VARINT_BYTES)
+
+    Raises:
+        CodecError: If the value needs more than MAX_VARINT_BYTES bytes
+    """
+    if value >> (7 * MAX_VARINT_BYTES):
+        raise CodecError(f"Integer too large to encode: {value}")
+
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def write_int(out: bytearray, value: int) -> None:
+    """
+    Append a signed integer as a zigzag varint.
+
+    Args:
+        out: Output buffer
+        value: Integer whose zigzag encoding fits in MAX_VARINT_BYTES bytes
+
+    Raises:
+        CodecError: If the value is not an integer or is too large
+    """
+    if type(value) is not int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise CodecError(f"Expected an integer, got {type(value).__name__}")
+        value = int(value)
+
+    value = value << 1 if value >= 0 else ((-value) << 1) - 1
+    if value < 0x80:
+        out.append(value)
+    else:
+        write_varint(out, value)
+
+def write_str(out: bytearray, value: str) -> None:
+    """
+    Append a length-prefixed UTF-8 string.
+
+    Args:
+        out: Output buffer
+        value: String
+    """
+    if not isinstance(value, str):
+        raise CodecError(f"Expected a string, got {type(value).__name__}")
+
+    data = value.encode("utf-8")
+    write_varint(out, len(data))
+    out += data
+
+def write_bytes(out: bytearray, value: bytes) -> None:
+    """
+    Append a length-prefixed byte string.
+
+    Args:
+        out: Output buffer
+        value: Byte string
+    """
+    if not isinstance(value, (bytes, bytearray)):
+        raise CodecError(f"Expected bytes, got {type(value).__name__}")
+
+    write_varint(out, len(value))
+    out += value
+
+def write_optional_str(out: bytearray, value: Optional[str]) -> None:
+    """Append a presence byte and, if present, a string."""
+    if value is None:
+        out.append(0)
+    else:
+        out.append(1)
+        write_str(out, value)
+
+def write_optional_bytes(out: bytearray, value: Optional[bytes]) -> None:
+    """Append a presence byte and, if present, a byte string."""
+    if value is None:
+        out.append(0)
+    else:
+        out.append(1)
+        write_bytes(out, value)
+
+def write_value(out: bytearray, value: Any) -> None:
+    """
+    Append a tagged value (None, bool, int, float, str, bytes, list or dict).
+
+    Args:
+        out: Output buffer
+        value: Value; dictionary keys must be strings
+
+    Raises:
+        CodecError: If the value has an unsupported type
+    """
+    value_type = type(value)
+
+    if value is None:
+        out.append(TAG_NONE)
+    elif value_type is bool:
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif value_type is int:
+        out.append(TAG_INT)
+        write_int(out, value)
+    elif value_type is str:
+        out.append(TAG_STR)
+        write_str(out, value)
+    elif value_type is dict:
+        out.append(TAG_DICT)
+        write_varint(out, len(value))
+        for key in sorted(value):
+            write_str(out, key)
+            write_value(out, value[key])
+    elif value_type is list or value_type is tuple:
+        out.append(TAG_LIST)
+        write_varint(out, len(value))
+        for item in value:
+            write_value(out, item)
+    elif value_type is float:
+        out.append(TAG_FLOAT)
+        out += DOUBLE.pack(value)
+    elif value_type is bytes or value_type is bytearray:
+        out.append(TAG_BYTES)
+        write_bytes(out, value)
+    else:
+        raise CodecError(f"Unsupported value type: {value_type.__name__}")
+
+def _varint_at(data: bytes, position: int) -> Tuple[int, int]:
+    """
+    Read an unsigned LEB128 varint without bounds checking.
+
+    Args:
+        data: Encoded data
+        position: Offset of the varint
+
+    Returns:
+        Tuple of (value, offset after the varint)
+
+    Raises:
+        CodecError: If the varint is longer than MAX_VARINT_BYTES bytes
+    """
+    byte = data[position]
+    if byte < 0x80:
+        return byte, position + 1
+
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        position += 1
+        byte = data[position]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position + 1
+        shift += 7
+        if shift >= 7 * MAX_VARINT_BYTES:
+            raise CodecError("Varint too long")
+
+def _int_at(data: bytes, position: int) -> Tuple[int, int]:
+    """Read a zigzag-encoded signed integer without bounds checking."""
+    value, position = _varint_at(data, position)
+    return (value >> 1) ^ -(value & 1), position
+
+def _str_at(data: bytes, position: int) -> Tuple[str, int]:
+    """Read a length-prefixed UTF-8 string without bounds checking."""
+    length, position = _varint_at(data, position)
+    end = position + length
+    if end > len(data):
+        raise IndexError("string out of range")
+    return str(data[position:end], "utf-8"), end
+
+def _optional_str_at(data: bytes, position: int) -> Tuple[Optional[str], int]:
+    """Read an optional string without bounds checking."""
+    flag = data[position]
+    if flag == 0:
+        return None, position + 1
+    if flag != 1:
+        raise CodecError(f"Invalid presence flag: {flag}")
+    return _str_at(data, position + 1)
+
+class Decoder:
+    """Class reading encoded fields from a buffer."""
+
+    def __init__(self, data: bytes, position: int = 0, end: int = None):
+        """
+        Initialize a Decoder instance.
+
+        Args:
+            data: Encoded data
+            position: Offset of the first field
+            end: Offset after the last byte to read (end of data if None)
+        """
+        self.data = data
+        self.position = position
+        self.end = len(data) if end is None else end
+
+    def read_byte(self) -> int:
+        """Read a single byte."""
+        if self.position >= self.end:
+            raise CodecError("Unexpected end of data")
+
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def read_varint(self) -> int:
+        """Read an unsigned LEB128 varint."""
+        try:
+            value, position = _varint_at(self.data, self.position)
+        except IndexError:
+            raise CodecError("Unexpected end of data")
+
+        if position > self.end:
+            raise CodecError("Unexpected end of data")
+
+        self.position = position
+        return value
+
+    def read_int(self) -> int:
+        """Read a zigzag-encoded signed integer."""
+        value = self.read_varint()
+        return (value >> 1) ^ -(value & 1)
+
+    def read_raw(self, length: int) -> bytes:
+        """Read a number of raw bytes."""
+        start = self.position
+        end = start + length
+        if end > self.end:
+            raise CodecError("Unexpected end of data")
+
+        self.position = end
+        return bytes(self.data[start:end])
+
+    def read_bytes(self) -> bytes:
+        """Read a length-prefixed byte string."""
+        return self.read_raw(self.read_varint())
+
+    def read_str(self) -> str:
+        """Read a length-prefixed UTF-8 string."""
+        try:
+            return self.read_bytes().decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CodecError(f"Invalid UTF-8 string: {e}")
+
+    def read_optional_str(self) -> Optional[str]:
+        """Read a presence byte and, if present, a string."""
+        return self.read_str() if self._read_presence() else None
+
+    def read_optional_bytes(self) -> Optional[bytes]:
+        """Read a presence byte and, if present, a byte string."""
+        return self.read_bytes() if self._read_presence() else None
+
+    def read_value(self) -> Any:
+        """
+        Read a tagged value.
+
+        Returns:
+            Decoded value
+
+        Raises:
+            CodecError: If the data is malformed or not canonical
+        """
+        tag = self.read_byte()
+
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_FALSE:
+            return False
+        if tag == TAG_TRUE:
+            return True
+        if tag == TAG_INT:
+            return self.read_int()
+        if tag == TAG_STR:
+            return self.read_str()
+        if tag == TAG_DICT:
+            result = {}
+            previous = None
+            for _ in range(self.read_varint()):
+                key = self.read_str()
+                if previous is not None and key <= previous:
+                    raise CodecError("Dictionary keys are not in canonical order")
+                result[key] = self.read_value()
+                previous = key
+            return result
+        if tag == TAG_LIST:
+            return [self.read_value() for _ in range(self.read_varint())]
+        if tag == TAG_FLOAT:
+            return DOUBLE.unpack(self.read_raw(DOUBLE.size))[0]
+        if tag == TAG_BYTES:
+            return self.read_bytes()
+
+        raise CodecError(f"Unknown value tag: {tag}")
+
+    def read_version(self) -> None:
+        """Read and check the codec version byte."""
+        version = self.read_byte()
+        if version != CODEC_VERSION:
+            raise CodecError(f"Unsupported codec version: {version}")
+
+    def finish(self) -> None:
+        """Check that all data was consumed."""
+        if self.position != self.end:
+            raise CodecError(f"{self.end - self.position} trailing bytes")
+
+    def _read_presence(self) -> bool:
+        """Read the presence byte of an optional field."""
+        flag = self.read_byte()
+        if flag > 1:
+            raise CodecError(f"Invalid presence flag: {flag}")
+        return flag == 1
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encode a value canonically.
+
+    Args:
+        value: Value (None, bool, int, float, str, bytes, list or dict)
+
+    Returns:
+        Encoded value, prefixed with the codec version
+    """
+    out = bytearray((CODEC_VERSION,))
+    write_value(out, value)
+    return bytes(out)
+
+def decode_value(data: bytes) -> Any:
+    """
+    Decode a value encoded with encode_value.
+
+    Args:
+        data: Encoded value
+
+    Returns:
+        Decoded value
+    """
+    decoder = Decoder(data)
+    decoder.read_version()
+    value = decoder.read_value()
+    decoder.finish()
+    return value
+
+def write_transaction(out: bytearray, tx, include_signature: bool = True) -> None:
+    """
+    Append the fields of a transaction.
+
+    Args:
+        out: Output buffer
+        tx: Transaction instance
+        include_signature: Whether to include the signature (False for hashing)
+    """
+    write_str(out, tx.tx_type)
+    write_str(out, tx.tx_id)
+    write_optional_str(out, tx.from_address)
+    write_optional_str(out, tx.to_address)
+    write_int(out, tx.amount)
+    write_int(out, tx.fee)
+    write_int(out, tx.nonce)
+    write_int(out, tx.timestamp)
+    write_value(out, tx.data)
+
+    if include_signature:
+        write_optional_bytes(out, tx.signature)
+
+def read_transaction(decoder: Decoder) -> Dict[str, Any]:
+    """
+    Read the fields of a transaction.
+
+    Args:
+        decoder: Decoder positioned at the transaction fields
+
+    Returns:
+        Dictionary of Transaction constructor arguments
+    """
+    # The fixed fields are read inline, as this runs for every transaction
+    data = decoder.data
+    try:
+        tx_type, position = _str_at(data, decoder.position)
+        tx_id, position = _str_at(data, position)
+        from_address, position = _optional_str_at(data, position)
+        to_address, position = _optional_str_at(data, position)
+        amount, position = _int_at(data, position)
+        fee, position = _int_at(data, position)
+        nonce, position = _int_at(data, position)
+        timestamp, position = _int_at(data, position)
+    except IndexError:
+        raise CodecError("Unexpected end of data")
+    except UnicodeDecodeError as e:
+        raise CodecError(f"Invalid UTF-8 string: {e}")
+
+    if position > decoder.end:
+        raise CodecError("Unexpected end of data")
+    decoder.position = position
+
+    return {
+        "tx_type": tx_type,
+        "tx_id": tx_id,
+        "from_address": from_address,
+        "to_address": to_address,
+        "amount": amount,
+        "fee": fee,
+        "nonce": nonce,
+        "timestamp": timestamp,
+        "data": decoder.read_value(),
+        "signature": decoder.read_optional_bytes()
+    }
+
+def encode_transaction(tx, include_signature: bool = True) -> bytes:
+    """
+    Encode a transaction.
+
+    Args:
+        tx: Transaction instance
+        include_signature: Whether to include the signature (False for hashing)
+
+    Returns:
+        Encoded transaction
+    """
+    out = bytearray((CODEC_VERSION,))
+    write_transaction(out, tx, include_signature)
+    return bytes(out)
+
+def decode_transaction(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a transaction encoded with encode_transaction.
+
+    Args:
+        data: Encoded transaction
+
+    Returns:
+        Dictionary of Transaction constructor arguments
+    """
+    decoder = Decoder(data)
+    decoder.read_version()
+    fields = read_transaction(decoder)
+    decoder.finish()
+    return fields
+
+def write_header(out: bytearray, header, include_signature: bool = True) -> None:
+    """
+    Append the fields of a block header.
+
+    Args:
+        out: Output buffer
+        header: BlockHeader instance
+        include_signature: Whether to include the validator signature (False
+            for hashing)
+    """
+    write_int(out, header.version)
+    write_bytes(out, header.previous_hash)
+    write_bytes(out, header.merkle_root)
+    write_int(out, header.timestamp)
+    write_int(out, header.height)
+
+    if include_signature:
+        write_optional_bytes(out, header.validator_signature)
+
+    write_optional_str(out, header.validator_cluster_id)
+    write_value(out, header.synergy_points)
+    write_int(out, header.difficulty)
+    write_bytes(out, header.nonce)
+    write_bytes(out, header.state_root)
+
+def read_header(decoder: Decoder) -> Dict[str, Any]:
+    """
+    Read the fields of a block header.
+
+    Args:
+        decoder: Decoder positioned at the header fields
+
+    Returns:
+        Dictionary of BlockHeader constructor arguments
+    """
+    return {
+        "version": decoder.read_int(),
+        "previous_hash": decoder.read_bytes(),
+        "merkle_root": decoder.read_bytes(),
+        "timestamp": decoder.read_int(),
+        "height": decoder.read_int(),
+        "validator_signature": decoder.read_optional_bytes(),
+        "validator_cluster_id": decoder.read_optional_str(),
+        "synergy_points": decoder.read_value(),
+        "difficulty": decoder.read_int(),
+        "nonce": decoder.read_bytes(),
+        "state_root": decoder.read_bytes()
+    }
+
+def encode_header(header, include_signature: bool = True) -> bytes:
+    """
+    Encode a block header.
+
+    Args:
+        header: BlockHeader instance
+        include_signature: Whether to include the validator signature (False
+            for hashing)
+
+    Returns:
+        Encoded block header
+    """
+    out = bytearray((CODEC_VERSION,))
+    write_header(out, header, include_signature)
+    return bytes(out)
+
+def decode_header(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a block header encoded with encode_header.
+
+    Args:
+        data: Encoded block header
+
+    Returns:
+        Dictionary of BlockHeader constructor arguments
+    """
+    decoder = Decoder(data)
+    decoder.read_version()
+    fields = read_header(decoder)
+    decoder.finish()
+    return fields
+
+class _TransactionFields:
+    """Attribute view of a transaction in the Transaction dictionary form."""
+
+    __slots__ = ("tx_id", "tx_type", "from_address", "to_address", "amount", "fee",
+                 "nonce", "data", "timestamp", "signature")
+
+    def __init__(self, tx: Dict[str, Any], signature: Optional[bytes]):
+        for field in self.__slots__:
+            setattr(self, field, tx[field])
+        self.signature = signature
+
+def _transaction_view(tx: Any) -> Optional[Any]:
+    """
+    Get a block entry as a transaction, if it can be encoded as one losslessly.
+
+    Args:
+        tx: Transaction instance or dictionary
+
+    Returns:
+        Object with Transaction attributes, or None to encode as a plain value
+    """
+    if not isinstance(tx, dict):
+        return tx if hasattr(tx, "tx_type") else None
+
+    if tx.keys() != TRANSACTION_FIELDS:
+        return None
+
+    for field in ("amount", "fee", "nonce", "timestamp"):
+        if type(tx[field]) is not int:
+            return None
+
+    if type(tx["tx_type"]) is not str or type(tx["tx_id"]) is not str:
+        return None
+
+    for field in ("from_address", "to_address"):
+        if tx[field] is not None and type(tx[field]) is not str:
+            return None
+
+    # The signature is hex in the dictionary form; keep it only if it
+    # converts back to the same string
+    signature = tx["signature"]
+    if signature is not None:
+        if type(signature) is not str:
+            return None
+        try:
+            raw = bytes.fromhex(signature)
+        except ValueError:
+            return None
+        if raw.hex() != signature:
+            return None
+        signature = raw
+
+    return _TransactionFields(tx, signature)
+
+def encode_block_entry(tx: Any) -> bytes:
+    """
+    Encode a transaction of a block.
+
+    Transactions in the Transaction dictionary form (or Transaction instances)
+    are encoded compactly; other entries are encoded as plain values. Entries
+    decode to dictionaries.
+
+    Args:
+        tx: Transaction instance or dictionary
+
+    Returns:
+        Encoded entry
+    """
+    out = bytearray()
+    view = _transaction_view(tx)
+
+    if view is not None:
+        out.append(ENTRY_TRANSACTION)
+        write_transaction(out, view)
+    else:
+        out.append(ENTRY_VALUE)
+        write_value(out, tx)
+
+    return bytes(out)
+
+def decode_block_entry(data: bytes) -> Dict[str, Any]:
+    """
+    Decode a transaction of a block encoded with encode_block_entry.
+
+    Args:
+        data: Encoded entry
+
+    Returns:
+        Transaction dictionary
+    """
+    decoder = Decoder(data)
+    entry = _read_block_entry(decoder)
+    decoder.finish()
+    return entry
+
+def _read_block_entry(decoder: Decoder) -> Any:
+    """Read a block entry up to the decoder's end."""
+    kind = decoder.read_byte()
+
+    if kind == ENTRY_VALUE:
+        return decoder.read_value()
+
+    if kind == ENTRY_TRANSACTION:
+        # The constructor arguments are the dictionary form, with a hex signature
+        fields = read_transaction(decoder)
+        if fields["signature"] is not None:
+            fields["signature"] = fields["signature"].hex()
+        return fields
+
+    raise CodecError(f"Unknown block entry kind: {kind}")
+
+def encode_block(header, entries: List[bytes]) -> bytes:
+    """
+    Encode a block from its header and encoded transactions.
+
+    Args:
+        header: BlockHeader instance
+        entries: Transactions encoded with encode_block_entry
+
+    Returns:
+        Encoded block
+    """
+    out = bytearray((CODEC_VERSION,))
+
+    header_data = bytearray()
+    write_header(header_data, header)
+    write_varint(out, len(header_data))
+    out += header_data
+
+    write_varint(out, len(entries))
+    for entry in entries:
+        write_varint(out, len(entry))
+        out += entry
+
+    return bytes(out)
+
+def split_block(data: bytes) -> Tuple[Dict[str, Any], List[bytes]]:
+    """
+    Split an encoded block into its header fields and encoded transactions.
+
+    The transactions are left encoded, so their Merkle leaves can be hashed
+    without decoding them.
+
+    Args:
+        data: Encoded block
+
+    Returns:
+        Tuple of (BlockHeader constructor arguments, encoded transactions)
+    """
+    decoder = Decoder(data)
+    decoder.read_version()
+
+    header_end = decoder.read_varint()
+    header_end += decoder.position
+    header_decoder = Decoder(data, decoder.position, header_end)
+    header = read_header(header_decoder)
+    header_decoder.finish()
+    decoder.position = header_end
+
+    entries = []
+    for _ in range(decoder.read_varint()):
+        entries.append(decoder.read_raw(decoder.read_varint()))
+
+    decoder.finish()
+    return header, entries
+
+def decode_block(data: bytes) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Decode a block encoded with encode_block.
+
+    Args:
+        data: Encoded block
+
+    Returns:
+        Tuple of (BlockHeader constructor arguments, transaction dictionaries)
+    """
+    header, entries = split_block(data)
+    return header, [decode_block_entry(entry) for entry in entries]
+
+def to_json(value: Any) -> str:
+    """
+    Render a value as indented JSON for debugging, with bytes shown as hex.
+
+    Args:
+        value: Value (typically a to_dict() result)
+
+    Returns:
+        JSON string
+    """
+    return json.dumps(
+        value,
+        sort_keys=True,
+        indent=2,
+        default=lambda item: item.hex() if isinstance(item, (bytes, bytearray)) else repr(item)
+    )
+
+# Example usage
+if __name__ == "__main__":
+    value = {"b": [1, -2, 3.5, None, True], "a": "text", "c": b"\x00\x01"}
+    data = encode_value(value)
+
+    print(f"Encoded value: {data.hex()}")
+    print(f"Round trip: {decode_value(data) == value}")
+    print(f"JSON size: {len(to_json(value))} bytes, binary size: {len(data)} bytes")
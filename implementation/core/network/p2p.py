@@ -6,7 +6,6 @@ for the Synergy Network blockchain.
 """
 
 import asyncio
-import json
 import time
 import uuid
 import socket
@@ -25,6 +24,29 @@ logger = logging.getLogger("synergy.network")
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
 from implementation.cryptography.pqc.hash import HashFunctions
 from implementation.cryptography.pqc.dilithium import DilithiumSigner
+from implementation.core.encoding.codec import CodecError, encode_value, decode_value, encode_block_entry, to_json
+from implementation.core.transaction.transaction import Transaction, TransactionPool
+from implementation.core.transaction.admission import TransactionAdmission
+from implementation.core.blockchain.block import Block
+from implementation.core.blockchain.store import BlockStore
+from implementation.core.blockchain.compact import CompactBlock
+
+# Limits of a blocks response to a syncing peer
+MAX_BLOCKS_PER_MESSAGE = 1000
+MAX_BLOCKS_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Largest message frame accepted from a peer (leaves room for the envelope of
+# a full blocks response); larger frames close the connection unread
+MAX_MESSAGE_BYTES = 2 * MAX_BLOCKS_MESSAGE_BYTES
+
+# Number of recently announced or received blocks kept to serve the missing
+# transactions of compact blocks, and of compact blocks awaiting transactions
+RECENT_BLOCKS_SIZE = 32
+PENDING_COMPACT_BLOCKS_SIZE = 16
+
+# Default cadence of the transaction expiry sweep, and age of expired transactions, in seconds
+DEFAULT_EXPIRY_INTERVAL = 30
+DEFAULT_TRANSACTION_MAX_AGE = 3600
 
 class MessageType:
     """Enumeration of message types in the Synergy Network P2P protocol."""
@@ -39,6 +61,9 @@ class MessageType:
     GET_BLOCK = "get_block"
     BLOCK = "block"
     NEW_BLOCK = "new_block"
+    COMPACT_BLOCK = "compact_block"
+    GET_BLOCK_TRANSACTIONS = "get_block_transactions"
+    BLOCK_TRANSACTIONS = "block_transactions"
     GET_TRANSACTIONS = "get_transactions"
     TRANSACTIONS = "transactions"
     NEW_TRANSACTION = "new_transaction"
@@ -202,12 +227,16 @@ class Message:
     
     def serialize(self) -> bytes:
         """
-        Serialize the message to bytes.
+        Serialize the message to its canonical binary encoding.
+        
+        Message data may hold raw bytes, such as serialized blocks.
         
         Returns:
             Serialized message
         """
-        return json.dumps(self.to_dict()).encode('utf-8')
+        msg_dict = self.to_dict()
+        msg_dict["signature"] = self.signature
+        return encode_value(msg_dict)
     
     @classmethod
     def deserialize(cls, data: bytes) -> 'Message':
@@ -219,9 +248,25 @@ class Message:
         
         Returns:
             Message instance
+        
+        Raises:
+            CodecError: If the data is not a valid encoded message
         """
-        msg_dict = json.loads(data.decode('utf-8'))
-        return cls.from_dict(msg_dict)
+        msg_dict = decode_value(data)
+        signature = msg_dict.pop("signature", None)
+        
+        message = cls.from_dict(msg_dict)
+        message.signature = signature
+        return message
+    
+    def to_json(self) -> str:
+        """
+        Render the message as JSON for debugging.
+        
+        Returns:
+            Indented JSON string
+        """
+        return to_json(self.to_dict())
     
     def get_hash(self) -> bytes:
         """
@@ -230,12 +275,11 @@ class Message:
         Returns:
             32-byte hash digest
         """
-        # Create a dictionary representation without the signature
+        # Hash the canonical encoding without the signature
         msg_dict = self.to_dict()
         msg_dict.pop("signature", None)
         
-        # Use the hash function from the cryptography package
-        return HashFunctions.sha3_256(json.dumps(msg_dict, sort_keys=True).encode('utf-8'))
+        return HashFunctions.sha3_256(encode_value(msg_dict))
     
     def sign(self, private_key: bytes) -> bool:
         """
@@ -318,8 +362,13 @@ class PeerConnection:
             # Serialize message
             data = message.serialize()
             
-            # Send message length as 4-byte header
+            # Peers drop the connection on frames they would not accept
             length = len(data)
+            if length > MAX_MESSAGE_BYTES:
+                logger.error(f"Not sending oversized {message.msg_type} message: {length} bytes")
+                return False
+            
+            # Send message length as 4-byte header
             self.writer.write(length.to_bytes(4, byteorder='big'))
             
             # Send message data
@@ -349,6 +398,14 @@ class PeerConnection:
             length_bytes = await self.reader.readexactly(4)
             length = int.from_bytes(length_bytes, byteorder='big')
             
+            if length > MAX_MESSAGE_BYTES:
+                logger.warning(
+                    f"Oversized message frame ({length} bytes) from "
+                    f"{self.peer_info.get_endpoint() if self.peer_info else 'unknown'}"
+                )
+                self.is_active = False
+                return None
+            
             # Read message data
             data = await self.reader.readexactly(length)
             
@@ -390,7 +447,12 @@ class Node:
         host: str = "0.0.0.0",
         port: int = 9090,
         is_validator: bool = False,
-        bootstrap_nodes: List[Tuple[str, int]] = None
+        bootstrap_nodes: List[Tuple[str, int]] = None,
+        block_store: BlockStore = None,
+        transaction_pool: TransactionPool = None,
+        transaction_admission: TransactionAdmission = None,
+        expiry_interval: float = DEFAULT_EXPIRY_INTERVAL,
+        transaction_max_age: int = DEFAULT_TRANSACTION_MAX_AGE
     ):
         """
         Initialize a Node instance.
@@ -403,6 +465,17 @@ class Node:
             port: Port to listen on
             is_validator: Whether this node is a validator
             bootstrap_nodes: List of (host, port) tuples for bootstrap nodes
+            block_store: BlockStore serving blocks to peers (none served if None)
+            transaction_pool: TransactionPool used to reconstruct compact
+                blocks and to admit relayed transactions to (all their
+                transactions are requested if None)
+            transaction_admission: TransactionAdmission checking relayed
+                transactions (defaults to stateless checks into the
+                transaction pool)
+            expiry_interval: Seconds between sweeps of expired transactions
+                from the transaction pool (no sweep if None)
+            transaction_max_age: Age in seconds after which pending
+                transactions expire
         """
         self.node_id = node_id or str(uuid.uuid4())
         self.private_key = private_key
@@ -411,6 +484,13 @@ class Node:
         self.port = port
         self.is_validator = is_validator
         self.bootstrap_nodes = bootstrap_nodes or []
+        self.block_store = block_store
+        self.transaction_pool = transaction_pool
+        self.transaction_admission = transaction_admission
+        if self.transaction_admission is None and transaction_pool is not None:
+            self.transaction_admission = TransactionAdmission(transaction_pool)
+        self.expiry_interval = expiry_interval
+        self.transaction_max_age = transaction_max_age
         
         # Node state
         self.peers: Dict[str, PeerInfo] = {}  # node_id -> PeerInfo
@@ -423,6 +503,11 @@ class Node:
         self.message_cache: Dict[str, int] = {}  # message_id -> timestamp
         self.message_cache_size = 1000
         
+        # Compact block relay state
+        self.recent_blocks: Dict[bytes, Block] = {}  # block hash -> Block
+        self.pending_compact_blocks: Dict[bytes, Tuple[CompactBlock, Message]] = {}  # block hash -> (compact block, message)
+        self.requested_blocks: Dict[bytes, str] = {}  # block hash -> node_id asked for the full block
+        
         # Validator-specific state
         self.validator_peers: Dict[str, PeerInfo] = {}  # node_id -> PeerInfo
         self.cluster_id = None
@@ -450,6 +535,8 @@ class Node:
         
         # Start maintenance tasks
         asyncio.create_task(self._maintenance_task())
+        if self.transaction_pool is not None and self.expiry_interval is not None:
+            asyncio.create_task(self._expiry_task())
         
         # Start server task
         asyncio.create_task(self._server_task())
@@ -723,6 +810,15 @@ class Node:
         elif message.msg_type == MessageType.NEW_BLOCK:
             await self._handle_new_block(message, connection)
         
+        elif message.msg_type == MessageType.COMPACT_BLOCK:
+            await self._handle_compact_block(message, connection)
+        
+        elif message.msg_type == MessageType.GET_BLOCK_TRANSACTIONS:
+            await self._handle_get_block_transactions(message, connection)
+        
+        elif message.msg_type == MessageType.BLOCK_TRANSACTIONS:
+            await self._handle_block_transactions(message, connection)
+        
         elif message.msg_type == MessageType.GET_TRANSACTIONS:
             await self._handle_get_transactions(message, connection)
         
@@ -856,15 +952,27 @@ class Node:
         """
         Handle a get_blocks message.
         
+        The request holds "start_height" and "count"; the response holds the
+        encoded blocks from the block store, up to the message limits.
+        
         Args:
             message: Get_blocks message
             connection: Connection the message was received on
         """
-        # This would be implemented with the blockchain module
-        # For now, just send an empty response
+        start_height = message.data.get("start_height", 0)
+        count = message.data.get("count", MAX_BLOCKS_PER_MESSAGE)
+        
+        blocks = []
+        if self.block_store is not None and isinstance(start_height, int) and isinstance(count, int):
+            blocks = self.block_store.get_range_bytes(
+                start_height,
+                min(count, MAX_BLOCKS_PER_MESSAGE),
+                max_bytes=MAX_BLOCKS_MESSAGE_BYTES
+            )
+        
         blocks_msg = Message(
             msg_type=MessageType.BLOCKS,
-            data={"blocks": []},
+            data={"start_height": start_height, "blocks": blocks},
             sender=self.node_id
         )
         
@@ -890,15 +998,37 @@ class Node:
         """
         Handle a get_block message.
         
+        The request holds either a "height" or a "hash" (hex); the response
+        holds the encoded block, or None if it is neither stored nor a recent
+        block.
+        
         Args:
             message: Get_block message
             connection: Connection the message was received on
         """
-        # This would be implemented with the blockchain module
-        # For now, just send an empty response
+        block = None
+        
+        if self.block_store is not None:
+            height = message.data.get("height")
+            block_hash = message.data.get("hash")
+            
+            if height is None and isinstance(block_hash, str):
+                try:
+                    height = self.block_store.get_height(bytes.fromhex(block_hash))
+                except ValueError:
+                    height = None
+            
+            if isinstance(height, int):
+                block = self.block_store.get_block_bytes(height)
+        
+        if block is None and isinstance(message.data.get("hash"), str):
+            recent = self._find_block(message.data["hash"])
+            if recent is not None:
+                block = recent.serialize()
+        
         block_msg = Message(
             msg_type=MessageType.BLOCK,
-            data={"block": None},
+            data={"block": block},
             sender=self.node_id
         )
         
@@ -911,32 +1041,333 @@ class Node:
         """
         Handle a block message.
         
+        A block requested because its compact form could not be completed is
+        accepted like a completed compact block; other blocks are left to the
+        handlers registered for block messages.
+        
         Args:
             message: Block message
             connection: Connection the message was received on
         """
-        # This would be implemented with the blockchain module
-        # For now, just log that a block was received
-        block = message.data.get("block")
-        if block:
-            logger.info(f"Received block from {connection.peer_info.node_id}")
+        data = message.data.get("block")
+        if data is None:
+            return
+        
+        logger.info(f"Received block from {connection.peer_info.node_id}")
+        
+        block = self._decode_block(data, connection)
+        if block is None:
+            return
+        
+        block_hash = block.get_hash()
+        if self.requested_blocks.get(block_hash) != connection.peer_info.node_id:
+            return
+        del self.requested_blocks[block_hash]
+        
+        await self._accept_block(block, self._compact_block_message(block), message.sender, connection)
     
     async def _handle_new_block(self, message: Message, connection: PeerConnection) -> None:
         """
         Handle a new_block message.
         
+        The block is relayed to the other peers as a compact block, which they
+        can rebuild from their transaction pools.
+        
         Args:
             message: New_block message
             connection: Connection the message was received on
         """
-        # This would be implemented with the blockchain module
-        # For now, just log that a new block was received and relay to peers
-        block = message.data.get("block")
-        if block:
-            logger.info(f"Received new block from {connection.peer_info.node_id}")
-            
-            # Relay to other peers
-            await self.broadcast_message(message, exclude=[connection.peer_info.node_id])
+        data = message.data.get("block")
+        if data is None:
+            return
+        
+        block = self._decode_block(data, connection)
+        if block is None:
+            return
+        
+        block_hash = block.get_hash()
+        if block_hash in self.recent_blocks:
+            return
+        
+        logger.info(f"Received new block {block.header.height} from {connection.peer_info.node_id}")
+        self.requested_blocks.pop(block_hash, None)
+        self._remember_block(block)
+        
+        # Relay to other peers
+        await self.broadcast_message(self._compact_block_message(block), exclude=[connection.peer_info.node_id])
+    
+    async def announce_block(self, block: Block) -> None:
+        """
+        Announce a new block to all peers as a compact block.
+        
+        Args:
+            block: New block
+        """
+        self._remember_block(block)
+        await self.broadcast_message(self._compact_block_message(block))
+    
+    def _compact_block_message(self, block: Block) -> Message:
+        """
+        Create the compact_block message announcing a block.
+        
+        Args:
+            block: Block
+        
+        Returns:
+            Signed compact_block message (unsigned without a private key)
+        """
+        compact_msg = Message(
+            msg_type=MessageType.COMPACT_BLOCK,
+            data=CompactBlock.from_block(block).to_dict(),
+            sender=self.node_id
+        )
+        
+        if self.private_key:
+            compact_msg.sign(self.private_key)
+        
+        return compact_msg
+    
+    def _decode_block(self, data: Any, connection: PeerConnection) -> Optional[Block]:
+        """
+        Decode a block received from a peer and check its transactions.
+        
+        Args:
+            data: Encoded block
+            connection: Connection the block was received on
+        
+        Returns:
+            Block instance, or None if the block is malformed or its
+            transactions do not match the header's Merkle root
+        """
+        try:
+            block = Block.deserialize(data)
+        except (CodecError, TypeError) as e:
+            logger.warning(f"Invalid block from {connection.peer_info.node_id}: {e}")
+            return None
+        
+        merkle_root = block.header.merkle_root
+        if block.calculate_merkle_root() != merkle_root:
+            logger.warning(f"Block with mismatched Merkle root from {connection.peer_info.node_id}")
+            return None
+        
+        return block
+    
+    async def _handle_compact_block(self, message: Message, connection: PeerConnection) -> None:
+        """
+        Handle a compact_block message.
+        
+        The block is rebuilt from the transaction pool; missing transactions
+        are requested from the peer with a get_block_transactions message.
+        
+        Args:
+            message: Compact_block message
+            connection: Connection the message was received on
+        """
+        try:
+            compact = CompactBlock.from_dict(message.data)
+        except ValueError as e:
+            logger.warning(f"Invalid compact block from {connection.peer_info.node_id}: {e}")
+            return
+        
+        block_hash = compact.get_hash()
+        if block_hash in self.recent_blocks or block_hash in self.pending_compact_blocks:
+            return
+        
+        if self.block_store is not None and self.block_store.has_block(block_hash):
+            return
+        
+        known = self.transaction_pool.pending_transactions.values() if self.transaction_pool else []
+        missing = compact.reconstruct(known)
+        
+        if not missing:
+            await self._complete_compact_block(compact, message, connection)
+            return
+        
+        # Wait for the missing transactions, dropping the oldest pending block if needed
+        if len(self.pending_compact_blocks) >= PENDING_COMPACT_BLOCKS_SIZE:
+            del self.pending_compact_blocks[next(iter(self.pending_compact_blocks))]
+        self.pending_compact_blocks[block_hash] = (compact, message)
+        
+        request_msg = Message(
+            msg_type=MessageType.GET_BLOCK_TRANSACTIONS,
+            data={"hash": block_hash.hex(), "indexes": missing},
+            sender=self.node_id
+        )
+        
+        if self.private_key:
+            request_msg.sign(self.private_key)
+        
+        await connection.send_message(request_msg)
+    
+    async def _handle_get_block_transactions(self, message: Message, connection: PeerConnection) -> None:
+        """
+        Handle a get_block_transactions message.
+        
+        The request holds the block "hash" (hex) and the transaction
+        "indexes"; the response holds the encoded transactions, or None if the
+        block is unknown or an index is out of range.
+        
+        Args:
+            message: Get_block_transactions message
+            connection: Connection the message was received on
+        """
+        block_hash = message.data.get("hash")
+        indexes = message.data.get("indexes")
+        block = self._find_block(block_hash) if isinstance(block_hash, str) else None
+        
+        transactions = None
+        if block is not None and isinstance(indexes, list):
+            if all(isinstance(index, int) and 0 <= index < len(block.transactions) for index in indexes):
+                transactions = [encode_block_entry(block.transactions[index]) for index in indexes]
+        
+        txs_msg = Message(
+            msg_type=MessageType.BLOCK_TRANSACTIONS,
+            data={"hash": block_hash, "indexes": indexes, "transactions": transactions},
+            sender=self.node_id
+        )
+        
+        if self.private_key:
+            txs_msg.sign(self.private_key)
+        
+        await connection.send_message(txs_msg)
+    
+    async def _handle_block_transactions(self, message: Message, connection: PeerConnection) -> None:
+        """
+        Handle a block_transactions message.
+        
+        Completes a pending compact block; if the peer could not serve the
+        transactions, the full block is requested instead.
+        
+        Args:
+            message: Block_transactions message
+            connection: Connection the message was received on
+        """
+        block_hash = message.data.get("hash")
+        try:
+            pending = self.pending_compact_blocks.pop(bytes.fromhex(block_hash))
+        except (TypeError, ValueError, KeyError):
+            return
+        
+        compact, compact_msg = pending
+        indexes = message.data.get("indexes")
+        transactions = message.data.get("transactions")
+        
+        if (
+            not isinstance(indexes, list) or not isinstance(transactions, list)
+            or len(indexes) != len(transactions) or compact.fill(indexes, transactions)
+        ):
+            await self._request_full_block(block_hash, connection)
+            return
+        
+        await self._complete_compact_block(compact, compact_msg, connection)
+    
+    async def _complete_compact_block(self, compact: CompactBlock, message: Message, connection: PeerConnection) -> None:
+        """
+        Accept a compact block whose transactions are all known.
+        
+        The block is relayed to the other peers, and delivered to the handlers
+        registered for new_block messages as a new_block message.
+        
+        Args:
+            compact: Reconstructed compact block
+            message: Compact_block message
+            connection: Connection the message was received on
+        """
+        block = compact.to_block()
+        if block is None:
+            # A short ID matched a different transaction, or the peer sent bad ones
+            await self._request_full_block(compact.get_hash().hex(), connection)
+            return
+        
+        logger.info(f"Reconstructed compact block {block.header.height} from {connection.peer_info.node_id}")
+        await self._accept_block(block, message, message.sender, connection)
+    
+    async def _accept_block(self, block: Block, compact_msg: Message, sender: str, connection: PeerConnection) -> None:
+        """
+        Relay a received block and deliver it to the new_block handlers.
+        
+        The block is relayed to the other peers as a compact block, and
+        delivered to the handlers registered for new_block messages as a
+        new_block message.
+        
+        Args:
+            block: Block
+            compact_msg: Compact_block message relaying the block
+            sender: Node ID of the block's announcer
+            connection: Connection the block was received on
+        """
+        self._remember_block(block)
+        
+        # Relay to other peers
+        await self.broadcast_message(compact_msg, exclude=[connection.peer_info.node_id])
+        
+        block_msg = Message(
+            msg_type=MessageType.NEW_BLOCK,
+            data={"block": block.serialize()},
+            sender=sender
+        )
+        
+        for handler in self.message_handlers.get(MessageType.NEW_BLOCK, []):
+            try:
+                await handler(block_msg, connection)
+            except Exception as e:
+                logger.error(f"Error in message handler: {e}")
+    
+    async def _request_full_block(self, block_hash: str, connection: PeerConnection) -> None:
+        """
+        Request a full block by hash, when a compact block cannot be completed.
+        
+        Args:
+            block_hash: Block hash (hex)
+            connection: Connection to request the block on
+        """
+        # Only the requested block is accepted in the response
+        if len(self.requested_blocks) >= PENDING_COMPACT_BLOCKS_SIZE:
+            del self.requested_blocks[next(iter(self.requested_blocks))]
+        self.requested_blocks[bytes.fromhex(block_hash)] = connection.peer_info.node_id
+        
+        get_block_msg = Message(
+            msg_type=MessageType.GET_BLOCK,
+            data={"hash": block_hash},
+            sender=self.node_id
+        )
+        
+        if self.private_key:
+            get_block_msg.sign(self.private_key)
+        
+        await connection.send_message(get_block_msg)
+    
+    def _remember_block(self, block: Block) -> None:
+        """
+        Keep a block to serve the transactions of its compact form.
+        
+        Args:
+            block: Block
+        """
+        if len(self.recent_blocks) >= RECENT_BLOCKS_SIZE:
+            del self.recent_blocks[next(iter(self.recent_blocks))]
+        self.recent_blocks[block.get_hash()] = block
+    
+    def _find_block(self, block_hash: str) -> Optional[Block]:
+        """
+        Find a recent or stored block by hash.
+        
+        Args:
+            block_hash: Block hash (hex)
+        
+        Returns:
+            Block instance, or None if the block is unknown
+        """
+        try:
+            block_hash = bytes.fromhex(block_hash)
+        except ValueError:
+            return None
+        
+        block = self.recent_blocks.get(block_hash)
+        if block is None and self.block_store is not None:
+            block = self.block_store.get_block_by_hash(block_hash)
+        
+        return block
     
     async def _handle_get_transactions(self, message: Message, connection: PeerConnection) -> None:
         """
@@ -967,10 +1398,16 @@ class Node:
             message: Transactions message
             connection: Connection the message was received on
         """
-        # This would be implemented with the transaction pool module
-        # For now, just log the number of transactions received
         txs = message.data.get("transactions", [])
         logger.info(f"Received {len(txs)} transactions from {connection.peer_info.node_id}")
+        
+        if self.transaction_admission is None or not isinstance(txs, list):
+            return
+        
+        # Relay the admitted transactions; known and invalid ones stop here
+        admitted = await self._admit_transactions(txs)
+        if admitted:
+            await self._relay_transactions(admitted, exclude=[connection.peer_info.node_id])
     
     async def _handle_new_transaction(self, message: Message, connection: PeerConnection) -> None:
         """
@@ -980,15 +1417,81 @@ class Node:
             message: New_transaction message
             connection: Connection the message was received on
         """
-        # This would be implemented with the transaction pool module
-        # For now, just log that a new transaction was received and relay to peers
         tx = message.data.get("transaction")
         if tx:
             logger.info(f"Received new transaction from {connection.peer_info.node_id}")
             
+            if self.transaction_admission is not None and not await self._admit_transactions([tx]):
+                return
+            
             # Relay to other peers
             await self.broadcast_message(message, exclude=[connection.peer_info.node_id])
     
+    async def submit_transactions(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """
+        Admit transactions submitted by clients (e.g. over RPC) and relay the
+        admitted ones to all peers.
+        
+        Args:
+            transactions: Submitted transactions
+        
+        Returns:
+            Error message per transaction, in submission order, or None if it
+            was admitted
+        
+        Raises:
+            ValueError: If the node has no transaction pool
+        """
+        if self.transaction_admission is None:
+            raise ValueError("Node has no transaction pool")
+        
+        errors = await self.transaction_admission.add_transactions_async(transactions)
+        admitted = [tx for tx, error in zip(transactions, errors) if error is None]
+        if admitted:
+            await self._relay_transactions(admitted)
+        
+        return errors
+    
+    async def _admit_transactions(self, txs: List[Any]) -> List[Transaction]:
+        """
+        Admit relayed transactions to the transaction pool as one batch,
+        checking them off the event loop.
+        
+        Args:
+            txs: Transaction dictionaries from a message
+        
+        Returns:
+            Admitted transactions
+        """
+        transactions = []
+        for tx in txs:
+            try:
+                transactions.append(Transaction.from_dict(tx))
+            except Exception:
+                continue
+        
+        errors = await self.transaction_admission.add_transactions_async(transactions)
+        return [tx for tx, error in zip(transactions, errors) if error is None]
+    
+    async def _relay_transactions(self, transactions: List[Transaction], exclude: List[str] = None) -> None:
+        """
+        Relay transactions to peers with a transactions message.
+        
+        Args:
+            transactions: Transactions to relay
+            exclude: List of node IDs to exclude from the relay
+        """
+        txs_msg = Message(
+            msg_type=MessageType.TRANSACTIONS,
+            data={"transactions": [tx.to_dict() for tx in transactions]},
+            sender=self.node_id
+        )
+        
+        if self.private_key:
+            txs_msg.sign(self.private_key)
+        
+        await self.broadcast_message(txs_msg, exclude=exclude)
+    
     async def _handle_get_state(self, message: Message, connection: PeerConnection) -> None:
         """
         Handle a get_state message.
@@ -1240,6 +1743,19 @@ class Node:
             # Wait before next maintenance cycle
             await asyncio.sleep(60)  # 1 minute
     
+    async def _expiry_task(self) -> None:
+        """Periodic sweep of expired transactions from the transaction pool."""
+        while self.running:
+            try:
+                expired = self.transaction_pool.clear_expired_transactions(self.transaction_max_age)
+                if expired:
+                    logger.info(f"Expired {expired} pending transactions")
+            
+            except Exception as e:
+                logger.error(f"Error in expiry task: {e}")
+            
+            await asyncio.sleep(self.expiry_interval)
+    
     def register_message_handler(self, msg_type: str, handler: Callable) -> None:
         """
         Register a handler for a specific message type.
@@ -5,6 +5,14 @@ This package contains the state management implementation for the Synergy Networ
 including account state, smart contracts, and validator information.
 """
 
-from .state import Account, StateDB, StateManager
+from .state import Account, StateDB, StateManager, ReceiptStatus
+from .journal import StateJournal
+from .storage import StateStore, PagedMapping
+from .trie import SparseMerkleTree, StateTrie
+from .parallel import ParallelBlockExecutor
+from .changeset import StateChangeset
+from .indexes import StateIndexes
+from .eventlog import EventLog
+from .snapshot import SnapshotWriter, SnapshotReader, SnapshotMapping, SnapshotError
 
-__all__ = ['Account', 'StateDB', 'StateManager']
+__all__ = ['Account', 'StateDB', 'StateManager', 'ReceiptStatus', 'StateJournal', 'StateStore', 'PagedMapping', 'SparseMerkleTree', 'StateTrie', 'ParallelBlockExecutor', 'SnapshotWriter', 'SnapshotReader', 'SnapshotMapping', 'SnapshotError', 'StateChangeset', 'StateIndexes', 'EventLog']
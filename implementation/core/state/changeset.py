@@ -0,0 +1,276 @@
+"""
+Changeset Module for Synergy Network
+
+This module implements state changesets: the compact diff produced by applying
+a block. A changeset lists every account, storage slot, validator membership,
+task and cluster the block changed, with its value before and after the block,
+so replicas and indexers can follow the state by applying diffs instead of
+re-executing transactions.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.core.state.journal import MISSING
+
+# Journal kinds holding a single field of an account
+ACCOUNT_FIELD_KINDS = {"balance", "nonce", "code", "validator"}
+
+def account_fields(account) -> Optional[Dict[str, Any]]:
+    """
+    Get the fields of an account recorded in changesets (storage is diffed per slot).
+
+    Args:
+        account: Account instance or None
+
+    Returns:
+        Dictionary of account fields, or None if the account does not exist
+    """
+    if account is None:
+        return None
+
+    return {
+        "balance": account.balance,
+        "nonce": account.nonce,
+        "code": account.code,
+        "is_validator": account.is_validator,
+        "validator_data": dict(account.validator_data)
+    }
+
+def change(old: Any, new: Any) -> Dict[str, Any]:
+    """
+    Encode an old/new value pair, omitting sides where the item does not exist.
+
+    Args:
+        old: Value before the change, or MISSING
+        new: Value after the change, or MISSING
+
+    Returns:
+        Dictionary with "old" and/or "new" keys
+    """
+    entry = {}
+    if old is not MISSING:
+        entry["old"] = old
+    if new is not MISSING:
+        entry["new"] = new
+    return entry
+
+class StateChangeset:
+    """Class representing the state changes made by a block."""
+
+    def __init__(
+        self,
+        block_height: int = 0,
+        block_hash: str = "",
+        accounts: Dict[str, Dict[str, Any]] = None,
+        storage: Dict[str, Dict[str, Dict[str, Any]]] = None,
+        validators: Dict[str, Dict[str, Any]] = None,
+        tasks: Dict[str, Dict[str, Any]] = None,
+        clusters: Dict[str, Dict[str, Any]] = None,
+        total_supply: Dict[str, Any] = None,
+        events: List[Dict[str, Any]] = None
+    ):
+        """
+        Initialize a StateChangeset instance.
+
+        Every change is a dictionary with an "old" and a "new" value; a side is
+        omitted if the item did not exist before or after the block.
+
+        Args:
+            block_height: Height of the block
+            block_hash: Hash of the block (hex)
+            accounts: Account field changes by address
+            storage: Storage slot changes by address and slot
+            validators: Validator set membership changes by address
+            tasks: Task changes by task ID
+            clusters: Cluster changes by cluster ID
+            total_supply: Total supply change, if any
+            events: Contract events emitted by the block
+        """
+        self.block_height = block_height
+        self.block_hash = block_hash
+        self.accounts = accounts or {}
+        self.storage = storage or {}
+        self.validators = validators or {}
+        self.tasks = tasks or {}
+        self.clusters = clusters or {}
+        self.total_supply = total_supply
+        self.events = events or []
+
+    def is_empty(self) -> bool:
+        """
+        Check whether the changeset changes nothing.
+
+        Returns:
+            True if the changeset is empty, False otherwise
+        """
+        return not (
+            self.accounts or self.storage or self.validators or
+            self.tasks or self.clusters or self.total_supply or self.events
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert StateChangeset to dictionary.
+
+        Returns:
+            Dictionary representation of the changeset
+        """
+        data = {
+            "block_height": self.block_height,
+            "block_hash": self.block_hash,
+            "accounts": self.accounts,
+            "storage": self.storage,
+            "validators": self.validators,
+            "tasks": self.tasks,
+            "clusters": self.clusters
+        }
+
+        if self.total_supply:
+            data["total_supply"] = self.total_supply
+
+        if self.events:
+            data["events"] = self.events
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StateChangeset':
+        """
+        Create StateChangeset from dictionary.
+
+        Args:
+            data: Dictionary representation of the changeset
+
+        Returns:
+            StateChangeset instance
+        """
+        return cls(
+            block_height=data.get("block_height", 0),
+            block_hash=data.get("block_hash", ""),
+            accounts=data.get("accounts", {}),
+            storage=data.get("storage", {}),
+            validators=data.get("validators", {}),
+            tasks=data.get("tasks", {}),
+            clusters=data.get("clusters", {}),
+            total_supply=data.get("total_supply"),
+            events=data.get("events", [])
+        )
+
+    @classmethod
+    def from_journal(
+        cls,
+        state,
+        entries: List[Tuple[str, Any, Any]],
+        block_height: int = 0,
+        block_hash: str = ""
+    ) -> 'StateChangeset':
+        """
+        Build the changeset of a block from its journal entries.
+
+        The first entry recorded for an item holds its value before the block;
+        the state holds the value after it. Items whose value ended up
+        unchanged are left out.
+
+        Args:
+            state: State database after the block
+            entries: Journal entries recorded while applying the block
+            block_height: Height of the block
+            block_hash: Hash of the block (hex)
+
+        Returns:
+            StateChangeset instance
+        """
+        first: Dict[Tuple[str, Any], Any] = {}
+        events = []
+
+        for kind, key, old_value in entries:
+            if kind == "event":
+                # Event entries hold the position of the emitted event
+                events.append(state.pending_events[old_value])
+            elif (kind, key) not in first:
+                first[(kind, key)] = old_value
+
+        changeset = cls(block_height=block_height, block_hash=block_hash, events=events)
+
+        # Old account fields: the current account with the first recorded values put back
+        old_accounts: Dict[str, Optional[Dict[str, Any]]] = {}
+        old_storage: Dict[str, Dict[str, Any]] = {}
+        replaced_storage: Dict[str, Dict[str, Any]] = {}
+
+        for (kind, key), old_value in first.items():
+            if kind == "account" or kind in ACCOUNT_FIELD_KINDS:
+                if key not in old_accounts:
+                    old_accounts[key] = account_fields(state.accounts.get(key))
+
+                fields = old_accounts[key]
+                if fields is None:
+                    continue
+
+                if kind == "account":
+                    # The account was created by the block
+                    old_accounts[key] = None
+                elif kind == "validator":
+                    fields["is_validator"], validator_data = old_value
+                    fields["validator_data"] = dict(validator_data)
+                else:
+                    fields[kind] = old_value
+
+            elif kind == "storage":
+                replaced_storage[key] = dict(old_value)
+
+            elif kind == "storage_slot":
+                # Slots written after the whole storage was replaced take their
+                # old value from the replaced storage instead
+                address, slot = key
+                if address not in replaced_storage:
+                    old_storage.setdefault(address, {})[slot] = old_value
+
+            elif kind == "validator_set":
+                new_value = key in state.validators
+                if old_value != new_value:
+                    changeset.validators[key] = {"old": old_value, "new": new_value}
+
+            elif kind in ("task", "cluster"):
+                entries_by_id = state.tasks if kind == "task" else state.clusters
+                new_value = entries_by_id.get(key, MISSING)
+                if old_value != new_value:
+                    target = changeset.tasks if kind == "task" else changeset.clusters
+                    target[key] = change(old_value, new_value)
+
+            elif kind == "total_supply":
+                if old_value != state.total_supply:
+                    changeset.total_supply = {"old": old_value, "new": state.total_supply}
+
+        for address, old_fields in old_accounts.items():
+            new_fields = account_fields(state.accounts.get(address))
+            if old_fields != new_fields:
+                changeset.accounts[address] = change(
+                    old_fields if old_fields is not None else MISSING,
+                    new_fields if new_fields is not None else MISSING
+                )
+
+        for address in set(old_storage) | set(replaced_storage):
+            account = state.accounts.get(address)
+            new_storage = account.storage if account is not None else {}
+
+            slots = dict(old_storage.get(address, {}))
+            if address in replaced_storage:
+                replaced = replaced_storage[address]
+                for slot in set(replaced) | set(new_storage):
+                    if slot not in slots:
+                        slots[slot] = replaced.get(slot, MISSING)
+
+            slot_changes = {}
+            for slot, old_value in slots.items():
+                new_value = new_storage.get(slot, MISSING)
+                if old_value != new_value:
+                    slot_changes[slot] = change(old_value, new_value)
+
+            if slot_changes:
+                changeset.storage[address] = slot_changes
+
+        return changeset
@@ -0,0 +1,335 @@
+"""
+Event Log Module for Synergy Network
+
+This module implements the contract event log: an append-only log of contract
+calls and events kept outside account storage, so that it is never copied into
+state snapshots. Records are appended to segment files; an in-memory index by
+contract address and block height serves range queries, and the oldest
+segments are dropped once the configured number of segments is exceeded.
+"""
+
+import bisect
+import json
+import os
+import struct
+from typing import Dict, List, Any, Optional, Tuple
+
+LENGTH = struct.Struct("<I")
+
+class EventLog:
+    """Class implementing a bounded, segmented, append-only contract event log."""
+
+    def __init__(self, directory: str = None, segment_size: int = 64 * 1024 * 1024, max_segments: int = 16):
+        """
+        Initialize an EventLog instance.
+
+        Existing segments in the directory are scanned to rebuild the index.
+
+        Args:
+            directory: Directory holding the segment files (keeps segments in
+                memory if None)
+            segment_size: Size in bytes after which a new segment is started
+            max_segments: Maximum number of segments kept (None for unbounded)
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+
+        # Segment ID -> in-memory data or open file, in segment order
+        self.segments: Dict[int, Any] = {}
+        self.segment_sizes: Dict[int, int] = {}
+        self.active_segment = 0
+
+        # Index: heights and (segment, offset) positions, per contract and overall
+        self.contract_heights: Dict[str, List[int]] = {}
+        self.contract_positions: Dict[str, List[Tuple[int, int]]] = {}
+        self.heights: List[int] = []
+        self.positions: List[Tuple[int, int]] = []
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load_segments()
+
+        if not self.segments:
+            self._open_segment(1)
+
+    def append(self, contract: str, block_height: int, event: Dict[str, Any]) -> None:
+        """
+        Append an event to the log.
+
+        Args:
+            contract: Contract address the event belongs to
+            block_height: Height of the block that emitted the event
+            event: JSON-serializable event data
+        """
+        record = dict(event)
+        record["contract"] = contract
+        record["block_height"] = block_height
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+        if self.segment_sizes[self.active_segment] >= self.segment_size:
+            self._open_segment(self.active_segment + 1)
+            self._enforce_retention()
+
+        segment = self.active_segment
+        offset = self.segment_sizes[segment]
+        self._write(segment, LENGTH.pack(len(data)) + data)
+        self.segment_sizes[segment] += LENGTH.size + len(data)
+
+        self._index(contract, block_height, (segment, offset))
+
+    def get_events(
+        self,
+        contract: str,
+        from_height: int = 0,
+        to_height: int = None,
+        limit: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the events of a contract within a block height range.
+
+        Args:
+            contract: Contract address
+            from_height: Lowest block height (inclusive)
+            to_height: Highest block height (inclusive, unbounded if None)
+            limit: Maximum number of events (all if None)
+
+        Returns:
+            List of events in append order
+        """
+        heights = self.contract_heights.get(contract)
+        if not heights:
+            return []
+
+        return self._read_range(self.contract_positions[contract], heights, from_height, to_height, limit)
+
+    def get_block_events(self, from_height: int, to_height: int = None, limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Get the events of all contracts within a block height range.
+
+        Args:
+            from_height: Lowest block height (inclusive)
+            to_height: Highest block height (inclusive, defaults to from_height)
+            limit: Maximum number of events (all if None)
+
+        Returns:
+            List of events in append order
+        """
+        if to_height is None:
+            to_height = from_height
+
+        return self._read_range(self.positions, self.heights, from_height, to_height, limit)
+
+    def count(self, contract: str = None) -> int:
+        """
+        Count the retained events.
+
+        Args:
+            contract: Contract address (all contracts if None)
+
+        Returns:
+            Number of events
+        """
+        if contract is None:
+            return len(self.positions)
+
+        return len(self.contract_heights.get(contract, ()))
+
+    def flush(self) -> None:
+        """Flush the active segment file to disk."""
+        if self.directory is not None:
+            segment = self.segments[self.active_segment]
+            segment.flush()
+            os.fsync(segment.fileno())
+
+    def close(self) -> None:
+        """Flush and close all segment files."""
+        if self.directory is not None:
+            self.flush()
+            for segment in self.segments.values():
+                segment.close()
+
+        self.segments = {}
+
+    def _read_range(
+        self,
+        positions: List[Tuple[int, int]],
+        heights: List[int],
+        from_height: int,
+        to_height: Optional[int],
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the events whose heights fall in a range of an index.
+
+        Args:
+            positions: Index positions
+            heights: Block heights matching the positions
+            from_height: Lowest block height (inclusive)
+            to_height: Highest block height (inclusive, unbounded if None)
+            limit: Maximum number of events (all if None)
+
+        Returns:
+            List of events
+        """
+        start = bisect.bisect_left(heights, from_height)
+        end = len(heights) if to_height is None else bisect.bisect_right(heights, to_height)
+
+        if limit is not None:
+            end = min(end, start + limit)
+
+        return [self._read(*position) for position in positions[start:end]]
+
+    def _index(self, contract: str, block_height: int, position: Tuple[int, int]) -> None:
+        """
+        Add a record to the indexes, keeping them ordered by block height.
+
+        Args:
+            contract: Contract address
+            block_height: Block height of the record
+            position: (segment, offset) of the record
+        """
+        for heights, positions in (
+            (self.contract_heights.setdefault(contract, []), self.contract_positions.setdefault(contract, [])),
+            (self.heights, self.positions)
+        ):
+            if not heights or heights[-1] <= block_height:
+                heights.append(block_height)
+                positions.append(position)
+            else:
+                # Out-of-order heights are rare; insert after equal heights
+                slot = bisect.bisect_right(heights, block_height)
+                heights.insert(slot, block_height)
+                positions.insert(slot, position)
+
+    def _segment_path(self, segment: int) -> str:
+        """Get the path of a segment file."""
+        return os.path.join(self.directory, f"events-{segment:08d}.log")
+
+    def _open_segment(self, segment: int) -> None:
+        """
+        Start a new active segment.
+
+        Args:
+            segment: Segment ID
+        """
+        if self.directory is None:
+            self.segments[segment] = bytearray()
+        else:
+            # The segment being retired is not flushed by later calls to flush()
+            if self.active_segment in self.segments:
+                self.flush()
+            self.segments[segment] = open(self._segment_path(segment), "a+b")
+
+        self.segment_sizes[segment] = 0
+        self.active_segment = segment
+
+    def _write(self, segment: int, data: bytes) -> None:
+        """Append raw bytes to a segment."""
+        if self.directory is None:
+            self.segments[segment] += data
+        else:
+            handle = self.segments[segment]
+            handle.seek(0, os.SEEK_END)
+            handle.write(data)
+
+    def _read(self, segment: int, offset: int) -> Dict[str, Any]:
+        """
+        Read a record from a segment.
+
+        Args:
+            segment: Segment ID
+            offset: Offset of the record in the segment
+
+        Returns:
+            Event data
+        """
+        if self.directory is None:
+            data = self.segments[segment]
+            (length,) = LENGTH.unpack_from(data, offset)
+            start = offset + LENGTH.size
+            return json.loads(bytes(data[start:start + length]))
+
+        handle = self.segments[segment]
+        handle.flush()
+        handle.seek(offset)
+        (length,) = LENGTH.unpack(handle.read(LENGTH.size))
+        return json.loads(handle.read(length))
+
+    def _enforce_retention(self) -> None:
+        """Drop the oldest segments beyond the retention limit."""
+        if self.max_segments is None:
+            return
+
+        while len(self.segments) > self.max_segments:
+            oldest = min(self.segments)
+
+            if self.directory is not None:
+                self.segments[oldest].close()
+                os.remove(self._segment_path(oldest))
+
+            del self.segments[oldest]
+            del self.segment_sizes[oldest]
+
+            self._drop_positions(oldest)
+
+    def _drop_positions(self, segment: int) -> None:
+        """
+        Remove the index entries pointing into a dropped segment.
+
+        Args:
+            segment: Dropped segment ID
+        """
+        for contract in list(self.contract_positions):
+            positions = self.contract_positions[contract]
+            heights = self.contract_heights[contract]
+            kept = [i for i, position in enumerate(positions) if position[0] != segment]
+
+            if not kept:
+                del self.contract_positions[contract]
+                del self.contract_heights[contract]
+            elif len(kept) != len(positions):
+                self.contract_positions[contract] = [positions[i] for i in kept]
+                self.contract_heights[contract] = [heights[i] for i in kept]
+
+        kept = [i for i, position in enumerate(self.positions) if position[0] != segment]
+        self.positions = [self.positions[i] for i in kept]
+        self.heights = [self.heights[i] for i in kept]
+
+    def _load_segments(self) -> None:
+        """Open the existing segment files and rebuild the index from them."""
+        segment_ids = sorted(
+            int(name[len("events-"):-len(".log")])
+            for name in os.listdir(self.directory)
+            if name.startswith("events-") and name.endswith(".log")
+        )
+
+        for segment in segment_ids:
+            handle = open(self._segment_path(segment), "a+b")
+            handle.seek(0)
+            data = handle.read()
+
+            # Scan complete records; a torn record at the tail is truncated
+            offset = 0
+            while offset + LENGTH.size <= len(data):
+                (length,) = LENGTH.unpack_from(data, offset)
+                end = offset + LENGTH.size + length
+                if end > len(data):
+                    break
+
+                try:
+                    record = json.loads(data[offset + LENGTH.size:end])
+                except ValueError:
+                    break
+
+                self._index(record.get("contract", ""), record.get("block_height", 0), (segment, offset))
+                offset = end
+
+            if offset != len(data):
+                handle.truncate(offset)
+
+            self.segments[segment] = handle
+            self.segment_sizes[segment] = offset
+            self.active_segment = segment
+
+        self._enforce_retention()
@@ -0,0 +1,175 @@
+"""
+Indexes Module for Synergy Network
+
+This module implements the secondary indexes of the state database: validators
+ordered by stake, tasks by status and by submitter, and clusters by status.
+The indexes are built from one scan of the state and then kept up to date by
+the state's mutators and by snapshot reverts.
+"""
+
+import bisect
+from typing import Dict, List, Any, Set, Tuple
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.core.state.journal import MISSING
+
+class SecondaryIndex:
+    """Index mapping an attribute value to the keys of the entries holding it."""
+
+    def __init__(self):
+        """Initialize a SecondaryIndex instance."""
+        self.keys_by_value: Dict[Any, Set[str]] = {}
+        self.value_by_key: Dict[str, Any] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set the indexed value of an entry.
+
+        Args:
+            key: Entry key
+            value: Indexed value, or MISSING to remove the entry
+        """
+        old_value = self.value_by_key.get(key, MISSING)
+        if old_value is not MISSING:
+            if old_value == value:
+                return
+
+            keys = self.keys_by_value[old_value]
+            keys.discard(key)
+            if not keys:
+                del self.keys_by_value[old_value]
+
+        if value is MISSING:
+            self.value_by_key.pop(key, None)
+        else:
+            self.value_by_key[key] = value
+            self.keys_by_value.setdefault(value, set()).add(key)
+
+    def get(self, value: Any) -> List[str]:
+        """
+        Get the keys of the entries with a value.
+
+        Args:
+            value: Indexed value
+
+        Returns:
+            Sorted list of entry keys
+        """
+        return sorted(self.keys_by_value.get(value, ()))
+
+    def count(self, value: Any) -> int:
+        """
+        Count the entries with a value.
+
+        Args:
+            value: Indexed value
+
+        Returns:
+            Number of entries
+        """
+        return len(self.keys_by_value.get(value, ()))
+
+class SortedIndex:
+    """Index keeping entry keys ordered by a numeric attribute, highest first."""
+
+    def __init__(self):
+        """Initialize a SortedIndex instance."""
+        self.order: List[Tuple[int, str]] = []
+        self.value_by_key: Dict[str, int] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set the indexed value of an entry.
+
+        Args:
+            key: Entry key
+            value: Indexed value, or MISSING to remove the entry
+        """
+        old_value = self.value_by_key.get(key, MISSING)
+        if old_value is not MISSING:
+            if old_value == value:
+                return
+
+            position = bisect.bisect_left(self.order, (-old_value, key))
+            del self.order[position]
+
+        if value is MISSING:
+            self.value_by_key.pop(key, None)
+        else:
+            self.value_by_key[key] = value
+            bisect.insort(self.order, (-value, key))
+
+    def top(self, limit: int = None) -> List[Tuple[str, int]]:
+        """
+        Get entries in descending value order (ties by ascending key).
+
+        Args:
+            limit: Maximum number of entries (all if None)
+
+        Returns:
+            List of (key, value) tuples
+        """
+        entries = self.order if limit is None else self.order[:limit]
+        return [(key, -negated) for negated, key in entries]
+
+class StateIndexes:
+    """Class holding the secondary indexes of a state database."""
+
+    def __init__(self):
+        """Initialize a StateIndexes instance."""
+        self.validators_by_stake = SortedIndex()
+        self.tasks_by_status = SecondaryIndex()
+        self.tasks_by_submitter = SecondaryIndex()
+        self.clusters_by_status = SecondaryIndex()
+
+    @classmethod
+    def build(cls, state) -> 'StateIndexes':
+        """
+        Build the indexes from a full scan of a state database.
+
+        Args:
+            state: State database
+
+        Returns:
+            StateIndexes instance
+        """
+        indexes = cls()
+
+        for address in state.validators:
+            indexes.update(state, "validator_set", address)
+
+        for task_id in state.tasks:
+            indexes.update(state, "task", task_id)
+
+        for cluster_id in state.clusters:
+            indexes.update(state, "cluster", cluster_id)
+
+        return indexes
+
+    def update(self, state, kind: str, key: Any) -> None:
+        """
+        Re-index an item after it changed.
+
+        Args:
+            state: State database holding the changed item
+            kind: Journal kind of the item
+            key: Key of the item
+        """
+        if kind in ("validator", "validator_set"):
+            stake = MISSING
+            if key in state.validators:
+                account = state.accounts.get(key)
+                stake = account.validator_data.get("stake_amount", 0) if account is not None else 0
+            self.validators_by_stake.set(key, stake)
+
+        elif kind == "task":
+            task = state.tasks.get(key)
+            self.tasks_by_status.set(key, task.get("status", "") if task is not None else MISSING)
+            self.tasks_by_submitter.set(key, task.get("submitter", "") if task is not None else MISSING)
+
+        elif kind == "cluster":
+            cluster = state.clusters.get(key)
+            self.clusters_by_status.set(key, cluster.get("status", "") if cluster is not None else MISSING)
@@ -0,0 +1,140 @@
+"""
+Journal Module for Synergy Network
+
+This module implements the undo journal used by the state database to provide
+cheap, nested snapshots. Every state mutation records the value it overwrote,
+so reverting a snapshot only touches the keys changed since it was taken.
+"""
+
+from typing import Any, Callable, List, Tuple
+
+class _Missing:
+    """Type of the MISSING sentinel; pickles back to the same instance."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self) -> str:
+        return "MISSING"
+
+# Sentinel recorded as the old value of keys that did not exist before a mutation
+MISSING = _Missing()
+
+class StateJournal:
+    """Class recording undo entries for mutations of the state database."""
+
+    def __init__(self):
+        """Initialize a StateJournal instance."""
+        self.entries: List[Tuple[str, Any, Any]] = []
+        self.checkpoints: List[int] = []
+
+    def is_recording(self) -> bool:
+        """
+        Check whether mutations are currently being journaled.
+
+        Returns:
+            True if at least one checkpoint is open, False otherwise
+        """
+        return bool(self.checkpoints)
+
+    def record(self, kind: str, key: Any, old_value: Any) -> None:
+        """
+        Record an undo entry for a mutation.
+
+        Entries are only kept while a checkpoint is open, so a state that is
+        never snapshotted does not accumulate a journal.
+
+        Args:
+            kind: Kind of the mutated item (e.g. "balance", "task")
+            key: Key of the mutated item
+            old_value: Value before the mutation, or MISSING
+        """
+        if self.checkpoints:
+            self.entries.append((kind, key, old_value))
+
+    def record_many(self, entries: List[Tuple[str, Any, Any]]) -> None:
+        """
+        Record undo entries for a batch of mutations.
+
+        Args:
+            entries: List of (kind, key, old_value) entries in mutation order
+        """
+        if self.checkpoints:
+            self.entries.extend(entries)
+
+    def checkpoint(self) -> int:
+        """
+        Open a new checkpoint at the current journal position.
+
+        Returns:
+            Checkpoint ID (index)
+        """
+        self.checkpoints.append(len(self.entries))
+        return len(self.checkpoints) - 1
+
+    def revert(self, checkpoint_id: int, undo: Callable[[str, Any, Any], None]) -> bool:
+        """
+        Undo all entries recorded since a checkpoint.
+
+        The checkpoint and all checkpoints opened after it are closed.
+
+        Args:
+            checkpoint_id: Checkpoint ID to revert to
+            undo: Callback restoring a single (kind, key, old_value) entry
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if checkpoint_id < 0 or checkpoint_id >= len(self.checkpoints):
+            return False
+
+        position = self.checkpoints[checkpoint_id]
+
+        # Undo entries newest first so that repeated writes unwind correctly
+        for kind, key, old_value in reversed(self.entries[position:]):
+            undo(kind, key, old_value)
+
+        del self.entries[position:]
+        del self.checkpoints[checkpoint_id:]
+
+        if not self.checkpoints:
+            self.entries = []
+
+        return True
+
+    def discard(self, checkpoint_id: int) -> bool:
+        """
+        Close a checkpoint while keeping its changes.
+
+        Entries stay in the journal so that enclosing checkpoints can still
+        revert them.
+
+        Args:
+            checkpoint_id: Checkpoint ID to close
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if checkpoint_id < 0 or checkpoint_id >= len(self.checkpoints):
+            return False
+
+        del self.checkpoints[checkpoint_id:]
+
+        if not self.checkpoints:
+            self.entries = []
+
+        return True
+
+    def commit(self) -> None:
+        """Close all checkpoints and drop the recorded entries."""
+        self.entries = []
+        self.checkpoints = []
+
+    def __len__(self) -> int:
+        """
+        Get the number of recorded entries.
+
+        Returns:
+            Number of journal entries
+        """
+        return len(self.entries)
@@ -0,0 +1,805 @@
+"""
+Parallel Execution Module for Synergy Network
+
+This module implements optimistic parallel execution of block transactions.
+The block is split into contiguous ranges, and every range first runs
+speculatively in a worker against a private overlay of the pre-block state
+while the read and write sets of its transactions are recorded. Results are
+then committed in block order; a transaction that read state written outside
+its range is re-executed against the live state.
+"""
+
+import bisect
+import itertools
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterator, Optional, Set, Tuple
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.core.state.journal import MISSING
+from implementation.core.state.state import Account, StateDB, StateManager, ReceiptStatus
+from implementation.core.transaction.transaction import Transaction, TransactionType
+
+# Ranges each worker speculates per block (so that committing overlaps with
+# speculating), and the smallest range worth sending to a worker
+RANGES_PER_WORKER = 4
+MIN_RANGE_SIZE = 64
+
+class SpeculationAbort(Exception):
+    """Exception raised when a transaction cannot be executed speculatively."""
+    pass
+
+class TrackingMapping(MutableMapping):
+    """
+    Copy-on-read overlay of a state table that records every key read.
+
+    Entries are fetched from the base table on first access and kept in the
+    overlay, where absent keys are stored as MISSING; writes only go to the
+    overlay. Iterating over the table raises SpeculationAbort, which makes the
+    transaction fall back to serial execution.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        base: Any,
+        reads: Set[Tuple[str, str]],
+        untracked: Set[str] = None,
+        copy_entry: Callable[[Any], Any] = None
+    ):
+        """
+        Initialize a TrackingMapping instance.
+
+        Args:
+            table: Name of the state table (used in read set entries)
+            base: Table of the state the overlay reads through to
+            reads: Read set of the running transaction
+            untracked: Keys whose reads are not recorded
+            copy_entry: Function copying entries fetched from the base table
+                (None to share them)
+        """
+        self.table = table
+        self.base = base
+        self.entries: Dict[str, Any] = {}
+        self.reads = reads
+        self.untracked = untracked or set()
+        self.copy_entry = copy_entry
+
+    def _track(self, key: str) -> Any:
+        """
+        Record a read of a key.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Entry value or MISSING
+        """
+        if key not in self.untracked:
+            self.reads.add((self.table, key))
+
+        if key in self.entries:
+            return self.entries[key]
+
+        value = self.base.get(key, MISSING)
+        if value is not MISSING and self.copy_entry is not None:
+            value = self.copy_entry(value)
+
+        self.entries[key] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._track(key)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._track(key)
+        return default if value is MISSING else value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.entries[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if self._track(key) is MISSING:
+            raise KeyError(key)
+        self.entries[key] = MISSING
+
+    def __contains__(self, key: object) -> bool:
+        return self._track(key) is not MISSING
+
+    def __iter__(self):
+        raise SpeculationAbort(f"{self.table}:*")
+
+    def __len__(self) -> int:
+        raise SpeculationAbort(f"{self.table}:*")
+
+class TrackingSet:
+    """Overlay of the validator set that records every address read."""
+
+    def __init__(self, base: Set[str], reads: Set[Tuple[str, str]]):
+        """
+        Initialize a TrackingSet instance.
+
+        Args:
+            base: Validator set of the state the overlay reads through to
+            reads: Read set of the running transaction
+        """
+        self.base = base
+        self.members: Dict[str, bool] = {}
+        self.reads = reads
+
+    def __contains__(self, address: str) -> bool:
+        self.reads.add(("validators", address))
+
+        if address in self.members:
+            return self.members[address]
+
+        return address in self.base
+
+    def add(self, address: str) -> None:
+        self.members[address] = True
+
+    def remove(self, address: str) -> None:
+        if address not in self:
+            raise KeyError(address)
+        self.members[address] = False
+
+    def discard(self, address: str) -> None:
+        self.members[address] = False
+
+    def __iter__(self):
+        raise SpeculationAbort("validators:*")
+
+    def __len__(self) -> int:
+        raise SpeculationAbort("validators:*")
+
+def written_entry(kind: str, key: Any) -> Optional[Tuple[str, str]]:
+    """
+    Map a journal or write set entry to the state entry it overwrites.
+
+    Args:
+        kind: Kind of the written item
+        key: Key of the written item
+
+    Returns:
+        (table, key) tuple, or None for the total supply and events
+    """
+    if kind in ("total_supply", "event"):
+        return None
+
+    if kind == "storage_slot":
+        return ("accounts", key[0])
+
+    if kind == "validator_set":
+        return ("validators", key)
+
+    if kind in ("task", "cluster"):
+        return (kind + "s", key)
+
+    return ("accounts", key)
+
+class SpeculativeRange:
+    """
+    Class holding the speculative results of a contiguous range of a block.
+
+    Results are kept in flat columns with per-transaction offsets rather than
+    in per-transaction containers, so that a range is cheap to send back from
+    a worker process and a run of its transactions can be committed by
+    slicing. Read and write set entries are split into their table (or kind)
+    and key columns as well, which avoids allocating a tuple per entry.
+    """
+
+    def __init__(self, start: int, delta_accounts: Set[str]):
+        """
+        Initialize a SpeculativeRange instance.
+
+        Args:
+            start: Index of the first transaction of the range in the block
+            delta_accounts: Accounts whose balance writes are recorded as deltas
+        """
+        self.start = start
+
+        # Transactions that failed (error message) or must run serially (None)
+        self.failures: Dict[int, Optional[str]] = {}
+
+        # Read set entries, and the offset of each transaction's first entry
+        self.read_tables: List[str] = []
+        self.read_keys: List[Any] = []
+        self.read_offsets = [0]
+
+        # Write set entries (kind, key and new value) in first-write order
+        self.write_kinds: List[str] = []
+        self.write_keys: List[Any] = []
+        self.write_values: List[Any] = []
+        self.write_offsets = [0]
+
+        # Running totals of the balance deltas (None for the total supply)
+        self.deltas: Dict[Optional[str], List[int]] = {key: [0] for key in delta_accounts | {None}}
+
+        self.events: List[Dict[str, Any]] = []
+        self.event_offsets = [0]
+
+        # State entries written by the range (see written_entry), without duplicates
+        self.written_tables: List[str] = []
+        self.written_keys: List[Any] = []
+
+        # CPU time spent speculating the range (in seconds)
+        self.elapsed = 0.0
+
+    def add(
+        self,
+        reads: Set[Tuple[str, str]],
+        writes: Dict[Tuple[str, Any], Any] = None,
+        deltas: Dict[Optional[str], int] = None,
+        events: List[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Add the results of the next transaction of the range.
+
+        Args:
+            reads: Read set of the transaction
+            writes: New values by (kind, key) (empty if it did not succeed)
+            deltas: Balance deltas by address (None for the total supply)
+            events: Emitted events
+        """
+        for table, key in reads:
+            self.read_tables.append(table)
+            self.read_keys.append(key)
+        self.read_offsets.append(len(self.read_keys))
+
+        for (kind, key), value in (writes or {}).items():
+            self.write_kinds.append(kind)
+            self.write_keys.append(key)
+            self.write_values.append(value)
+        self.write_offsets.append(len(self.write_keys))
+
+        for key, totals in self.deltas.items():
+            totals.append(totals[-1] + (deltas or {}).get(key, 0))
+
+        if events:
+            self.events.extend(events)
+        self.event_offsets.append(len(self.events))
+
+    def finish(self) -> 'SpeculativeRange':
+        """
+        Collect the state entries written by the range once all results are added.
+
+        Returns:
+            The range itself
+        """
+        written = set(self.written_entries(0, len(self)))
+        self.written_tables = [table for table, _ in written]
+        self.written_keys = [key for _, key in written]
+
+        # Drop bookkeeping the range does not need
+        self.deltas = {key: totals for key, totals in self.deltas.items() if any(totals)}
+        if not self.events:
+            self.event_offsets = []
+
+        return self
+
+    def reads(self, start: int, stop: int) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the read set entries of a run of transactions.
+
+        Args:
+            start: Offset of the first transaction of the run in the range
+            stop: Offset after the last transaction of the run
+
+        Returns:
+            Iterator over (table, key) tuples
+        """
+        first, last = self.read_offsets[start], self.read_offsets[stop]
+        return zip(self.read_tables[first:last], self.read_keys[first:last])
+
+    def writes(self, start: int, stop: int) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Iterate over the write set entries of a run of transactions.
+
+        Args:
+            start: Offset of the first transaction of the run in the range
+            stop: Offset after the last transaction of the run
+
+        Returns:
+            Iterator over (kind, key, new value) tuples
+        """
+        first, last = self.write_offsets[start], self.write_offsets[stop]
+        return zip(self.write_kinds[first:last], self.write_keys[first:last], self.write_values[first:last])
+
+    def written_entries(self, start: int, stop: int) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the state entries a run of transactions wrote.
+
+        Args:
+            start: Offset of the first transaction of the run in the range
+            stop: Offset after the last transaction of the run
+
+        Returns:
+            Iterator over (table, key) tuples (see written_entry)
+        """
+        first, last = self.write_offsets[start], self.write_offsets[stop]
+
+        for kind, key in zip(self.write_kinds[first:last], self.write_keys[first:last]):
+            entry = written_entry(kind, key)
+            if entry is not None:
+                yield entry
+
+    def __len__(self) -> int:
+        """
+        Get the number of transactions in the range.
+
+        Returns:
+            Number of transactions
+        """
+        return len(self.read_offsets) - 1
+
+def execute_speculative(
+    state: StateDB,
+    transactions: List[Transaction],
+    delta_accounts: Set[str],
+    start: int,
+    stop: int
+) -> SpeculativeRange:
+    """
+    Execute a contiguous range of a block's transactions speculatively.
+
+    The range runs in block order against a private overlay of `state`, so
+    every transaction sees the effects of the earlier transactions of its
+    range but none of the other ranges. The state itself is never written.
+
+    Args:
+        state: State as left by the block's pre-checks
+        transactions: Transactions of the block
+        delta_accounts: Accounts whose balance writes are recorded as deltas
+        start: Index of the first transaction of the range
+        stop: Index after the last transaction of the range
+
+    Returns:
+        SpeculativeRange instance
+    """
+    started = time.thread_time()
+    manager = StateManager()
+    view = StateDB()
+
+    view.accounts = TrackingMapping("accounts", state.accounts, set(), delta_accounts, Account.copy)
+    view.tasks = TrackingMapping("tasks", state.tasks, set())
+    view.clusters = TrackingMapping("clusters", state.clusters, set())
+    view.validators = TrackingSet(state.validators, set())
+
+    # Delta account balances and the total supply start at zero so that they
+    # only accumulate the range's contributions
+    for address in delta_accounts:
+        view.accounts.entries[address] = Account(address=address)
+    view.total_supply = 0
+
+    manager.state = view
+    tables = (view.accounts, view.tasks, view.clusters, view.validators)
+    results = SpeculativeRange(start, delta_accounts)
+
+    for offset, transaction in enumerate(transactions[start:stop]):
+        reads: Set[Tuple[str, str]] = set()
+        for table in tables:
+            table.reads = reads
+
+        snapshot_id = view.create_snapshot()
+
+        try:
+            if manager.handlers[transaction.tx_type](transaction):
+                writes, deltas, events = collect_writes(view, delta_accounts)
+                view.discard_snapshot(snapshot_id)
+                results.add(reads, writes, deltas, events)
+                continue
+
+            results.failures[offset] = "rejected by state"
+        except SpeculationAbort:
+            results.failures[offset] = None
+        except Exception as e:
+            results.failures[offset] = str(e)
+
+        # Failed transactions leave no trace for the rest of the range
+        view.revert_to_snapshot(snapshot_id)
+        results.add(reads)
+
+    results.elapsed = time.thread_time() - started
+    return results.finish()
+
+def collect_writes(view: StateDB, delta_accounts: Set[str]) -> Tuple[Dict, Dict, List]:
+    """
+    Build the write set of a speculatively executed transaction.
+
+    Args:
+        view: View the transaction ran against (with its snapshot still open)
+        delta_accounts: Accounts whose balance writes are recorded as deltas
+
+    Returns:
+        Tuple of the new values by (kind, key) in first-write order ("account"
+        entries carry no value), the balance deltas by address (None for the
+        total supply) and the emitted events
+    """
+    writes: Dict[Tuple[str, Any], Any] = {}
+    deltas: Dict[Optional[str], int] = {}
+    events = []
+    seen = set()
+
+    for kind, key, old_value in view.journal.entries:
+        if kind == "event":
+            events.append(view.pending_events[old_value])
+            continue
+
+        if (kind, key) in seen:
+            continue
+        seen.add((kind, key))
+
+        if kind == "total_supply":
+            deltas[None] = view.total_supply - old_value
+
+        elif kind in StateDB.ACCOUNT_KINDS and key in delta_accounts:
+            # Only balance credits commute; anything else runs serially
+            if kind != "balance":
+                raise SpeculationAbort(f"accounts:{key}")
+            deltas[key] = view.accounts.entries[key].balance - old_value
+
+        elif kind == "account":
+            writes[(kind, key)] = None
+
+        elif kind == "storage":
+            # Later transactions of the range update the storage in place
+            writes[(kind, key)] = dict(view._read(kind, key))
+
+        else:
+            writes[(kind, key)] = view._read(kind, key)
+
+    return writes, deltas, events
+
+class PendingWrites:
+    """Class collecting the writes of speculated transactions until they are applied."""
+
+    def __init__(self):
+        """Initialize a PendingWrites instance."""
+        self.writes: List[Iterator[Tuple[str, Any, Any]]] = []
+        self.deltas: Dict[Optional[str], int] = {}
+        self.events: List[Dict[str, Any]] = []
+
+    def add(self, results: SpeculativeRange, start: int, stop: int) -> None:
+        """
+        Add the writes of a run of transactions of a speculative range.
+
+        Args:
+            results: Speculative range
+            start: Offset of the first transaction of the run in the range
+            stop: Offset after the last transaction of the run
+        """
+        if start == stop:
+            return
+
+        self.writes.append(results.writes(start, stop))
+
+        for key, totals in results.deltas.items():
+            amount = totals[stop] - totals[start]
+            if amount:
+                self.deltas[key] = self.deltas.get(key, 0) + amount
+
+        if results.events:
+            first, last = results.event_offsets[start], results.event_offsets[stop]
+            self.events.extend(results.events[first:last])
+
+    def apply(self, state: StateDB) -> None:
+        """
+        Apply the collected writes to the state in one batch.
+
+        Args:
+            state: State database
+        """
+        state.apply_writes(itertools.chain.from_iterable(self.writes), self.deltas, self.events)
+
+        self.writes = []
+        self.deltas = {}
+        self.events = []
+
+class ParallelBlockExecutor:
+    """
+    Class applying blocks with optimistic parallel transaction execution.
+
+    Produces the same state and receipts as StateManager.apply_block. Each
+    worker speculates a contiguous range of the block against the state as
+    left by the pre-checks: forked worker processes share it copy-on-write,
+    thread workers read the live state. The coordinator then only checks read
+    sets and merges write sets, and applies runs of speculated transactions
+    to the state in one batch. Fee, stake and escrow credits are committed as
+    commutative balance deltas, so the accounts every transaction pays into
+    do not serialize the block.
+    """
+
+    def __init__(self, manager: StateManager, max_workers: int = None, use_processes: bool = None):
+        """
+        Initialize a ParallelBlockExecutor instance.
+
+        Args:
+            manager: State manager whose state blocks are applied to
+            max_workers: Number of workers (defaults to the CPU count)
+            use_processes: Whether to speculate in forked worker processes
+                rather than threads (defaults to processes, which sidestep the
+                GIL, where the platform can fork)
+        """
+        self.manager = manager
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        can_fork = "fork" in multiprocessing.get_all_start_methods()
+        self.use_processes = can_fork if use_processes is None else use_processes and can_fork
+        self.executor: Optional[Executor] = None
+
+        # Statistics of the last applied block (speculation_time is the CPU
+        # time the workers spent speculating, in seconds)
+        self.stats = {"transactions": 0, "speculated": 0, "reexecuted": 0, "speculation_time": 0.0}
+
+    def apply_block(self, block) -> List[Dict[str, Any]]:
+        """
+        Apply all transactions of a block to the state atomically.
+
+        Args:
+            block: Block whose transactions (Transaction instances or
+                dictionaries) are applied in order
+
+        Returns:
+            List of receipts, one per transaction in block order
+        """
+        manager = self.manager
+        state = manager.state
+
+        transactions = [manager._to_transaction(tx) for tx in block.transactions]
+        receipts = manager._create_receipts(block, transactions)
+        self.stats = {"transactions": len(transactions), "speculated": 0, "reexecuted": 0, "speculation_time": 0.0}
+
+        snapshot_id = manager.create_snapshot()
+
+        errors = manager._precheck_block(transactions)
+        if errors:
+            manager.revert_to_snapshot(snapshot_id)
+
+            for index, error in errors.items():
+                receipts[index]["status"] = ReceiptStatus.FAILED
+                receipts[index]["error"] = error
+            return receipts
+
+        # Speculate against the state as left by the pre-checks
+        delta_accounts = self._delta_accounts(transactions)
+        ranges = self._speculate(transactions, delta_accounts)
+        pending = PendingWrites()
+
+        # State entries the speculation of the current range cannot have seen:
+        # everything written before the range, and whatever re-executed
+        # transactions of the range wrote
+        written: Set[Tuple[str, str]] = set()
+
+        for results in ranges:
+            self.stats["speculation_time"] += results.elapsed
+            failures = sorted(results.failures)
+            offset = 0
+
+            # Reads are only scanned once the range is known to conflict; the
+            # scan position only moves forward
+            scanning = not written.isdisjoint(results.reads(0, len(results)))
+            scan = 0
+
+            while offset < len(results):
+                # Find the next transaction that cannot be committed as speculated
+                stop = failures[0] if failures else len(results)
+
+                if scanning:
+                    scan = max(scan, results.read_offsets[offset])
+                    tables, keys = results.read_tables, results.read_keys
+                    while scan < results.read_offsets[stop]:
+                        if (tables[scan], keys[scan]) in written:
+                            stop = bisect.bisect_right(results.read_offsets, scan) - 1
+                            break
+                        scan += 1
+
+                pending.add(results, offset, stop)
+                offset = stop
+
+                if offset == len(results):
+                    break
+
+                index = results.start + offset
+                error = results.failures.get(offset)
+                if failures and failures[0] == offset:
+                    failures.pop(0)
+
+                if error is not None and written.isdisjoint(results.reads(offset, offset + 1)):
+                    # The speculation saw the right state, so the failure is real
+                    success = False
+                else:
+                    # Execute for real on top of everything committed before it
+                    self.stats["reexecuted"] += 1
+                    pending.apply(state)
+                    position = len(state.journal)
+
+                    try:
+                        success = manager.handlers[transactions[index].tx_type](transactions[index])
+                        error = None if success else "rejected by state"
+                    except Exception as e:
+                        success = False
+                        error = str(e)
+
+                    # The rest of the range saw the speculated writes instead
+                    written.update(written_entry(kind, key) for kind, key, _ in state.journal.entries[position:])
+                    written.update(results.written_entries(offset, offset + 1))
+                    written.discard(None)
+                    scanning = True
+
+                if not success:
+                    ranges.close()
+                    manager.revert_to_snapshot(snapshot_id)
+
+                    for receipt in receipts[:index]:
+                        receipt["status"] = ReceiptStatus.REVERTED
+
+                    receipts[index]["status"] = ReceiptStatus.FAILED
+                    receipts[index]["error"] = error
+                    return receipts
+
+                offset += 1
+
+            written.update(zip(results.written_tables, results.written_keys))
+
+        pending.apply(state)
+
+        for receipt in receipts:
+            receipt["status"] = ReceiptStatus.APPLIED
+        self.stats["speculated"] = len(transactions) - self.stats["reexecuted"]
+
+        manager._finish_block(block, snapshot_id)
+
+        return receipts
+
+    def start(self) -> None:
+        """
+        Start the thread pool (it is otherwise started by the first block).
+
+        Worker processes are forked for every block instead, so that they
+        share the state the block is speculated against.
+        """
+        if self.executor is None and self.max_workers > 1 and not self.use_processes:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def close(self) -> None:
+        """Shut down the thread pool."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def _delta_accounts(self, transactions: List[Transaction]) -> Set[str]:
+        """
+        Find the pool accounts whose credits can be applied as deltas.
+
+        An account qualifies if it already exists and no transaction of the
+        block bases a decision on its balance.
+
+        Args:
+            transactions: Transactions of the block
+
+        Returns:
+            Set of addresses
+        """
+        candidates = {
+            address
+            for address in (StateManager.FEE_RECIPIENT, StateManager.STAKE_ADDRESS, StateManager.TASK_ESCROW)
+            if address in self.manager.state.accounts
+        }
+
+        for tx in transactions:
+            candidates.discard(tx.from_address)
+
+            if tx.tx_type == TransactionType.COINBASE:
+                candidates.discard(tx.to_address)
+            elif tx.tx_type in (TransactionType.UNSTAKE, TransactionType.VALIDATOR_UNREGISTER):
+                candidates.discard(StateManager.STAKE_ADDRESS)
+            elif tx.tx_type == TransactionType.TASK_RESULT:
+                candidates.discard(StateManager.TASK_ESCROW)
+
+        return candidates
+
+    def _speculate(self, transactions: List[Transaction], delta_accounts: Set[str]) -> Iterator[SpeculativeRange]:
+        """
+        Run speculative execution of all transactions in ranges.
+
+        The block is split into several ranges per worker, which are yielded in
+        block order as they complete, so that committing the first ranges
+        overlaps with speculating the later ones.
+
+        Args:
+            transactions: Transactions of the block
+            delta_accounts: Accounts whose balances are applied as deltas
+
+        Returns:
+            Iterator over the speculative ranges in block order
+        """
+        global _forked_block
+
+        state = self.manager.state
+
+        # Threads cannot share the connection of a disk-backed state
+        if self.max_workers <= 1 or len(transactions) < 2 or (not self.use_processes and state.store is not None):
+            yield execute_speculative(state, transactions, delta_accounts, 0, len(transactions))
+            return
+
+        size = max(-(-len(transactions) // (self.max_workers * RANGES_PER_WORKER)), MIN_RANGE_SIZE)
+        bounds = [(start, min(start + size, len(transactions))) for start in range(0, len(transactions), size)]
+
+        if not self.use_processes:
+            self.start()
+            futures = [
+                self.executor.submit(execute_speculative, state, transactions, delta_accounts, start, stop)
+                for start, stop in bounds
+            ]
+
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+            return
+
+        with _fork_lock:
+            # Workers forked now inherit the block instead of receiving it pickled
+            _forked_block = (state, transactions, delta_accounts)
+
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(bounds)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_start_forked_worker
+            )
+
+            try:
+                futures = [executor.submit(_execute_forked, start, stop) for start, stop in bounds]
+                for future in futures:
+                    yield future.result()
+            finally:
+                # A failed block stops consuming ranges early
+                executor.shutdown(cancel_futures=True)
+                _forked_block = None
+
+    def __enter__(self) -> 'ParallelBlockExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+# Block speculated by forked workers: (state, transactions, delta accounts)
+_forked_block: Optional[Tuple[StateDB, List[Transaction], Set[str]]] = None
+_fork_lock = threading.Lock()
+
+# Database connections inherited from the parent; never used, never closed
+_inherited_connections = []
+
+def _start_forked_worker() -> None:
+    """Give a forked worker its own connection to a disk-backed state."""
+    store = _forked_block[0].store
+
+    if store is not None:
+        _inherited_connections.append(store.connection)
+        store.connection = sqlite3.connect(store.path)
+
+def _execute_forked(start: int, stop: int) -> List[Optional[Tuple]]:
+    """
+    Execute a range of the block inherited by a forked worker speculatively.
+
+    Args:
+        start: Index of the first transaction of the range
+        stop: Index after the last transaction of the range
+
+    Returns:
+        Speculative results (see execute_speculative)
+    """
+    state, transactions, delta_accounts = _forked_block
+    return execute_speculative(state, transactions, delta_accounts, start, stop)
@@ -0,0 +1,566 @@
+"""
+Snapshot Module for Synergy Network
+
+This module implements the chunked binary snapshot format used to checkpoint
+the state. Entries are streamed into fixed-size chunks, so writing never holds
+more than one chunk in memory, and snapshots are read through a memory map so
+that single entries or key ranges can be loaded without decoding the rest.
+
+Layout (all integers little-endian):
+    header  magic, version, chunk count, index offset/length, index checksum
+    chunks  records of one section each: u32 key length, key, u32 value length, value
+    index   per chunk: section, record count, offset, length, SHA-256, first/last key
+
+Keys inside a section are written in sorted order, so the first and last key
+of each chunk locate an entry with a binary search over the index.
+"""
+
+import bisect
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable, Tuple
+
+MAGIC = b"SYNSNAP\x00"
+VERSION = 1
+
+# Sections of a state snapshot
+SECTION_META = 0
+SECTION_ACCOUNTS = 1
+SECTION_TASKS = 2
+SECTION_CLUSTERS = 3
+
+HEADER = struct.Struct("<8sHHIQQ32s")
+INDEX_ENTRY = struct.Struct("<BIQI32sHH")
+LENGTH = struct.Struct("<I")
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+class SnapshotError(Exception):
+    """Exception raised for malformed or corrupted snapshots."""
+    pass
+
+class ChunkInfo:
+    """Class describing a chunk in the snapshot index."""
+
+    __slots__ = ("section", "count", "offset", "length", "checksum", "first_key", "last_key")
+
+    def __init__(self, section: int, count: int, offset: int, length: int, checksum: bytes, first_key: str, last_key: str):
+        """
+        Initialize a ChunkInfo instance.
+
+        Args:
+            section: Section the chunk belongs to
+            count: Number of records in the chunk
+            offset: Offset of the chunk in the file
+            length: Length of the chunk in bytes
+            checksum: SHA-256 of the chunk
+            first_key: First key in the chunk
+            last_key: Last key in the chunk
+        """
+        self.section = section
+        self.count = count
+        self.offset = offset
+        self.length = length
+        self.checksum = checksum
+        self.first_key = first_key
+        self.last_key = last_key
+
+class SnapshotWriter:
+    """Class streaming records into a snapshot file."""
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize a SnapshotWriter instance.
+
+        The snapshot is written to a temporary file that replaces `path` on
+        close, so an interrupted checkpoint never leaves a truncated snapshot.
+
+        Args:
+            path: Path of the snapshot file
+            chunk_size: Target chunk size in bytes
+        """
+        self.path = path
+        self.temp_path = path + ".tmp"
+        self.chunk_size = chunk_size
+        self.file = open(self.temp_path, "wb")
+        self.file.write(bytes(HEADER.size))
+        self.index: List[ChunkInfo] = []
+
+        # Current chunk
+        self.section: Optional[int] = None
+        self.buffer = bytearray()
+        self.count = 0
+        self.first_key: Optional[str] = None
+        self.last_key: Optional[str] = None
+
+    def add(self, section: int, key: str, value: bytes) -> None:
+        """
+        Add a record to the snapshot.
+
+        Records of a section must be added in ascending key order.
+
+        Args:
+            section: Section of the record
+            key: Record key
+            value: Encoded record value
+        """
+        if section != self.section or len(self.buffer) >= self.chunk_size:
+            self._flush_chunk()
+            self.section = section
+            self.first_key = key
+
+        encoded_key = key.encode("utf-8")
+        self.buffer += LENGTH.pack(len(encoded_key))
+        self.buffer += encoded_key
+        self.buffer += LENGTH.pack(len(value))
+        self.buffer += value
+        self.count += 1
+        self.last_key = key
+
+    def write(self, records: Iterable[Tuple[int, str, bytes]]) -> int:
+        """
+        Add records from an iterable, typically a generator.
+
+        Args:
+            records: Iterable of (section, key, value) tuples
+
+        Returns:
+            Number of records written
+        """
+        written = 0
+        for section, key, value in records:
+            self.add(section, key, value)
+            written += 1
+        return written
+
+    def close(self) -> None:
+        """Write the index and header and move the snapshot into place."""
+        self._flush_chunk()
+
+        index = bytearray()
+        for chunk in self.index:
+            first_key = chunk.first_key.encode("utf-8")
+            last_key = chunk.last_key.encode("utf-8")
+            index += INDEX_ENTRY.pack(
+                chunk.section, chunk.count, chunk.offset, chunk.length,
+                chunk.checksum, len(first_key), len(last_key)
+            )
+            index += first_key + last_key
+
+        index_offset = self.file.tell()
+        self.file.write(index)
+
+        self.file.seek(0)
+        self.file.write(HEADER.pack(
+            MAGIC, VERSION, 0, len(self.index), index_offset, len(index),
+            hashlib.sha256(index).digest()
+        ))
+
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the partially written snapshot."""
+        self.file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+    def _flush_chunk(self) -> None:
+        """Write the current chunk and add it to the index."""
+        if not self.count:
+            return
+
+        self.index.append(ChunkInfo(
+            self.section, self.count, self.file.tell(), len(self.buffer),
+            hashlib.sha256(self.buffer).digest(), self.first_key, self.last_key
+        ))
+        self.file.write(self.buffer)
+
+        self.buffer = bytearray()
+        self.count = 0
+
+    def __enter__(self) -> 'SnapshotWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class SnapshotReader:
+    """Class reading a snapshot file through a memory map."""
+
+    def __init__(self, path: str, verify: bool = True, cache_chunks: int = 8):
+        """
+        Initialize a SnapshotReader instance.
+
+        Only the header and index are read upfront; chunks are decoded on demand.
+
+        Args:
+            path: Path of the snapshot file
+            verify: Whether to check chunk checksums when chunks are decoded
+            cache_chunks: Number of decoded chunks kept in memory
+        """
+        self.path = path
+        self.verify = verify
+        self.cache_chunks = max(cache_chunks, 1)
+        self.cache: OrderedDict = OrderedDict()
+
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise SnapshotError("snapshot file is empty")
+
+        if len(self.map) < HEADER.size:
+            self.close()
+            raise SnapshotError("snapshot file is truncated")
+
+        magic, version, _, chunk_count, index_offset, index_length, index_checksum = HEADER.unpack_from(self.map, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise SnapshotError("not a snapshot file")
+
+        if version != VERSION:
+            self.close()
+            raise SnapshotError(f"unsupported snapshot version {version}")
+
+        index = self.map[index_offset:index_offset + index_length]
+        if len(index) != index_length or hashlib.sha256(index).digest() != index_checksum:
+            self.close()
+            raise SnapshotError("snapshot index is corrupted")
+
+        self.chunks: List[ChunkInfo] = []
+        position = 0
+
+        for _ in range(chunk_count):
+            section, count, offset, length, checksum, first_length, last_length = INDEX_ENTRY.unpack_from(index, position)
+            position += INDEX_ENTRY.size
+            first_key = index[position:position + first_length].decode("utf-8")
+            position += first_length
+            last_key = index[position:position + last_length].decode("utf-8")
+            position += last_length
+
+            self.chunks.append(ChunkInfo(section, count, offset, length, checksum, first_key, last_key))
+
+        # Chunk positions and first keys per section for binary searches
+        self.sections: Dict[int, List[int]] = {}
+        for position, chunk in enumerate(self.chunks):
+            self.sections.setdefault(chunk.section, []).append(position)
+
+        self.first_keys = {
+            section: [self.chunks[position].first_key for position in positions]
+            for section, positions in self.sections.items()
+        }
+
+    def count(self, section: int) -> int:
+        """
+        Count the records of a section.
+
+        Args:
+            section: Section to count
+
+        Returns:
+            Number of records
+        """
+        return sum(self.chunks[position].count for position in self.sections.get(section, []))
+
+    def get(self, section: int, key: str) -> Optional[bytes]:
+        """
+        Get the encoded value of a record.
+
+        Args:
+            section: Section of the record
+            key: Record key
+
+        Returns:
+            Encoded value or None if not found
+        """
+        position = self._find_chunk(section, key)
+        if position is None:
+            return None
+
+        return self._decode_chunk(position).get(key)
+
+    def contains(self, section: int, key: str) -> bool:
+        """
+        Check whether a section holds a key.
+
+        Args:
+            section: Section to search
+            key: Record key
+
+        Returns:
+            True if the key exists, False otherwise
+        """
+        return self.get(section, key) is not None
+
+    def keys(self, section: int) -> Iterator[str]:
+        """
+        Iterate over the keys of a section in key order.
+
+        Args:
+            section: Section to iterate
+
+        Returns:
+            Iterator of keys
+        """
+        for key, _ in self.items(section):
+            yield key
+
+    def items(self, section: int, start: str = None, end: str = None) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over the records of a section in key order.
+
+        Chunks entirely outside [start, end) are skipped without being read.
+
+        Args:
+            section: Section to iterate
+            start: Smallest key to include (unbounded if None)
+            end: Key at which to stop (unbounded if None)
+
+        Returns:
+            Iterator of (key, encoded value) tuples
+        """
+        for position in self.sections.get(section, []):
+            chunk = self.chunks[position]
+
+            if start is not None and chunk.last_key < start:
+                continue
+            if end is not None and chunk.first_key >= end:
+                break
+
+            for key, value in self._iter_records(position):
+                if start is not None and key < start:
+                    continue
+                if end is not None and key >= end:
+                    return
+                yield key, value
+
+    def chunks_of(self, section: int) -> Iterator[List[Tuple[str, bytes]]]:
+        """
+        Iterate over the records of a section one chunk at a time.
+
+        Args:
+            section: Section to iterate
+
+        Returns:
+            Iterator of lists of (key, encoded value) tuples
+        """
+        for position in self.sections.get(section, []):
+            yield list(self._iter_records(position))
+
+    def verify_all(self) -> bool:
+        """
+        Check the checksums of all chunks.
+
+        Returns:
+            True if every chunk is intact, False otherwise
+        """
+        for chunk in self.chunks:
+            data = self.map[chunk.offset:chunk.offset + chunk.length]
+            if hashlib.sha256(data).digest() != chunk.checksum:
+                return False
+        return True
+
+    def close(self) -> None:
+        """Close the memory map and the file."""
+        self.cache.clear()
+        if getattr(self, "map", None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def _find_chunk(self, section: int, key: str) -> Optional[int]:
+        """
+        Find the chunk that can hold a key.
+
+        Args:
+            section: Section to search
+            key: Record key
+
+        Returns:
+            Chunk position or None if no chunk can hold the key
+        """
+        first_keys = self.first_keys.get(section)
+        if not first_keys:
+            return None
+
+        slot = bisect.bisect_right(first_keys, key) - 1
+        if slot < 0:
+            return None
+
+        position = self.sections[section][slot]
+        if key > self.chunks[position].last_key:
+            return None
+
+        return position
+
+    def _iter_records(self, position: int) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over the records of a chunk.
+
+        Args:
+            position: Chunk position in the index
+
+        Returns:
+            Iterator of (key, encoded value) tuples
+        """
+        chunk = self.chunks[position]
+        data = self.map[chunk.offset:chunk.offset + chunk.length]
+
+        if self.verify and hashlib.sha256(data).digest() != chunk.checksum:
+            raise SnapshotError(f"checksum mismatch in chunk {position}")
+
+        offset = 0
+        for _ in range(chunk.count):
+            (key_length,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            key = data[offset:offset + key_length].decode("utf-8")
+            offset += key_length
+
+            (value_length,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            value = data[offset:offset + value_length]
+            offset += value_length
+
+            yield key, value
+
+    def _decode_chunk(self, position: int) -> Dict[str, bytes]:
+        """
+        Decode a chunk into a dictionary, using the chunk cache.
+
+        Args:
+            position: Chunk position in the index
+
+        Returns:
+            Dictionary mapping keys to encoded values
+        """
+        if position in self.cache:
+            self.cache.move_to_end(position)
+            return self.cache[position]
+
+        records = dict(self._iter_records(position))
+        self.cache[position] = records
+
+        while len(self.cache) > self.cache_chunks:
+            self.cache.popitem(last=False)
+
+        return records
+
+    def __enter__(self) -> 'SnapshotReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class SnapshotMapping(MutableMapping):
+    """
+    Mapping over a snapshot section that loads entries on first access.
+
+    Loaded entries are kept (they may be modified in place); entries that were
+    never accessed stay in the memory-mapped snapshot.
+    """
+
+    def __init__(self, reader: SnapshotReader, section: int, decode: Callable[[str, bytes], Any]):
+        """
+        Initialize a SnapshotMapping instance.
+
+        Args:
+            reader: Snapshot reader
+            section: Section holding the entries
+            decode: Function decoding a (key, encoded value) record
+        """
+        self.reader = reader
+        self.section = section
+        self.decode = decode
+        self.loaded: Dict[str, Any] = {}
+        self.added: set = set()
+        self.deleted: set = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.loaded:
+            return self.loaded[key]
+
+        if key in self.deleted:
+            raise KeyError(key)
+
+        encoded = self.reader.get(self.section, key)
+        if encoded is None:
+            raise KeyError(key)
+
+        value = self.decode(key, encoded)
+        self.loaded[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self.deleted:
+            self.deleted.discard(key)
+        elif key not in self.loaded and not self.reader.contains(self.section, key):
+            self.added.add(key)
+
+        self.loaded[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self.loaded.pop(key, None)
+        if key in self.added:
+            self.added.discard(key)
+        else:
+            self.deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.loaded:
+            return True
+
+        if key in self.deleted:
+            return False
+
+        return self.reader.contains(self.section, key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.reader.keys(self.section):
+            if key not in self.deleted:
+                yield key
+
+        # Entries that only exist in memory
+        yield from sorted(self.added)
+
+    def __len__(self) -> int:
+        return self.reader.count(self.section) - len(self.deleted) + len(self.added)
+
+    def records(self, encode: Callable[[str, Any], bytes]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over the encoded entries in key order without loading them.
+
+        Entries that were never accessed are passed through as stored in the
+        snapshot; only loaded entries, which may have been modified, are
+        encoded again.
+
+        Args:
+            encode: Function encoding a (key, value) entry
+
+        Returns:
+            Iterator of (key, encoded value) tuples
+        """
+        stored = (
+            (key, value) for key, value in self.reader.items(self.section)
+            if key not in self.deleted and key not in self.loaded
+        )
+        loaded = ((key, None) for key in sorted(self.loaded))
+
+        for key, value in heapq.merge(stored, loaded, key=lambda record: record[0]):
+            yield key, encode(key, self.loaded[key]) if value is None else value
@@ -7,16 +7,53 @@ handling account balances, nonces, smart contracts, and validator information.
 
 import json
 import copy
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable, Iterator, Callable
 import sys
 import os
 
 # Add parent directory to path to import from other packages
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
 from implementation.cryptography.pqc.address import AddressGenerator
+from implementation.core.state.journal import StateJournal, MISSING
+from implementation.core.state.storage import StateStore, PagedMapping
+from implementation.core.state.trie import StateTrie
+from implementation.core.state.changeset import StateChangeset, account_fields
+from implementation.core.state.indexes import StateIndexes
+from implementation.core.state.eventlog import EventLog
+from implementation.core.state.snapshot import (
+    SnapshotWriter, SnapshotReader, SnapshotMapping, DEFAULT_CHUNK_SIZE, MAGIC,
+    SECTION_META, SECTION_ACCOUNTS, SECTION_TASKS, SECTION_CLUSTERS
+)
+from implementation.core.transaction.transaction import Transaction, TransactionType
+
+class FrozenEmptyDict(dict):
+    """Empty dictionary that refuses in-place modification."""
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("empty account container is read-only; assign a new dict instead")
+    
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+# Shared stand-in for the storage and validator data of accounts that have none
+EMPTY_DICT = FrozenEmptyDict()
 
 class Account:
-    """Class representing an account in the Synergy Network state."""
+    """
+    Class representing an account in the Synergy Network state.
+    
+    Accounts use __slots__ and only allocate storage and validator data
+    containers for contracts and validators; every other account shares a
+    read-only empty dictionary. Measured with
+    implementation/benchmarks/bench_account_memory.py (CPython 3.11, 64-bit,
+    including the 66-character address and the accounts dict entry), an
+    externally owned account takes about 265 bytes: 253 MiB for 1M accounts
+    and 2.4 GiB for 10M accounts. The previous layout, with a per-instance
+    __dict__ and two empty dicts, took about 440 bytes (421 MiB for 1M
+    accounts, about 4.1 GiB for 10M).
+    """
+    
+    __slots__ = ("address", "balance", "nonce", "code", "is_validator", "_storage", "_validator_data")
     
     def __init__(
         self,
@@ -44,9 +81,51 @@ class Account:
         self.balance = balance
         self.nonce = nonce
         self.code = code
-        self.storage = storage or {}
+        self.storage = storage
         self.is_validator = is_validator
-        self.validator_data = validator_data or {}
+        self.validator_data = validator_data
+    
+    @property
+    def storage(self) -> Dict[str, Any]:
+        """Smart contract storage (read-only when empty; use set_storage_slot)."""
+        return self._storage if self._storage is not None else EMPTY_DICT
+    
+    @storage.setter
+    def storage(self, storage: Optional[Dict[str, Any]]) -> None:
+        self._storage = storage if storage else None
+    
+    @property
+    def validator_data(self) -> Dict[str, Any]:
+        """Validator-specific data (read-only when empty)."""
+        return self._validator_data if self._validator_data is not None else EMPTY_DICT
+    
+    @validator_data.setter
+    def validator_data(self, validator_data: Optional[Dict[str, Any]]) -> None:
+        self._validator_data = validator_data if validator_data else None
+    
+    def set_storage_slot(self, key: str, value: Any) -> None:
+        """
+        Set a contract storage slot, allocating the storage if needed.
+        
+        Args:
+            key: Storage key
+            value: Storage value
+        """
+        if self._storage is None:
+            self._storage = {}
+        self._storage[key] = value
+    
+    def delete_storage_slot(self, key: str) -> None:
+        """
+        Delete a contract storage slot if it exists.
+        
+        Args:
+            key: Storage key
+        """
+        if self._storage is not None:
+            self._storage.pop(key, None)
+            if not self._storage:
+                self._storage = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -60,9 +139,9 @@ class Account:
             "balance": self.balance,
             "nonce": self.nonce,
             "code": self.code,
-            "storage": self.storage,
+            "storage": self._storage if self._storage is not None else {},
             "is_validator": self.is_validator,
-            "validator_data": self.validator_data
+            "validator_data": self._validator_data if self._validator_data is not None else {}
         }
     
     @classmethod
@@ -86,6 +165,26 @@ class Account:
             validator_data=data.get("validator_data", {})
         )
     
+    def copy(self) -> 'Account':
+        """
+        Copy the account.
+        
+        Validator data is replaced rather than mutated, so only contract
+        storage, which is updated in place, gets its own copy.
+        
+        Returns:
+            Account instance
+        """
+        account = Account.__new__(Account)
+        account.address = self.address
+        account.balance = self.balance
+        account.nonce = self.nonce
+        account.code = self.code
+        account.is_validator = self.is_validator
+        account._storage = dict(self._storage) if self._storage is not None else None
+        account._validator_data = self._validator_data
+        return account
+    
     def is_contract(self) -> bool:
         """
         Check if the account is a smart contract.
@@ -98,13 +197,63 @@ class Account:
 class StateDB:
     """Class for managing the state database of the Synergy Network."""
     
-    def __init__(self):
-        """Initialize a StateDB instance."""
-        self.accounts: Dict[str, Account] = {}
-        self.validators: Set[str] = set()
-        self.total_supply: int = 0
-        self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.clusters: Dict[str, Dict[str, Any]] = {}
+    # Journal kinds whose key (or first key element) is an account address
+    ACCOUNT_KINDS = {"account", "balance", "nonce", "code", "storage", "validator"}
+    
+    def __init__(self, store: StateStore = None, cache_size: int = 100000):
+        """
+        Initialize a StateDB instance.
+        
+        Args:
+            store: Persistent backend (keeps all state in memory if None)
+            cache_size: Maximum number of clean entries cached per table
+                (only used with a persistent backend)
+        """
+        self.store = store
+        self.journal = StateJournal()
+        self.touched: Set[Tuple[str, Any]] = set()
+        self.meta_dirty = False
+        
+        # Secondary indexes, built on first query
+        self.indexes: Optional[StateIndexes] = None
+        
+        # Contract events emitted since the last commit (moved to the event log on commit)
+        self.pending_events: List[Dict[str, Any]] = []
+        
+        if store is None:
+            self.accounts: Dict[str, Account] = {}
+            self.validators: Set[str] = set()
+            self.total_supply: int = 0
+            self.tasks: Dict[str, Dict[str, Any]] = {}
+            self.clusters: Dict[str, Dict[str, Any]] = {}
+        else:
+            self.accounts = PagedMapping(
+                store, "accounts",
+                lambda account: json.dumps(account.to_dict()),
+                lambda data: Account.from_dict(json.loads(data)),
+                cache_size
+            )
+            self.tasks = PagedMapping(store, "tasks", json.dumps, json.loads, cache_size)
+            self.clusters = PagedMapping(store, "clusters", json.dumps, json.loads, cache_size)
+            self.validators = set(store.get_meta("validators", []))
+            self.total_supply = store.get_meta("total_supply", 0)
+    
+    @classmethod
+    def open(cls, path: str, cache_size: int = 100000) -> 'StateDB':
+        """
+        Open a disk-backed state database.
+        
+        Only metadata and the validator set are loaded eagerly; accounts,
+        tasks and clusters are paged in on first access.
+        
+        Args:
+            path: Path of the database file
+            cache_size: Maximum number of clean entries cached per table
+        
+        Returns:
+            StateDB instance
+        """
+        return cls(store=StateStore(path), cache_size=cache_size)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -117,8 +266,8 @@ class StateDB:
             "accounts": {addr: account.to_dict() for addr, account in self.accounts.items()},
             "validators": list(self.validators),
             "total_supply": self.total_supply,
-            "tasks": self.tasks,
-            "clusters": self.clusters
+            "tasks": dict(self.tasks),
+            "clusters": dict(self.clusters)
         }
     
     @classmethod
@@ -163,10 +312,14 @@ class StateDB:
         Returns:
             Account instance
         """
-        if address not in self.accounts:
-            self.accounts[address] = Account(address=address)
+        account = self.accounts.get(address)
         
-        return self.accounts[address]
+        if account is None:
+            account = Account(address=address)
+            self.accounts[address] = account
+            self._record("account", address, MISSING)
+        
+        return account
     
     def get_balance(self, address: str) -> int:
         """
@@ -196,6 +349,9 @@ class StateDB:
         
         account = self.get_account(address)
         
+        self._record("balance", address, account.balance)
+        self._record("total_supply", None, self.total_supply)
+        
         # Update total supply
         self.total_supply = self.total_supply - account.balance + balance
         
@@ -226,6 +382,9 @@ class StateDB:
         
         to_account = self.get_account(to_address)
         
+        self._record("balance", from_address, from_account.balance)
+        self._record("balance", to_address, to_account.balance)
+        
         # Update balances
         from_account.balance -= amount
         to_account.balance += amount
@@ -255,6 +414,7 @@ class StateDB:
             New nonce value
         """
         account = self.get_account(address)
+        self._record("nonce", address, account.nonce)
         account.nonce += 1
         return account.nonce
     
@@ -279,6 +439,9 @@ class StateDB:
         if account.code:
             return False
         
+        self._record("code", address, account.code)
+        self._record("storage", address, account.storage)
+        
         # Set contract code and storage
         account.code = code
         account.storage = initial_storage or {}
@@ -320,7 +483,26 @@ class StateDB:
         if not account.is_contract():
             return False
         
-        account.storage[key] = value
+        self._record("storage_slot", (address, key), account.storage.get(key, MISSING))
+        account.set_storage_slot(key, value)
+        return True
+    
+    def emit_event(self, event: Dict[str, Any]) -> bool:
+        """
+        Emit a contract event.
+        
+        Events are kept out of contract storage; they stay pending (and can be
+        reverted with a snapshot) until the state manager commits them to its
+        event log.
+        
+        Args:
+            event: Event data including the "contract" address
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        self._record("event", None, len(self.pending_events))
+        self.pending_events.append(event)
         return True
     
     def register_validator(self, address: str, validator_data: Dict[str, Any]) -> bool:
@@ -336,12 +518,16 @@ class StateDB:
         """
         account = self.get_account(address)
         
+        self._record("validator", address, (account.is_validator, account.validator_data))
+        self._record("validator_set", address, address in self.validators)
+        
         # Update validator status
         account.is_validator = True
         account.validator_data = validator_data
         
         # Add to validators set
         self.validators.add(address)
+        self._reindex("validator_set", address)
         
         return True
     
@@ -360,11 +546,41 @@ class StateDB:
         
         account = self.get_account(address)
         
+        self._record("validator", address, (account.is_validator, account.validator_data))
+        self._record("validator_set", address, True)
+        
         # Update validator status
         account.is_validator = False
         
         # Remove from validators set
         self.validators.remove(address)
+        self._reindex("validator_set", address)
+        
+        return True
+    
+    def set_validator_stake(self, address: str, stake_amount: int) -> bool:
+        """
+        Set the stake amount recorded for a validator.
+        
+        Args:
+            address: Validator address
+            stake_amount: New stake amount
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if address not in self.validators or stake_amount < 0:
+            return False
+        
+        account = self.get_account(address)
+        
+        self._record("validator", address, (account.is_validator, account.validator_data))
+        
+        # Replace rather than mutate so journaled data stays intact
+        validator_data = dict(account.validator_data)
+        validator_data["stake_amount"] = stake_amount
+        account.validator_data = validator_data
+        self._reindex("validator", address)
         
         return True
     
@@ -383,6 +599,80 @@ class StateDB:
         
         return validators_list
     
+    def get_validators_by_stake(self, limit: int = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get validators ordered by stake, highest first.
+        
+        Args:
+            limit: Maximum number of validators (all if None)
+        
+        Returns:
+            List of (address, validator_data) tuples
+        """
+        return [
+            (address, self.get_account(address).validator_data)
+            for address, _ in self.get_indexes().validators_by_stake.top(limit)
+        ]
+    
+    def get_tasks_by_status(self, status: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get all tasks with a status.
+        
+        Args:
+            status: Task status (e.g. "pending")
+        
+        Returns:
+            List of (task_id, task_data) tuples ordered by task ID
+        """
+        return [(task_id, self.tasks[task_id]) for task_id in self.get_indexes().tasks_by_status.get(status)]
+    
+    def get_tasks_by_submitter(self, submitter: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get all tasks submitted by an address.
+        
+        Args:
+            submitter: Submitter address
+        
+        Returns:
+            List of (task_id, task_data) tuples ordered by task ID
+        """
+        return [(task_id, self.tasks[task_id]) for task_id in self.get_indexes().tasks_by_submitter.get(submitter)]
+    
+    def get_clusters_by_status(self, status: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get all clusters with a status.
+        
+        Args:
+            status: Cluster status (e.g. "ACTIVE")
+        
+        Returns:
+            List of (cluster_id, cluster_data) tuples ordered by cluster ID
+        """
+        return [(cluster_id, self.clusters[cluster_id]) for cluster_id in self.get_indexes().clusters_by_status.get(status)]
+    
+    def get_indexes(self) -> StateIndexes:
+        """
+        Get the secondary indexes, building them from a full scan on first use.
+        
+        Returns:
+            StateIndexes instance
+        """
+        if self.indexes is None:
+            self.indexes = StateIndexes.build(self)
+        
+        return self.indexes
+    
+    def _reindex(self, kind: str, key: Any) -> None:
+        """
+        Update the secondary indexes after an item changed.
+        
+        Args:
+            kind: Kind of the changed item
+            key: Key of the changed item
+        """
+        if self.indexes is not None:
+            self.indexes.update(self, kind, key)
+    
     def add_task(self, task_id: str, task_data: Dict[str, Any]) -> bool:
         """
         Add a task to the state.
@@ -397,7 +687,9 @@ class StateDB:
         if task_id in self.tasks:
             return False
         
+        self._record("task", task_id, MISSING)
         self.tasks[task_id] = task_data
+        self._reindex("task", task_id)
         return True
     
     def update_task(self, task_id: str, task_data: Dict[str, Any]) -> bool:
@@ -414,7 +706,9 @@ class StateDB:
         if task_id not in self.tasks:
             return False
         
+        self._record("task", task_id, self.tasks[task_id])
         self.tasks[task_id] = task_data
+        self._reindex("task", task_id)
         return True
     
     def remove_task(self, task_id: str) -> bool:
@@ -430,7 +724,9 @@ class StateDB:
         if task_id not in self.tasks:
             return False
         
+        self._record("task", task_id, self.tasks[task_id])
         del self.tasks[task_id]
+        self._reindex("task", task_id)
         return True
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -459,7 +755,9 @@ class StateDB:
         if cluster_id in self.clusters:
             return False
         
+        self._record("cluster", cluster_id, MISSING)
         self.clusters[cluster_id] = cluster_data
+        self._reindex("cluster", cluster_id)
         return True
     
     def update_cluster(self, cluster_id: str, cluster_data: Dict[str, Any]) -> bool:
@@ -476,7 +774,9 @@ class StateDB:
         if cluster_id not in self.clusters:
             return False
         
+        self._record("cluster", cluster_id, self.clusters[cluster_id])
         self.clusters[cluster_id] = cluster_data
+        self._reindex("cluster", cluster_id)
         return True
     
     def remove_cluster(self, cluster_id: str) -> bool:
@@ -492,7 +792,9 @@ class StateDB:
         if cluster_id not in self.clusters:
             return False
         
+        self._record("cluster", cluster_id, self.clusters[cluster_id])
         del self.clusters[cluster_id]
+        self._reindex("cluster", cluster_id)
         return True
     
     def get_cluster(self, cluster_id: str) -> Optional[Dict[str, Any]]:
@@ -507,6 +809,381 @@ class StateDB:
         """
         return self.clusters.get(cluster_id)
     
+    def create_snapshot(self) -> int:
+        """
+        Create a snapshot of the current state.
+        
+        Snapshots are journal checkpoints: creating one is O(1) and reverting
+        one only undoes the keys touched since it was taken.
+        
+        Returns:
+            Snapshot ID (index)
+        """
+        return self.journal.checkpoint()
+    
+    def revert_to_snapshot(self, snapshot_id: int) -> bool:
+        """
+        Revert to a previous snapshot, discarding it and all later snapshots.
+        
+        Args:
+            snapshot_id: Snapshot ID to revert to
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.journal.revert(snapshot_id, self._restore)
+    
+    def discard_snapshot(self, snapshot_id: int) -> bool:
+        """
+        Discard a snapshot and all later snapshots, keeping their changes.
+        
+        Args:
+            snapshot_id: Snapshot ID to discard
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.journal.discard(snapshot_id)
+    
+    def commit(self) -> None:
+        """Make all changes permanent, drop every snapshot and flush to disk."""
+        self.journal.commit()
+        self.touched = set()
+        self.flush()
+    
+    def flush(self) -> int:
+        """
+        Write all dirty entries to the persistent backend in one batch.
+        
+        Returns:
+            Number of entries written (0 for an in-memory state)
+        """
+        if self.store is None:
+            return 0
+        
+        written = self.accounts.flush() + self.tasks.flush() + self.clusters.flush()
+        
+        if self.meta_dirty:
+            self.store.set_meta("validators", sorted(self.validators))
+            self.store.set_meta("total_supply", self.total_supply)
+            self.meta_dirty = False
+            written += 1
+        
+        self.store.commit()
+        return written
+    
+    def close(self) -> None:
+        """Flush pending changes and close the persistent backend."""
+        if self.store is not None:
+            self.flush()
+            self.store.close()
+            self.store = None
+    
+    def _record(self, kind: str, key: Any, old_value: Any) -> None:
+        """
+        Record a mutation in the journal and mark the entry dirty.
+        
+        Args:
+            kind: Kind of the mutated item
+            key: Key of the mutated item
+            old_value: Value before the mutation, or MISSING
+        """
+        self.journal.record(kind, key, old_value)
+        self.touched.add((kind, key))
+        
+        if self.store is not None:
+            self._mark_dirty(kind, key)
+    
+    def _mark_dirty(self, kind: str, key: Any) -> None:
+        """
+        Mark the persistent entry holding an item as dirty.
+        
+        Args:
+            kind: Kind of the item
+            key: Key of the item
+        """
+        if kind in self.ACCOUNT_KINDS:
+            self.accounts.mark_dirty(key)
+        elif kind == "storage_slot":
+            self.accounts.mark_dirty(key[0])
+        elif kind == "task":
+            self.tasks.mark_dirty(key)
+        elif kind == "cluster":
+            self.clusters.mark_dirty(key)
+        elif kind != "event":
+            self.meta_dirty = True
+    
+    def apply_writes(
+        self,
+        writes: Iterable[Tuple[str, Any, Any]],
+        deltas: Dict[Optional[str], int] = None,
+        events: List[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Apply write sets recorded by speculative execution in one batch.
+        
+        The undo entries of the batch are journaled together, so snapshots
+        taken before the batch can revert it.
+        
+        Args:
+            writes: (kind, key, new value) entries in write order, where later
+                entries for an item win; "account" entries create the account
+                and carry no value
+            deltas: Amounts to add to balances by address, and to the total
+                supply under None
+            events: Events to emit, in order
+        """
+        accounts = self.accounts
+        undo = []
+        
+        for kind, key, value in writes:
+            if kind == "account":
+                if key not in accounts:
+                    accounts[key] = Account(address=key)
+                    undo.append(("account", key, MISSING))
+            
+            elif kind == "balance" or kind == "nonce":
+                account = accounts[key]
+                undo.append((kind, key, getattr(account, kind)))
+                setattr(account, kind, value)
+            
+            else:
+                undo.append((kind, key, self._read(kind, key)))
+                self._restore(kind, key, value)
+        
+        for address, amount in (deltas or {}).items():
+            if address is None:
+                undo.append(("total_supply", None, self.total_supply))
+                self.total_supply += amount
+            else:
+                account = self.get_account(address)
+                undo.append(("balance", address, account.balance))
+                account.balance += amount
+        
+        self.journal.record_many(undo)
+        self.touched.update((kind, key) for kind, key, _ in undo)
+        
+        if self.indexes is not None or self.store is not None:
+            for kind, key, _ in undo:
+                self._reindex(kind, key)
+                if self.store is not None:
+                    self._mark_dirty(kind, key)
+        
+        for event in events or []:
+            self.emit_event(event)
+    
+    def apply_changeset(self, changeset: StateChangeset, verify: bool = True) -> bool:
+        """
+        Apply a block changeset without re-executing the block's transactions.
+        
+        Every write goes through the journal, so snapshots taken before the
+        changeset was applied can revert it.
+        
+        Args:
+            changeset: Changeset to apply
+            verify: Whether to check first that the changeset's old values
+                match the current state
+        
+        Returns:
+            True if successful, False if the state does not match the changeset
+        """
+        if verify and not self.matches_changeset(changeset):
+            return False
+        
+        deleted = []
+        
+        for address, entry in changeset.accounts.items():
+            if "new" not in entry:
+                deleted.append(address)
+                continue
+            
+            fields = entry["new"]
+            self.get_account(address)
+            self._write("balance", address, fields["balance"])
+            self._write("nonce", address, fields["nonce"])
+            self._write("code", address, fields["code"])
+            self._write("validator", address, (fields["is_validator"], dict(fields["validator_data"])))
+        
+        for address, slots in changeset.storage.items():
+            self.get_account(address)
+            for slot, entry in slots.items():
+                self._write("storage_slot", (address, slot), entry.get("new", MISSING))
+        
+        # Accounts are removed last so that their storage can still be cleared
+        for address in deleted:
+            self._write("account", address, MISSING)
+        
+        for address, entry in changeset.validators.items():
+            self._write("validator_set", address, entry["new"])
+        
+        for task_id, entry in changeset.tasks.items():
+            self._write("task", task_id, entry.get("new", MISSING))
+        
+        for cluster_id, entry in changeset.clusters.items():
+            self._write("cluster", cluster_id, entry.get("new", MISSING))
+        
+        if changeset.total_supply:
+            self._write("total_supply", None, changeset.total_supply["new"])
+        
+        for event in changeset.events:
+            self.emit_event(dict(event))
+        
+        return True
+    
+    def matches_changeset(self, changeset: StateChangeset) -> bool:
+        """
+        Check that the old values of a changeset match the current state.
+        
+        Args:
+            changeset: Changeset to check
+        
+        Returns:
+            True if the changeset applies to the current state, False otherwise
+        """
+        for address, entry in changeset.accounts.items():
+            if account_fields(self.accounts.get(address)) != entry.get("old"):
+                return False
+        
+        for address, slots in changeset.storage.items():
+            account = self.accounts.get(address)
+            storage = account.storage if account is not None else {}
+            
+            for slot, entry in slots.items():
+                if storage.get(slot, MISSING) != entry.get("old", MISSING):
+                    return False
+        
+        for address, entry in changeset.validators.items():
+            if (address in self.validators) != entry["old"]:
+                return False
+        
+        for entries, changes in ((self.tasks, changeset.tasks), (self.clusters, changeset.clusters)):
+            for key, entry in changes.items():
+                if entries.get(key, MISSING) != entry.get("old", MISSING):
+                    return False
+        
+        if changeset.total_supply and self.total_supply != changeset.total_supply["old"]:
+            return False
+        
+        return True
+    
+    def _write(self, kind: str, key: Any, value: Any) -> None:
+        """
+        Set a single item to a new value through the journal.
+        
+        Args:
+            kind: Kind of the item
+            key: Key of the item
+            value: New value, or MISSING to remove the item
+        """
+        self._record(kind, key, self._read(kind, key))
+        self._restore(kind, key, value)
+    
+    def _read(self, kind: str, key: Any) -> Any:
+        """
+        Read the current value of a journaled item.
+        
+        Args:
+            kind: Kind of the item
+            key: Key of the item
+        
+        Returns:
+            Current value, or MISSING if the item does not exist
+        """
+        if kind == "account":
+            return self.accounts.get(key, MISSING)
+        
+        elif kind == "total_supply":
+            return self.total_supply
+        
+        elif kind == "storage_slot":
+            address, slot = key
+            return self.accounts[address].storage.get(slot, MISSING)
+        
+        elif kind == "validator_set":
+            return key in self.validators
+        
+        elif kind == "task":
+            return self.tasks.get(key, MISSING)
+        
+        elif kind == "cluster":
+            return self.clusters.get(key, MISSING)
+        
+        account = self.accounts[key]
+        
+        if kind == "validator":
+            return (account.is_validator, account.validator_data)
+        
+        return getattr(account, kind)
+    
+    def _restore(self, kind: str, key: Any, old_value: Any) -> None:
+        """
+        Set a single journaled item back to a recorded value.
+        
+        Args:
+            kind: Kind of the journaled item
+            key: Key of the journaled item
+            old_value: Value to restore, or MISSING to remove the item
+        """
+        if kind == "account":
+            if old_value is MISSING:
+                del self.accounts[key]
+            else:
+                self.accounts[key] = old_value
+        
+        elif kind == "balance":
+            self.accounts[key].balance = old_value
+        
+        elif kind == "total_supply":
+            self.total_supply = old_value
+        
+        elif kind == "nonce":
+            self.accounts[key].nonce = old_value
+        
+        elif kind == "code":
+            self.accounts[key].code = old_value
+        
+        elif kind == "storage":
+            self.accounts[key].storage = old_value
+        
+        elif kind == "storage_slot":
+            address, slot = key
+            account = self.accounts[address]
+            if old_value is MISSING:
+                account.delete_storage_slot(slot)
+            else:
+                account.set_storage_slot(slot, old_value)
+        
+        elif kind == "validator":
+            account = self.accounts[key]
+            account.is_validator, account.validator_data = old_value
+        
+        elif kind == "validator_set":
+            if old_value:
+                self.validators.add(key)
+            else:
+                self.validators.discard(key)
+        
+        elif kind == "task":
+            if old_value is MISSING:
+                self.tasks.pop(key, None)
+            else:
+                self.tasks[key] = old_value
+        
+        elif kind == "cluster":
+            if old_value is MISSING:
+                self.clusters.pop(key, None)
+            else:
+                self.clusters[key] = old_value
+        
+        elif kind == "event":
+            del self.pending_events[old_value:]
+        
+        self.touched.add((kind, key))
+        self._reindex(kind, key)
+        
+        if self.store is not None and kind != "account":
+            self._mark_dirty(kind, key)
+    
     def save_to_file(self, filename: str) -> bool:
         """
         Save the state to a file.
@@ -536,24 +1213,206 @@ class StateDB:
             StateDB instance or None if failed
         """
         try:
+            # Binary snapshots are recognized by their magic bytes
+            with open(filename, 'rb') as f:
+                if f.read(len(MAGIC)) == MAGIC:
+                    return cls.load_snapshot(filename)
+            
             with open(filename, 'r') as f:
                 data = json.load(f)
             return cls.from_dict(data)
         except Exception:
             return None
+    
+    def iter_snapshot_records(self) -> Iterator[Tuple[int, str, bytes]]:
+        """
+        Generate the snapshot records of the state.
+        
+        Records are produced section by section in key order, encoding one
+        entry at a time, so the state is never serialized as a whole.
+        
+        Returns:
+            Iterator of (section, key, encoded value) tuples
+        """
+        yield SECTION_META, "total_supply", json.dumps(self.total_supply).encode("utf-8")
+        yield SECTION_META, "validators", json.dumps(sorted(self.validators)).encode("utf-8")
+        
+        for section, entries, encode in (
+            (SECTION_ACCOUNTS, self.accounts, self._encode_snapshot_account),
+            (SECTION_TASKS, self.tasks, self._encode_snapshot_entry),
+            (SECTION_CLUSTERS, self.clusters, self._encode_snapshot_entry)
+        ):
+            if isinstance(entries, SnapshotMapping):
+                # Stream entries a lazily loaded state never touched without decoding them
+                records = entries.records(encode)
+            else:
+                records = ((key, encode(key, entries[key])) for key in sorted(entries))
+            
+            for key, value in records:
+                yield section, key, value
+    
+    def save_snapshot(self, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+        """
+        Save the state to a chunked binary snapshot.
+        
+        Args:
+            filename: Path to save the snapshot
+            chunk_size: Target chunk size in bytes
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with SnapshotWriter(filename, chunk_size) as writer:
+                writer.write(self.iter_snapshot_records())
+            return True
+        except Exception:
+            return False
+    
+    @classmethod
+    def load_snapshot(cls, filename: str, lazy: bool = False, sections: Set[str] = None) -> Optional['StateDB']:
+        """
+        Load the state from a chunked binary snapshot.
+        
+        Args:
+            filename: Path to the snapshot
+            lazy: Whether to leave accounts, tasks and clusters in the
+                memory-mapped snapshot until they are first accessed
+            sections: Names of the sections to load ("accounts", "tasks",
+                "clusters"); all sections if None
+        
+        Returns:
+            StateDB instance or None if failed
+        """
+        try:
+            reader = SnapshotReader(filename)
+        except Exception:
+            return None
+        
+        state = cls()
+        decoders = {
+            "accounts": (SECTION_ACCOUNTS, cls._decode_snapshot_account),
+            "tasks": (SECTION_TASKS, cls._decode_snapshot_entry),
+            "clusters": (SECTION_CLUSTERS, cls._decode_snapshot_entry)
+        }
+        
+        try:
+            meta = {key: json.loads(value) for key, value in reader.items(SECTION_META)}
+            state.total_supply = meta.get("total_supply", 0)
+            state.validators = set(meta.get("validators", []))
+            
+            for name, (section, decode) in decoders.items():
+                if sections is not None and name not in sections:
+                    continue
+                
+                if lazy:
+                    # The mapping keeps the reader, and with it the file mapping, alive
+                    setattr(state, name, SnapshotMapping(reader, section, decode))
+                else:
+                    entries = getattr(state, name)
+                    
+                    # Decode each chunk's values with a single JSON parse
+                    for records in reader.chunks_of(section):
+                        values = json.loads(b"[" + b",".join(value for _, value in records) + b"]")
+                        for (key, _), data in zip(records, values):
+                            entries[key] = decode(key, data)
+        except Exception:
+            reader.close()
+            return None
+        
+        if not lazy:
+            reader.close()
+        
+        return state
+    
+    @staticmethod
+    def _decode_snapshot_account(address: str, value: Any) -> Account:
+        """Decode an account record (encoded or already parsed) of a snapshot."""
+        data = json.loads(value) if isinstance(value, bytes) else value
+        data["address"] = address
+        return Account.from_dict(data)
+    
+    @staticmethod
+    def _decode_snapshot_entry(key: str, value: Any) -> Dict[str, Any]:
+        """Decode a task or cluster record (encoded or already parsed) of a snapshot."""
+        return json.loads(value) if isinstance(value, bytes) else value
+    
+    @staticmethod
+    def _encode_snapshot_account(address: str, account: Account) -> bytes:
+        """Encode an account record of a snapshot."""
+        data = account.to_dict()
+        del data["address"]
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    
+    @staticmethod
+    def _encode_snapshot_entry(key: str, value: Dict[str, Any]) -> bytes:
+        """Encode a task or cluster record of a snapshot."""
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+class ReceiptStatus:
+    """Enumeration of transaction receipt statuses produced by block application."""
+    APPLIED = "applied"
+    FAILED = "failed"
+    REVERTED = "reverted"
+    SKIPPED = "skipped"
 
 class StateManager:
     """Class for managing state transitions in the Synergy Network."""
     
-    def __init__(self, state: StateDB = None):
+    # System accounts credited by transaction handlers
+    FEE_RECIPIENT = "sYnQsyn1feerecipient00000000000000000000000"
+    STAKE_ADDRESS = "sYnQsyn1stakingcontract000000000000000000000"
+    TASK_ESCROW = "sYnQsyn1taskescrow0000000000000000000000000000"
+    
+    # Transaction types whose sender pays amount + fee (all other signed types pay only the fee)
+    AMOUNT_SPENDING_TYPES = {
+        TransactionType.TRANSFER,
+        TransactionType.CONTRACT_DEPLOY,
+        TransactionType.CONTRACT_CALL,
+        TransactionType.VALIDATOR_REGISTER,
+        TransactionType.STAKE,
+        TransactionType.TASK_SUBMIT
+    }
+    
+    # Transaction types that pay stake or escrow back to their sender
+    REFUNDING_TYPES = {
+        TransactionType.VALIDATOR_UNREGISTER,
+        TransactionType.UNSTAKE,
+        TransactionType.TASK_RESULT
+    }
+    
+    def __init__(self, state: StateDB = None, event_log: EventLog = None):
         """
         Initialize a StateManager instance.
         
         Args:
             state: Initial state
+            event_log: Log receiving committed contract events (in memory if None)
         """
         self.state = state or StateDB()
-        self.snapshots: List[Dict[str, Any]] = []
+        self.trie: Optional[StateTrie] = None
+        self.event_log = event_log or EventLog()
+        
+        # Height of the last applied block, used for events emitted outside blocks
+        self.block_height = 0
+        
+        # Changeset of the last applied block and functions notified of each one
+        self.last_changeset: Optional[StateChangeset] = None
+        self.changeset_listeners: List[Callable[[StateChangeset], None]] = []
+        
+        # Dispatch table from transaction type to handler
+        self.handlers = {
+            TransactionType.TRANSFER: self._apply_transfer,
+            TransactionType.COINBASE: self._apply_coinbase,
+            TransactionType.CONTRACT_DEPLOY: self._apply_contract_deploy,
+            TransactionType.CONTRACT_CALL: self._apply_contract_call,
+            TransactionType.VALIDATOR_REGISTER: self._apply_validator_register,
+            TransactionType.VALIDATOR_UNREGISTER: self._apply_validator_unregister,
+            TransactionType.STAKE: self._apply_stake,
+            TransactionType.UNSTAKE: self._apply_unstake,
+            TransactionType.TASK_SUBMIT: self._apply_task_submit,
+            TransactionType.TASK_RESULT: self._apply_task_result
+        }
     
     def apply_transaction(self, transaction) -> bool:
         """
@@ -565,53 +1424,262 @@ class StateManager:
         Returns:
             True if successful, False otherwise
         """
-        # Import transaction types
-        from implementation.core.transaction.transaction import TransactionType
-        
         # Take snapshot before applying transaction
         self.create_snapshot()
         
+        handler = self.handlers.get(transaction.tx_type)
+        
+        if handler is None:
+            # Unknown transaction type
+            self.revert_to_snapshot()
+            return False
+        
         try:
-            # Process based on transaction type
-            if transaction.tx_type == TransactionType.TRANSFER:
-                return self._apply_transfer(transaction)
-            
-            elif transaction.tx_type == TransactionType.COINBASE:
-                return self._apply_coinbase(transaction)
+            return handler(transaction)
+        
+        except Exception:
+            # Revert state on error
+            self.revert_to_snapshot()
+            return False
+    
+    def apply_block(self, block) -> List[Dict[str, Any]]:
+        """
+        Apply all transactions of a block to the state atomically.
+        
+        Nonces and balances are pre-checked per sender before any transaction
+        runs, and the whole block shares a single snapshot: if any transaction
+        fails, the state is reverted to what it was before the block.
+        
+        Args:
+            block: Block whose transactions (Transaction instances or
+                dictionaries) are applied in order
+        
+        Returns:
+            List of receipts, one per transaction in block order
+        """
+        transactions = [self._to_transaction(tx) for tx in block.transactions]
+        receipts = self._create_receipts(block, transactions)
+        
+        # Reading unknown accounts creates them, so pre-checks run inside the snapshot too
+        snapshot_id = self.create_snapshot()
+        
+        # Reject the block before running any handler if a sender cannot be valid
+        errors = self._precheck_block(transactions)
+        if errors:
+            self.revert_to_snapshot(snapshot_id)
             
-            elif transaction.tx_type == TransactionType.CONTRACT_DEPLOY:
-                return self._apply_contract_deploy(transaction)
+            for index, error in errors.items():
+                receipts[index]["status"] = ReceiptStatus.FAILED
+                receipts[index]["error"] = error
+            return receipts
+        
+        for index, transaction in enumerate(transactions):
+            try:
+                success = self.handlers[transaction.tx_type](transaction)
+                error = None if success else "rejected by state"
+            except Exception as e:
+                success = False
+                error = str(e)
             
-            elif transaction.tx_type == TransactionType.CONTRACT_CALL:
-                return self._apply_contract_call(transaction)
+            if not success:
+                self.revert_to_snapshot(snapshot_id)
+                
+                for receipt in receipts[:index]:
+                    receipt["status"] = ReceiptStatus.REVERTED
+                
+                receipts[index]["status"] = ReceiptStatus.FAILED
+                receipts[index]["error"] = error
+                return receipts
             
-            elif transaction.tx_type == TransactionType.VALIDATOR_REGISTER:
-                return self._apply_validator_register(transaction)
+            receipts[index]["status"] = ReceiptStatus.APPLIED
+        
+        self._finish_block(block, snapshot_id)
+        
+        return receipts
+    
+    def apply_changeset(self, changeset: StateChangeset, verify: bool = True) -> bool:
+        """
+        Apply a block changeset instead of executing the block.
+        
+        Args:
+            changeset: Changeset produced by another node's apply_block
+            verify: Whether to check that the changeset's old values match the state
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.state.apply_changeset(changeset, verify):
+            return False
+        
+        self._emit_changeset(changeset)
+        return True
+    
+    def add_changeset_listener(self, listener: Callable[[StateChangeset], None]) -> None:
+        """
+        Register a function called with the changeset of every applied block.
+        
+        Args:
+            listener: Function taking a StateChangeset
+        """
+        self.changeset_listeners.append(listener)
+    
+    def _finish_block(self, block, snapshot_id: int) -> None:
+        """
+        Close the snapshot of a successfully applied block and emit its changeset.
+        
+        Args:
+            block: Applied block
+            snapshot_id: Snapshot taken before the block
+        """
+        journal = self.state.journal
+        entries = journal.entries[journal.checkpoints[snapshot_id]:]
+        
+        # Stamp the block's events with its height
+        for kind, _, position in entries:
+            if kind == "event":
+                self.state.pending_events[position]["block_height"] = block.header.height
+        
+        changeset = StateChangeset.from_journal(
+            self.state,
+            entries,
+            block.header.height,
+            block.get_hash().hex()
+        )
+        self.block_height = block.header.height
+        
+        # Keep the block's changes; enclosing snapshots can still revert them
+        self.state.discard_snapshot(snapshot_id)
+        
+        self._emit_changeset(changeset)
+    
+    def _emit_changeset(self, changeset: StateChangeset) -> None:
+        """
+        Record a block changeset and notify the listeners.
+        
+        Args:
+            changeset: Changeset of the applied block
+        """
+        self.last_changeset = changeset
+        
+        for listener in self.changeset_listeners:
+            listener(changeset)
+    
+    def _create_receipts(self, block, transactions: List[Optional[Transaction]]) -> List[Dict[str, Any]]:
+        """
+        Create the initial receipts of a block's transactions.
+        
+        Args:
+            block: Block being applied
+            transactions: Transactions of the block (None for malformed entries)
+        
+        Returns:
+            List of receipts marked as skipped
+        """
+        return [
+            {
+                "index": index,
+                "tx_id": tx.tx_id if tx is not None else None,
+                "block_height": block.header.height,
+                "status": ReceiptStatus.SKIPPED,
+                "error": None
+            }
+            for index, tx in enumerate(transactions)
+        ]
+    
+    @staticmethod
+    def contract_address(transaction) -> str:
+        """
+        Get the address of the contract created by a deployment transaction.
+        
+        Args:
+            transaction: Contract deployment transaction
+        
+        Returns:
+            Contract address
+        """
+        return "sYnQsyn1contract" + transaction.tx_id[:20]
+    
+    def _to_transaction(self, transaction) -> Optional[Transaction]:
+        """
+        Convert a block transaction entry to a Transaction.
+        
+        Args:
+            transaction: Transaction instance or dictionary
+        
+        Returns:
+            Transaction instance or None if the entry is malformed
+        """
+        if isinstance(transaction, Transaction):
+            return transaction
+        
+        try:
+            return Transaction.from_dict(transaction)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+    
+    def _precheck_block(self, transactions: List[Optional[Transaction]]) -> Dict[int, str]:
+        """
+        Check nonces and balances of a block's transactions per sender.
+        
+        Each sender's nonce and balance are read once. Nonces must continue the
+        sender's state nonce without gaps. A sender's cumulative spend is
+        compared against its starting balance plus everything it can receive
+        within the block; senders of refunding transactions, whose refunds are
+        not known upfront, are left to the handlers.
+        
+        Args:
+            transactions: Transactions of the block (None for malformed entries)
+        
+        Returns:
+            Dictionary mapping transaction indexes to error messages
+        """
+        errors = {}
+        inflows: Dict[str, int] = {}
+        unbounded: Set[str] = set()
+        
+        for index, tx in enumerate(transactions):
+            if tx is None:
+                errors[index] = "malformed transaction"
+            elif tx.tx_type not in self.handlers:
+                errors[index] = "unknown transaction type"
+            else:
+                if tx.to_address and tx.tx_type in (
+                    TransactionType.TRANSFER, TransactionType.COINBASE, TransactionType.CONTRACT_CALL
+                ):
+                    inflows[tx.to_address] = inflows.get(tx.to_address, 0) + max(tx.amount, 0)
+                
+                if tx.tx_type in self.REFUNDING_TYPES:
+                    unbounded.add(tx.from_address)
+        
+        if errors:
+            return errors
+        
+        next_nonces: Dict[str, int] = {}
+        available: Dict[str, int] = {}
+        
+        for index, tx in enumerate(transactions):
+            if tx.tx_type == TransactionType.COINBASE:
+                continue
             
-            elif transaction.tx_type == TransactionType.VALIDATOR_UNREGISTER:
-                return self._apply_validator_unregister(transaction)
+            sender = tx.from_address
             
-            elif transaction.tx_type == TransactionType.STAKE:
-                return self._apply_stake(transaction)
+            if sender not in next_nonces:
+                next_nonces[sender] = self.state.get_nonce(sender) + 1
+                available[sender] = self.state.get_balance(sender) + inflows.get(sender, 0)
             
-            elif transaction.tx_type == TransactionType.UNSTAKE:
-                return self._apply_unstake(transaction)
+            if tx.nonce != next_nonces[sender]:
+                errors[index] = f"invalid nonce: expected {next_nonces[sender]}, got {tx.nonce}"
+                continue
             
-            elif transaction.tx_type == TransactionType.TASK_SUBMIT:
-                return self._apply_task_submit(transaction)
+            next_nonces[sender] += 1
             
-            elif transaction.tx_type == TransactionType.TASK_RESULT:
-                return self._apply_task_result(transaction)
+            spend = tx.fee + (tx.amount if tx.tx_type in self.AMOUNT_SPENDING_TYPES else 0)
+            available[sender] -= spend
             
-            else:
-                # Unknown transaction type
-                self.revert_to_snapshot()
-                return False
+            if available[sender] < 0 and sender not in unbounded:
+                errors[index] = "insufficient balance"
         
-        except Exception:
-            # Revert state on error
-            self.revert_to_snapshot()
-            return False
+        return errors
     
     def _apply_transfer(self, transaction) -> bool:
         """
@@ -633,7 +1701,7 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient (for now, just burn it)
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Increment sender's nonce
@@ -651,14 +1719,9 @@ class StateManager:
         Returns:
             True if successful, False otherwise
         """
-        # Add new tokens to recipient
-        recipient = self.state.get_account(transaction.to_address)
-        recipient.balance += transaction.amount
-        
-        # Update total supply
-        self.state.total_supply += transaction.amount
-        
-        return True
+        # Add new tokens to recipient (set_balance also updates total supply)
+        recipient_balance = self.state.get_balance(transaction.to_address)
+        return self.state.set_balance(transaction.to_address, recipient_balance + transaction.amount)
     
     def _apply_contract_deploy(self, transaction) -> bool:
         """
@@ -676,7 +1739,7 @@ class StateManager:
             return False
         
         # Generate contract address (simplified)
-        contract_address = "sYnQsyn1contract" + transaction.tx_id[:20]
+        contract_address = self.contract_address(transaction)
         
         # Create contract account
         if not self.state.create_contract(
@@ -692,7 +1755,7 @@ class StateManager:
                 return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Increment sender's nonce
@@ -726,7 +1789,7 @@ class StateManager:
                 return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Increment sender's nonce
@@ -737,17 +1800,15 @@ class StateManager:
         method = transaction.data.get("method", "")
         params = transaction.data.get("params", {})
         
-        # For now, just record the call in contract storage
-        calls = contract.storage.get("calls", [])
-        calls.append({
+        # For now, just record the call in the contract event log
+        return self.state.emit_event({
+            "contract": transaction.to_address,
+            "tx_id": transaction.tx_id,
             "method": method,
             "params": params,
             "caller": transaction.from_address,
             "value": transaction.amount
         })
-        contract.storage["calls"] = calls
-        
-        return True
     
     def _apply_validator_register(self, transaction) -> bool:
         """
@@ -765,12 +1826,12 @@ class StateManager:
             return False
         
         # Stake tokens
-        stake_address = "sYnQsyn1stakingcontract000000000000000000000"
+        stake_address = self.STAKE_ADDRESS
         if not self.state.transfer(transaction.from_address, stake_address, transaction.amount):
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Register validator
@@ -810,7 +1871,7 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Unregister validator
@@ -822,7 +1883,7 @@ class StateManager:
         stake_amount = account.validator_data.get("stake_amount", 0)
         
         if stake_amount > 0:
-            stake_address = "sYnQsyn1stakingcontract000000000000000000000"
+            stake_address = self.STAKE_ADDRESS
             staking_account = self.state.get_account(stake_address)
             
             if staking_account.balance >= stake_amount:
@@ -850,11 +1911,11 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Lock reward amount
-        task_escrow = "sYnQsyn1taskescrow0000000000000000000000000000"
+        task_escrow = self.TASK_ESCROW
         if not self.state.transfer(transaction.from_address, task_escrow, transaction.amount):
             return False
         
@@ -904,10 +1965,11 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
-        # Update task status
+        # Update task status on a copy so journaled data stays intact
+        task = dict(task)
         task["status"] = "completed"
         task["result"] = transaction.data.get("result", {})
         task["completion_time"] = transaction.timestamp
@@ -917,7 +1979,7 @@ class StateManager:
             return False
         
         # Transfer reward to task completer
-        task_escrow = "sYnQsyn1taskescrow0000000000000000000000000000"
+        task_escrow = self.TASK_ESCROW
         reward = task.get("reward", 0)
         
         if reward > 0:
@@ -945,11 +2007,11 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Transfer stake to staking contract
-        stake_address = "sYnQsyn1stakingcontract000000000000000000000"
+        stake_address = self.STAKE_ADDRESS
         if not self.state.transfer(transaction.from_address, stake_address, transaction.amount):
             return False
         
@@ -957,7 +2019,7 @@ class StateManager:
         if transaction.from_address in self.state.validators:
             account = self.state.get_account(transaction.from_address)
             current_stake = account.validator_data.get("stake_amount", 0)
-            account.validator_data["stake_amount"] = current_stake + transaction.amount
+            self.state.set_validator_stake(transaction.from_address, current_stake + transaction.amount)
         
         # Increment sender's nonce
         self.state.increment_nonce(transaction.from_address)
@@ -980,7 +2042,7 @@ class StateManager:
             return False
         
         # Transfer fee to fee recipient
-        if not self.state.transfer(transaction.from_address, "sYnQsyn1feerecipient00000000000000000000000", transaction.fee):
+        if not self.state.transfer(transaction.from_address, self.FEE_RECIPIENT, transaction.fee):
             return False
         
         # Verify unstake amount
@@ -997,10 +2059,10 @@ class StateManager:
                 return False
             
             # Update validator stake
-            account.validator_data["stake_amount"] = current_stake - unstake_amount
+            self.state.set_validator_stake(transaction.from_address, current_stake - unstake_amount)
         
         # Transfer from staking contract to sender
-        stake_address = "sYnQsyn1stakingcontract000000000000000000000"
+        stake_address = self.STAKE_ADDRESS
         staking_account = self.state.get_account(stake_address)
         
         if staking_account.balance < unstake_amount:
@@ -1014,6 +2076,16 @@ class StateManager:
         
         return True
     
+    @property
+    def snapshots(self) -> List[int]:
+        """
+        Get the open snapshots.
+        
+        Returns:
+            List of journal positions, one per open snapshot
+        """
+        return self.state.journal.checkpoints
+    
     def create_snapshot(self) -> int:
         """
         Create a snapshot of the current state.
@@ -1021,9 +2093,7 @@ class StateManager:
         Returns:
             Snapshot ID (index)
         """
-        snapshot = json.dumps(self.state.to_dict())
-        self.snapshots.append(snapshot)
-        return len(self.snapshots) - 1
+        return self.state.create_snapshot()
     
     def revert_to_snapshot(self, snapshot_id: int = None) -> bool:
         """
@@ -1041,20 +2111,70 @@ class StateManager:
         if snapshot_id is None:
             snapshot_id = len(self.snapshots) - 1
         
-        if snapshot_id < 0 or snapshot_id >= len(self.snapshots):
-            return False
+        return self.state.revert_to_snapshot(snapshot_id)
+    
+    def get_state_trie(self) -> StateTrie:
+        """
+        Get the state trie, updated with all changes since the last commit.
         
-        snapshot = self.snapshots[snapshot_id]
-        self.state = StateDB.from_dict(json.loads(snapshot))
+        The trie is built from a full scan on first use; afterwards only the
+        entries touched since the previous update are rehashed.
         
-        # Remove all snapshots after this one
-        self.snapshots = self.snapshots[:snapshot_id]
+        Returns:
+            StateTrie instance
+        """
+        if self.trie is None:
+            self.trie = StateTrie(self.state)
+        else:
+            self.trie.update(self.state, self.state.touched)
         
-        return True
+        return self.trie
+    
+    def get_state_root(self) -> bytes:
+        """
+        Get the authenticated root of the current state.
+        
+        Returns:
+            32-byte state root
+        """
+        return self.get_state_trie().root()
     
     def commit(self) -> None:
-        """Commit the current state and clear snapshots."""
-        self.snapshots = []
+        """Commit the current state, clear snapshots and flush dirty entries and events to disk."""
+        if self.trie is not None:
+            self.trie.update(self.state, self.state.touched)
+        
+        self.state.commit()
+        
+        # Committed events can no longer be reverted, so they move to the event log
+        for event in self.state.pending_events:
+            height = event.get("block_height")
+            self.event_log.append(event["contract"], height if height is not None else self.block_height, event)
+        
+        if self.state.pending_events:
+            self.event_log.flush()
+        self.state.pending_events = []
+    
+    def get_contract_events(
+        self,
+        contract: str,
+        from_height: int = 0,
+        to_height: int = None,
+        limit: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the committed events of a contract within a block height range.
+        
+        Args:
+            contract: Contract address
+            from_height: Lowest block height (inclusive)
+            to_height: Highest block height (inclusive, unbounded if None)
+            limit: Maximum number of events (all if None)
+        
+        Returns:
+            List of events
+        """
+        return self.event_log.get_events(contract, from_height, to_height, limit)
     
     def get_state(self) -> StateDB:
         """
@@ -1073,7 +2193,7 @@ class StateManager:
             state: New state
         """
         self.state = state
-        self.snapshots = []
+        self.trie = None
 
 # Example usage
 if __name__ == "__main__":
@@ -1149,3 +2269,9 @@ if __name__ == "__main__":
     print(f"Alice balance: {loaded_state.get_balance(alice)}")
     print(f"Bob balance: {loaded_state.get_balance(bob)}")
     print(f"Total supply: {loaded_state.total_supply}")
+    
+    # Save and lazily reload a binary snapshot
+    state_manager.state.save_snapshot("state.snap")
+    snapshot_state = StateDB.load_snapshot("state.snap", lazy=True)
+    print("\nState loaded from snapshot:")
+    print(f"Alice balance: {snapshot_state.get_balance(alice)}")
@@ -0,0 +1,284 @@
+"""
+Storage Module for Synergy Network
+
+This module implements the persistent backend of the state database. State
+entries live in an embedded SQLite store and are paged in on demand through a
+bounded write-back cache, so memory use does not grow with the size of the chain.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Dict, Any, Optional, Iterable, Iterator, Callable, Set
+
+class StateStore:
+    """Class wrapping the embedded SQLite database backing the state."""
+
+    TABLES = ("accounts", "tasks", "clusters", "meta")
+
+    def __init__(self, path: str):
+        """
+        Initialize a StateStore instance.
+
+        Args:
+            path: Path of the database file (":memory:" for a transient store)
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        for table in self.TABLES:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+        self.connection.commit()
+
+    def get(self, table: str, key: str) -> Optional[str]:
+        """
+        Get a raw value from a table.
+
+        Args:
+            table: Table name
+            key: Entry key
+
+        Returns:
+            Encoded value or None if not found
+        """
+        row = self.connection.execute(
+            f"SELECT value FROM {table} WHERE key = ?", (key,)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def contains(self, table: str, key: str) -> bool:
+        """
+        Check whether a table holds a key.
+
+        Args:
+            table: Table name
+            key: Entry key
+
+        Returns:
+            True if the key exists, False otherwise
+        """
+        row = self.connection.execute(
+            f"SELECT 1 FROM {table} WHERE key = ?", (key,)
+        ).fetchone()
+
+        return row is not None
+
+    def keys(self, table: str) -> Iterator[str]:
+        """
+        Iterate over the keys of a table in key order.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Iterator of keys
+        """
+        cursor = self.connection.execute(f"SELECT key FROM {table} ORDER BY key")
+        for (key,) in cursor:
+            yield key
+
+    def count(self, table: str) -> int:
+        """
+        Count the entries of a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Number of entries
+        """
+        return self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def write_batch(self, table: str, puts: Dict[str, str], deletes: Iterable[str]) -> None:
+        """
+        Write a batch of changes to a table without committing.
+
+        Args:
+            table: Table name
+            puts: Mapping of keys to encoded values to insert or replace
+            deletes: Keys to delete
+        """
+        if puts:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {table} (key, value) VALUES (?, ?)",
+                puts.items()
+            )
+
+        deletes = [(key,) for key in deletes]
+        if deletes:
+            self.connection.executemany(f"DELETE FROM {table} WHERE key = ?", deletes)
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """
+        Get a metadata value.
+
+        Args:
+            key: Metadata key
+            default: Value returned if the key is not set
+
+        Returns:
+            Decoded metadata value
+        """
+        value = self.get("meta", key)
+        return json.loads(value) if value is not None else default
+
+    def set_meta(self, key: str, value: Any) -> None:
+        """
+        Set a metadata value without committing.
+
+        Args:
+            key: Metadata key
+            value: JSON-serializable value
+        """
+        self.write_batch("meta", {key: json.dumps(value)}, ())
+
+    def commit(self) -> None:
+        """Commit all pending writes to disk."""
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.connection.close()
+
+class PagedMapping(MutableMapping):
+    """
+    Mapping backed by a StateStore table with a bounded write-back cache.
+
+    Clean entries are kept in an LRU cache of at most `cache_size` entries and
+    are paged in from the store on demand. Modified entries are pinned in a
+    separate dirty set until `flush` writes them to the store in one batch.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        table: str,
+        encode: Callable[[Any], str],
+        decode: Callable[[str], Any],
+        cache_size: int = 100000
+    ):
+        """
+        Initialize a PagedMapping instance.
+
+        Args:
+            store: Backing store
+            table: Table holding the entries
+            encode: Function encoding a value for the store
+            decode: Function decoding a stored value
+            cache_size: Maximum number of clean entries kept in memory
+        """
+        self.store = store
+        self.table = table
+        self.encode = encode
+        self.decode = decode
+        self.cache_size = max(cache_size, 16)
+        self.cache: OrderedDict = OrderedDict()
+        self.dirty: Dict[str, Any] = {}
+        self.deleted: Set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.dirty:
+            return self.dirty[key]
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        if key in self.deleted:
+            raise KeyError(key)
+
+        encoded = self.store.get(self.table, key)
+        if encoded is None:
+            raise KeyError(key)
+
+        value = self.decode(encoded)
+        self.cache[key] = value
+        self._evict()
+
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.cache.pop(key, None)
+        self.deleted.discard(key)
+        self.dirty[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self.cache.pop(key, None)
+        self.dirty.pop(key, None)
+        self.deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.dirty or key in self.cache:
+            return True
+
+        if key in self.deleted:
+            return False
+
+        return self.store.contains(self.table, key)
+
+    def __iter__(self) -> Iterator[str]:
+        dirty_keys = set(self.dirty)
+
+        for key in self.store.keys(self.table):
+            if key not in self.deleted:
+                dirty_keys.discard(key)
+                yield key
+
+        # Entries that only exist in memory so far
+        yield from sorted(dirty_keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def mark_dirty(self, key: str) -> None:
+        """
+        Pin an entry that was modified in place until the next flush.
+
+        Args:
+            key: Entry key
+        """
+        if key in self.dirty:
+            return
+
+        if key in self.cache:
+            self.dirty[key] = self.cache.pop(key)
+
+    def flush(self) -> int:
+        """
+        Write all dirty and deleted entries to the store in one batch.
+
+        The caller is responsible for committing the store.
+
+        Returns:
+            Number of entries written or deleted
+        """
+        written = len(self.dirty) + len(self.deleted)
+
+        self.store.write_batch(
+            self.table,
+            {key: self.encode(value) for key, value in self.dirty.items()},
+            self.deleted
+        )
+
+        # Flushed entries become clean and evictable
+        self.cache.update(self.dirty)
+        self.dirty = {}
+        self.deleted = set()
+        self._evict()
+
+        return written
+
+    def _evict(self) -> None:
+        """Drop least recently used clean entries above the cache size."""
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
@@ -0,0 +1,575 @@
+"""
+Trie Module for Synergy Network
+
+This module implements the authenticated state commitment of the Synergy Network:
+a sparse Merkle tree keyed by hashed state keys, with incremental root updates
+and membership proofs that let nodes compare state without exchanging it.
+"""
+
+import json
+from bisect import bisect_left, insort
+from typing import Dict, List, Any, Optional, Set, Tuple
+import sys
+import os
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.cryptography.pqc.hash import HashFunctions
+
+# Hash of an empty subtree
+EMPTY_HASH = bytes(32)
+
+# Domain separation prefixes for leaf and internal node hashes
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+KEY_BITS = 256
+
+class SparseMerkleTree:
+    """
+    Class implementing a sparse Merkle tree over 256-bit keys.
+
+    Subtrees holding a single leaf collapse into that leaf, so the tree only
+    materializes O(log n) nodes per key. Internal node hashes are cached and
+    only the paths of keys updated since the last root computation are
+    recomputed.
+    """
+
+    def __init__(self):
+        """Initialize an empty SparseMerkleTree instance."""
+        self.leaves: Dict[int, bytes] = {}  # key -> leaf hash
+        self.keys: List[int] = []  # sorted leaf keys
+        self.cache: Dict[Tuple[int, int], bytes] = {}  # (depth, prefix) -> node hash
+        self.dirty: Set[int] = set()
+
+    @staticmethod
+    def leaf_hash(key: bytes, value_hash: bytes) -> bytes:
+        """
+        Compute the hash of a leaf.
+
+        Args:
+            key: 32-byte leaf key
+            value_hash: 32-byte hash of the leaf value
+
+        Returns:
+            32-byte leaf hash
+        """
+        return HashFunctions.sha3_256(LEAF_PREFIX + key + value_hash)
+
+    @staticmethod
+    def node_hash(left: bytes, right: bytes) -> bytes:
+        """
+        Compute the hash of an internal node.
+
+        Args:
+            left: Hash of the left child
+            right: Hash of the right child
+
+        Returns:
+            32-byte node hash
+        """
+        return HashFunctions.sha3_256(NODE_PREFIX + left + right)
+
+    def update(self, key: bytes, value_hash: Optional[bytes]) -> None:
+        """
+        Set or delete a leaf.
+
+        Args:
+            key: 32-byte leaf key
+            value_hash: 32-byte hash of the leaf value, or None to delete the leaf
+        """
+        key_int = int.from_bytes(key, 'big')
+
+        if value_hash is None:
+            if key_int not in self.leaves:
+                return
+            del self.leaves[key_int]
+            del self.keys[bisect_left(self.keys, key_int)]
+        else:
+            if key_int not in self.leaves:
+                insort(self.keys, key_int)
+            self.leaves[key_int] = self.leaf_hash(key, value_hash)
+
+        self.dirty.add(key_int)
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Get the leaf hash stored under a key.
+
+        Args:
+            key: 32-byte leaf key
+
+        Returns:
+            Leaf hash or None if the key is not in the tree
+        """
+        return self.leaves.get(int.from_bytes(key, 'big'))
+
+    def root(self) -> bytes:
+        """
+        Compute the root hash, recomputing only dirty paths.
+
+        Returns:
+            32-byte root hash
+        """
+        for key_int in self.dirty:
+            self._invalidate(key_int)
+        self.dirty = set()
+
+        return self._node(0, 0, 0, len(self.keys))
+
+    def prove(self, key: bytes) -> Dict[str, Any]:
+        """
+        Generate a proof for a key.
+
+        The proof lists the sibling hashes from the root down to the subtree
+        that holds at most one leaf, together with that leaf (if any). It
+        proves membership if the leaf key matches and non-membership otherwise.
+
+        Args:
+            key: 32-byte leaf key
+
+        Returns:
+            Proof as a dictionary
+        """
+        self.root()
+
+        key_int = int.from_bytes(key, 'big')
+        siblings = []
+        depth, prefix, lo, hi = 0, 0, 0, len(self.keys)
+
+        while hi - lo > 1:
+            mid = bisect_left(self.keys, self._mid_key(depth, prefix), lo, hi)
+
+            if (key_int >> (KEY_BITS - 1 - depth)) & 1:
+                siblings.append(self._node(depth + 1, 2 * prefix, lo, mid))
+                prefix, lo = 2 * prefix + 1, mid
+            else:
+                siblings.append(self._node(depth + 1, 2 * prefix + 1, mid, hi))
+                prefix, hi = 2 * prefix, mid
+
+            depth += 1
+
+        leaf = None
+        if hi - lo == 1:
+            leaf_key = self.keys[lo]
+            leaf = {
+                "key": leaf_key.to_bytes(32, 'big').hex(),
+                "hash": self.leaves[leaf_key].hex()
+            }
+
+        return {
+            "siblings": [sibling.hex() for sibling in siblings],
+            "leaf": leaf
+        }
+
+    @staticmethod
+    def verify_proof(root: bytes, key: bytes, value_hash: Optional[bytes], proof: Dict[str, Any]) -> bool:
+        """
+        Verify a proof against a root hash.
+
+        Args:
+            root: Expected root hash
+            key: 32-byte leaf key
+            value_hash: Expected value hash, or None to verify non-membership
+            proof: Proof generated by `prove`
+
+        Returns:
+            True if the proof is valid, False otherwise
+        """
+        try:
+            siblings = [bytes.fromhex(sibling) for sibling in proof["siblings"]]
+            leaf = proof.get("leaf")
+            key_int = int.from_bytes(key, 'big')
+
+            if value_hash is not None:
+                # Membership: the terminal leaf must be this key with this value
+                if not leaf or bytes.fromhex(leaf["key"]) != key:
+                    return False
+                current = SparseMerkleTree.leaf_hash(key, value_hash)
+            elif leaf is None:
+                current = EMPTY_HASH
+            else:
+                # Non-membership: another leaf occupies the subtree of this key
+                leaf_key = bytes.fromhex(leaf["key"])
+                if leaf_key == key:
+                    return False
+                leaf_int = int.from_bytes(leaf_key, 'big')
+                shift = KEY_BITS - len(siblings)
+                if shift < KEY_BITS and (leaf_int >> shift) != (key_int >> shift):
+                    return False
+                current = bytes.fromhex(leaf["hash"])
+
+            for depth in reversed(range(len(siblings))):
+                if (key_int >> (KEY_BITS - 1 - depth)) & 1:
+                    current = SparseMerkleTree.node_hash(siblings[depth], current)
+                else:
+                    current = SparseMerkleTree.node_hash(current, siblings[depth])
+
+            return current == root
+
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        """
+        Get the number of leaves.
+
+        Returns:
+            Number of leaves in the tree
+        """
+        return len(self.keys)
+
+    @staticmethod
+    def _mid_key(depth: int, prefix: int) -> int:
+        """
+        Get the smallest key of the right child of a node.
+
+        Args:
+            depth: Depth of the node
+            prefix: Key prefix of the node
+
+        Returns:
+            Smallest key in the right child subtree
+        """
+        return (2 * prefix + 1) << (KEY_BITS - 1 - depth)
+
+    def _node(self, depth: int, prefix: int, lo: int, hi: int) -> bytes:
+        """
+        Compute the hash of the node covering keys[lo:hi].
+
+        Args:
+            depth: Depth of the node
+            prefix: Key prefix of the node
+            lo: Index of the first key in the node
+            hi: Index past the last key in the node
+
+        Returns:
+            32-byte node hash
+        """
+        count = hi - lo
+        if count == 0:
+            return EMPTY_HASH
+        if count == 1:
+            return self.leaves[self.keys[lo]]
+
+        cached = self.cache.get((depth, prefix))
+        if cached is not None:
+            return cached
+
+        mid = bisect_left(self.keys, self._mid_key(depth, prefix), lo, hi)
+        result = self.node_hash(
+            self._node(depth + 1, 2 * prefix, lo, mid),
+            self._node(depth + 1, 2 * prefix + 1, mid, hi)
+        )
+
+        self.cache[(depth, prefix)] = result
+        return result
+
+    def _invalidate(self, key_int: int) -> None:
+        """
+        Drop cached node hashes on the path of a key.
+
+        Only nodes holding at least two leaves are ever cached, so the walk
+        stops at the first node on the path below that size.
+
+        Args:
+            key_int: Key whose path changed
+        """
+        lo, hi = 0, len(self.keys)
+
+        for depth in range(KEY_BITS):
+            prefix = key_int >> (KEY_BITS - depth)
+            self.cache.pop((depth, prefix), None)
+
+            if hi - lo < 2:
+                break
+
+            mid = bisect_left(self.keys, self._mid_key(depth, prefix), lo, hi)
+            if (key_int >> (KEY_BITS - 1 - depth)) & 1:
+                lo = mid
+            else:
+                hi = mid
+
+class StateTrie:
+    """
+    Class maintaining the state root of a StateDB.
+
+    Accounts, contract storage slots, validator set membership, tasks,
+    clusters and the total supply are each committed as leaves of one sparse
+    Merkle tree, keyed by a domain-separated hash of their identifier.
+    """
+
+    def __init__(self, state):
+        """
+        Initialize a StateTrie instance by committing every entry of a state.
+
+        Args:
+            state: StateDB to commit
+        """
+        self.tree = SparseMerkleTree()
+        self.storage_slots: Dict[str, Set[str]] = {}  # contract address -> slots in the tree
+
+        for address, account in state.accounts.items():
+            self._update_account(address, account)
+            self._update_storage(address, account)
+
+        for address in state.validators:
+            self.tree.update(self.validator_key(address), self.value_hash(True))
+
+        for task_id, task in state.tasks.items():
+            self.tree.update(self.task_key(task_id), self.value_hash(task))
+
+        for cluster_id, cluster in state.clusters.items():
+            self.tree.update(self.cluster_key(cluster_id), self.value_hash(cluster))
+
+        self.tree.update(self.total_supply_key(), self.value_hash(state.total_supply))
+
+    @staticmethod
+    def value_hash(value: Any) -> bytes:
+        """
+        Hash a JSON-serializable value deterministically.
+
+        Args:
+            value: Value to hash
+
+        Returns:
+            32-byte value hash
+        """
+        return HashFunctions.sha3_256(json.dumps(value, sort_keys=True, separators=(',', ':')))
+
+    @staticmethod
+    def account_value(account) -> Dict[str, Any]:
+        """
+        Get the committed fields of an account (storage is committed per slot).
+
+        Args:
+            account: Account instance
+
+        Returns:
+            Dictionary of committed account fields
+        """
+        return {
+            "address": account.address,
+            "balance": account.balance,
+            "nonce": account.nonce,
+            "code": account.code,
+            "is_validator": account.is_validator,
+            "validator_data": account.validator_data
+        }
+
+    @staticmethod
+    def account_key(address: str) -> bytes:
+        """Get the tree key of an account."""
+        return HashFunctions.sha3_256("account:" + address)
+
+    @staticmethod
+    def storage_key(address: str, slot: str) -> bytes:
+        """Get the tree key of a contract storage slot."""
+        return HashFunctions.sha3_256(json.dumps(["storage", address, slot]))
+
+    @staticmethod
+    def validator_key(address: str) -> bytes:
+        """Get the tree key of a validator set entry."""
+        return HashFunctions.sha3_256("validator:" + address)
+
+    @staticmethod
+    def task_key(task_id: str) -> bytes:
+        """Get the tree key of a task."""
+        return HashFunctions.sha3_256("task:" + task_id)
+
+    @staticmethod
+    def cluster_key(cluster_id: str) -> bytes:
+        """Get the tree key of a validator cluster."""
+        return HashFunctions.sha3_256("cluster:" + cluster_id)
+
+    @staticmethod
+    def total_supply_key() -> bytes:
+        """Get the tree key of the total supply."""
+        return HashFunctions.sha3_256("meta:total_supply")
+
+    def update(self, state, touched: Set[Tuple[str, Any]]) -> None:
+        """
+        Update the leaves of all entries touched since the last update.
+
+        Args:
+            state: StateDB the trie commits to
+            touched: Set of (kind, key) pairs recorded by the state journal
+        """
+        for kind, key in touched:
+            if kind in ("account", "balance", "nonce", "code", "validator"):
+                account = state.accounts.get(key)
+                self._update_account(key, account)
+                if account is None:
+                    self._update_storage(key, None)
+
+            elif kind == "storage":
+                self._update_storage(key, state.accounts.get(key))
+
+            elif kind == "storage_slot":
+                address, slot = key
+                account = state.accounts.get(address)
+                storage = account.storage if account is not None else {}
+                slots = self.storage_slots.setdefault(address, set())
+
+                if slot in storage:
+                    slots.add(slot)
+                    self.tree.update(self.storage_key(address, slot), self.value_hash(storage[slot]))
+                else:
+                    slots.discard(slot)
+                    self.tree.update(self.storage_key(address, slot), None)
+
+            elif kind == "validator_set":
+                in_set = key in state.validators
+                self.tree.update(self.validator_key(key), self.value_hash(True) if in_set else None)
+
+            elif kind == "task":
+                task = state.tasks.get(key)
+                self.tree.update(self.task_key(key), self.value_hash(task) if task is not None else None)
+
+            elif kind == "cluster":
+                cluster = state.clusters.get(key)
+                self.tree.update(self.cluster_key(key), self.value_hash(cluster) if cluster is not None else None)
+
+            elif kind == "total_supply":
+                self.tree.update(self.total_supply_key(), self.value_hash(state.total_supply))
+
+    def root(self) -> bytes:
+        """
+        Get the current state root.
+
+        Returns:
+            32-byte state root
+        """
+        return self.tree.root()
+
+    def prove_account(self, address: str) -> Dict[str, Any]:
+        """
+        Generate a membership proof for an account.
+
+        Args:
+            address: Account address
+
+        Returns:
+            Proof as a dictionary
+        """
+        return self.tree.prove(self.account_key(address))
+
+    def prove_storage(self, address: str, slot: str) -> Dict[str, Any]:
+        """
+        Generate a membership proof for a contract storage slot.
+
+        Args:
+            address: Contract address
+            slot: Storage key
+
+        Returns:
+            Proof as a dictionary
+        """
+        return self.tree.prove(self.storage_key(address, slot))
+
+    def prove_validator(self, address: str) -> Dict[str, Any]:
+        """
+        Generate a membership proof for a validator set entry.
+
+        Args:
+            address: Validator address
+
+        Returns:
+            Proof as a dictionary
+        """
+        return self.tree.prove(self.validator_key(address))
+
+    @staticmethod
+    def verify_account(root: bytes, account, proof: Dict[str, Any]) -> bool:
+        """
+        Verify that an account is committed under a state root.
+
+        Args:
+            root: State root
+            account: Account instance with the claimed contents
+            proof: Proof generated by `prove_account`
+
+        Returns:
+            True if the proof is valid, False otherwise
+        """
+        return SparseMerkleTree.verify_proof(
+            root,
+            StateTrie.account_key(account.address),
+            StateTrie.value_hash(StateTrie.account_value(account)),
+            proof
+        )
+
+    @staticmethod
+    def verify_storage(root: bytes, address: str, slot: str, value: Any, proof: Dict[str, Any]) -> bool:
+        """
+        Verify that a contract storage slot is committed under a state root.
+
+        Args:
+            root: State root
+            address: Contract address
+            slot: Storage key
+            value: Claimed storage value
+            proof: Proof generated by `prove_storage`
+
+        Returns:
+            True if the proof is valid, False otherwise
+        """
+        return SparseMerkleTree.verify_proof(
+            root,
+            StateTrie.storage_key(address, slot),
+            StateTrie.value_hash(value),
+            proof
+        )
+
+    @staticmethod
+    def verify_validator(root: bytes, address: str, proof: Dict[str, Any]) -> bool:
+        """
+        Verify that an address is in the validator set committed under a state root.
+
+        Args:
+            root: State root
+            address: Validator address
+            proof: Proof generated by `prove_validator`
+
+        Returns:
+            True if the proof is valid, False otherwise
+        """
+        return SparseMerkleTree.verify_proof(
+            root,
+            StateTrie.validator_key(address),
+            StateTrie.value_hash(True),
+            proof
+        )
+
+    def _update_account(self, address: str, account) -> None:
+        """
+        Update the leaf of an account.
+
+        Args:
+            address: Account address
+            account: Account instance, or None if the account no longer exists
+        """
+        if account is None:
+            self.tree.update(self.account_key(address), None)
+        else:
+            self.tree.update(self.account_key(address), self.value_hash(self.account_value(account)))
+
+    def _update_storage(self, address: str, account) -> None:
+        """
+        Replace all storage slot leaves of an account.
+
+        Args:
+            address: Account address
+            account: Account instance, or None if the account no longer exists
+        """
+        storage = account.storage if account is not None else {}
+        old_slots = self.storage_slots.pop(address, set())
+
+        for slot in old_slots - set(storage):
+            self.tree.update(self.storage_key(address, slot), None)
+
+        for slot, value in storage.items():
+            self.tree.update(self.storage_key(address, slot), self.value_hash(value))
+
+        if storage:
+            self.storage_slots[address] = set(storage)
@@ -6,5 +6,7 @@ including transaction structure and related functionality.
 """
 
 from .transaction import Transaction, TransactionType, TransactionStatus, TransactionPool, TransactionBuilder
+from .history import TransactionHistory, ReplayFilter
+from .admission import TransactionAdmission
 
-__all__ = ['Transaction', 'TransactionType', 'TransactionStatus', 'TransactionPool', 'TransactionBuilder']
+__all__ = ['Transaction', 'TransactionType', 'TransactionStatus', 'TransactionPool', 'TransactionBuilder', 'TransactionHistory', 'ReplayFilter', 'TransactionAdmission']
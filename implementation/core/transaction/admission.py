@@ -0,0 +1,449 @@
+"""
+Transaction Admission Module for Synergy Network
+
+This module implements the admission pipeline of the transaction pool, which
+checks and inserts batches of transactions received from peers or submitted
+by clients. A batch is admitted in four stages:
+
+1. Deduplication against the batch itself and the pool; of several
+   transactions with the same sender and nonce, the highest fee is kept.
+   Coinbase transactions are only created by block producers and are
+   never admitted.
+2. Stateless checks (addresses, amount, fee) and Dilithium signature
+   verification, across a worker pool for large batches.
+3. Stateful checks (nonce and balance) against a view of the state cached
+   for the batch, so each sender's account is read once.
+4. Insertion of the surviving transactions into the pool in one pass.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+import sys
+
+# Add parent directory to path to import from other packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+from implementation.cryptography.pqc.dilithium import DilithiumSigner
+from implementation.core.transaction.transaction import Transaction, TransactionType, TransactionPool
+
+# Batches smaller than this are checked in the calling thread
+PARALLEL_ADMISSION_MIN_TRANSACTIONS = 32
+
+def verify_transactions(job: Tuple[List[Union[Transaction, bytes]], List[Optional[bytes]]]) -> List[Optional[str]]:
+    """
+    Run the stateless checks and signature verification of transactions.
+
+    Runs in the worker processes or threads.
+
+    Args:
+        job: Tuple of (transactions, or their encodings when sent to worker
+            processes, and public key per transaction or None to skip the
+            transaction's signature check)
+
+    Returns:
+        Error message per transaction, or None if it passed the checks
+    """
+    entries, public_keys = job
+    errors: List[Optional[str]] = []
+
+    messages = []
+    signatures = []
+    keys = []
+    indexes = []
+
+    for index, (entry, public_key) in enumerate(zip(entries, public_keys)):
+        try:
+            tx = Transaction.deserialize(entry) if isinstance(entry, bytes) else entry
+            valid = tx.verify_fields()
+        except Exception:
+            valid = False
+
+        if not valid:
+            errors.append("Invalid transaction fields")
+            continue
+
+        errors.append(None)
+        if public_key is None:
+            continue
+
+        if not tx.signature:
+            errors[index] = "Transaction is not signed"
+            continue
+
+        messages.append(tx.get_hash())
+        signatures.append(tx.signature)
+        keys.append(public_key)
+        indexes.append(index)
+
+    for index, valid in zip(indexes, DilithiumSigner.batch_verify(messages, signatures, keys)):
+        if not valid:
+            errors[index] = "Invalid signature"
+
+    return errors
+
+class _CachedState:
+    """View of the state caching the accounts read while admitting a batch."""
+
+    def __init__(self, state: Any):
+        self.state = state
+        self.balances: Dict[str, int] = {}
+        self.nonces: Dict[str, int] = {}
+
+    def get_balance(self, address: str) -> int:
+        balance = self.balances.get(address)
+        if balance is None:
+            balance = self.balances[address] = self.state.get_balance(address)
+        return balance
+
+    def get_nonce(self, address: str) -> int:
+        nonce = self.nonces.get(address)
+        if nonce is None:
+            nonce = self.nonces[address] = self.state.get_nonce(address)
+        return nonce
+
+class TransactionAdmission:
+    """Class checking batches of transactions and admitting them to a TransactionPool."""
+
+    def __init__(
+        self,
+        pool: TransactionPool,
+        state: Any = None,
+        public_key_resolver: Callable[[str], Optional[bytes]] = None,
+        max_workers: int = None,
+        use_processes: bool = False
+    ):
+        """
+        Initialize a TransactionAdmission instance.
+
+        Args:
+            pool: TransactionPool the admitted transactions are added to
+            state: State providing get_balance and get_nonce, e.g.
+                StateManager (nonces and balances are not checked if None)
+            public_key_resolver: Function mapping a sender address to its
+                public key, or None if unknown (signatures are not checked if
+                None; transactions of senders with unknown keys are rejected)
+            max_workers: Number of workers (defaults to the CPU count)
+            use_processes: Whether to check transactions in worker processes
+                rather than threads
+        """
+        self.pool = pool
+        self.state = state
+        self.public_key_resolver = public_key_resolver
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.executor: Optional[Executor] = None
+
+        # Statistics of the last admitted batch
+        self.stats = {"received": 0, "duplicates": 0, "rejected": 0, "admitted": 0}
+
+    def add_transactions(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """
+        Check a batch of transactions and add the valid ones to the pool.
+
+        Nonces above the sender's next one are accepted (the transactions
+        wait in the pool until the gap is filled), and each sender's balance
+        must cover its pending and admitted transactions.
+
+        Args:
+            transactions: Transactions received from a peer or a client
+
+        Returns:
+            Error message per transaction, in batch order, or None if it was
+            admitted
+        """
+        errors: List[Optional[str]] = [None] * len(transactions)
+        candidates = self._deduplicate(transactions, errors)
+        checked, jobs = self._verification_jobs(transactions, candidates, errors)
+
+        if len(jobs) > 1:
+            futures = [self.executor.submit(verify_transactions, job) for job in jobs]
+            results = [future.result() for future in futures]
+        else:
+            results = [verify_transactions(job) for job in jobs]
+
+        return self._admit(transactions, checked, results, errors)
+
+    async def add_transactions_async(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """
+        Check a batch of transactions and add the valid ones to the pool,
+        from an asyncio event loop (e.g. the p2p message handlers).
+
+        The checks of add_transactions run off the event loop, in the worker
+        pool or the loop's default executor; the pool is only read and
+        changed on the event loop.
+
+        Args:
+            transactions: Transactions received from a peer or a client
+
+        Returns:
+            Error message per transaction, in batch order, or None if it was
+            admitted
+        """
+        errors: List[Optional[str]] = [None] * len(transactions)
+        candidates = self._deduplicate(transactions, errors)
+        checked, jobs = self._verification_jobs(transactions, candidates, errors)
+
+        if len(jobs) > 1:
+            futures = [asyncio.wrap_future(self.executor.submit(verify_transactions, job)) for job in jobs]
+        else:
+            loop = asyncio.get_running_loop()
+            futures = [loop.run_in_executor(None, verify_transactions, job) for job in jobs]
+        results = await asyncio.gather(*futures)
+
+        # Transactions admitted while the checks ran are caught as duplicates
+        # by the pool; the state checks and insertion run without yielding
+        return self._admit(transactions, checked, results, errors)
+
+    def start(self) -> None:
+        """Start the worker pool (it is otherwise started by the first large batch)."""
+        if self.executor is None and self.max_workers > 1:
+            pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self.executor = pool_class(max_workers=self.max_workers)
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self) -> 'TransactionAdmission':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _admit(
+        self,
+        transactions: List[Transaction],
+        checked: List[int],
+        results: List[List[Optional[str]]],
+        errors: List[Optional[str]]
+    ) -> List[Optional[str]]:
+        """
+        Apply the results of the stateless checks, run the stateful checks
+        and insert the surviving transactions into the pool.
+
+        Args:
+            transactions: Batch of transactions
+            checked: Indexes of the transactions sent to the stateless checks
+            results: Error messages of each verification job, in job order
+            errors: Error message per transaction, updated in place
+
+        Returns:
+            Error message per transaction, in batch order, or None if it was
+            admitted
+        """
+        duplicates = sum(error in ("Duplicate transaction", "Duplicate nonce") for error in errors)
+
+        for index, error in zip(checked, [error for job_errors in results for error in job_errors]):
+            errors[index] = error
+        candidates = [index for index in checked if errors[index] is None]
+
+        if self.state is not None:
+            candidates = self._check_state(transactions, candidates, errors)
+
+        # Insert in nonce order, so each sender's queue advances once per transaction
+        candidates.sort(key=lambda index: (transactions[index].from_address or "", transactions[index].nonce))
+        added = self.pool.add_transactions([transactions[index] for index in candidates])
+        for index, kept in zip(candidates, added):
+            if not kept:
+                errors[index] = "Not kept by the transaction pool"
+
+        admitted = sum(added)
+        self.stats = {
+            "received": len(transactions),
+            "duplicates": duplicates,
+            "rejected": len(transactions) - duplicates - admitted,
+            "admitted": admitted
+        }
+
+        return errors
+
+    def _deduplicate(self, transactions: List[Transaction], errors: List[Optional[str]]) -> List[int]:
+        """
+        Drop coinbase transactions, the transactions already known, and all
+        but the highest fee of each sender and nonce in the batch.
+
+        Args:
+            transactions: Batch of transactions
+            errors: Error message per transaction, updated in place
+
+        Returns:
+            Indexes of the remaining transactions
+        """
+        pool = self.pool
+        seen = set()
+        by_nonce: Dict[Tuple[str, int], int] = {}
+
+        for index, tx in enumerate(transactions):
+            # Malformed fields would break the comparisons below and the pool's indexes
+            if not tx.has_valid_types():
+                errors[index] = "Invalid transaction fields"
+                continue
+
+            if tx.tx_id in seen or tx.tx_id in pool.pending_transactions or pool.is_confirmed(tx.tx_id):
+                errors[index] = "Duplicate transaction"
+                continue
+            seen.add(tx.tx_id)
+
+            if tx.tx_type == TransactionType.COINBASE:
+                errors[index] = "Coinbase transactions are not admitted"
+                continue
+
+            if tx.from_address is None:
+                # Rejected by the stateless checks
+                continue
+
+            key = (tx.from_address, tx.nonce)
+            other = by_nonce.get(key)
+            if other is not None:
+                if tx.fee <= transactions[other].fee:
+                    errors[index] = "Duplicate nonce"
+                    continue
+                errors[other] = "Duplicate nonce"
+            by_nonce[key] = index
+
+        return [index for index, error in enumerate(errors) if error is None]
+
+    def _verification_jobs(
+        self,
+        transactions: List[Transaction],
+        candidates: List[int],
+        errors: List[Optional[str]]
+    ) -> Tuple[List[int], List[Tuple[List[Union[Transaction, bytes]], List[Optional[bytes]]]]]:
+        """
+        Resolve the public keys of the candidates and split their stateless
+        checks into verify_transactions jobs.
+
+        Args:
+            transactions: Batch of transactions
+            candidates: Indexes of the transactions to check
+            errors: Error message per transaction, updated in place
+
+        Returns:
+            Tuple of (indexes of the transactions to check, and jobs: one per
+            worker for large batches, else at most one)
+        """
+        checked = []
+        entries = []
+        keys = []
+
+        for index in candidates:
+            tx = transactions[index]
+            public_key = None
+
+            if self.public_key_resolver is not None:
+                try:
+                    public_key = self.public_key_resolver(tx.from_address)
+                except Exception:
+                    public_key = None
+
+                if public_key is None:
+                    errors[index] = "Unknown public key"
+                    continue
+
+            checked.append(index)
+            entries.append(tx)
+            keys.append(public_key)
+
+        if not checked:
+            return checked, []
+
+        if self.max_workers <= 1 or len(checked) < PARALLEL_ADMISSION_MIN_TRANSACTIONS:
+            return checked, [(entries, keys)]
+
+        self.start()
+        if self.use_processes:
+            entries = [tx.serialize() for tx in entries]
+
+        # One job per worker, to amortize the dispatch
+        size = -(-len(entries) // self.max_workers)
+        jobs = [(entries[i:i + size], keys[i:i + size]) for i in range(0, len(entries), size)]
+        return checked, jobs
+
+    def _check_state(self, transactions: List[Transaction], candidates: List[int], errors: List[Optional[str]]) -> List[int]:
+        """
+        Check the nonces and balances of the candidates against a cached state view.
+
+        Args:
+            transactions: Batch of transactions
+            candidates: Indexes of the transactions to check
+            errors: Error message per transaction, updated in place
+
+        Returns:
+            Indexes of the transactions that passed the checks
+        """
+        view = _CachedState(self.state)
+        by_sender: Dict[str, List[int]] = {}
+        passed = []
+
+        for index in candidates:
+            by_sender.setdefault(transactions[index].from_address, []).append(index)
+
+        for sender, indexes in by_sender.items():
+            next_nonce = view.get_nonce(sender) + 1
+            balance = view.get_balance(sender)
+
+            # The sender's pending transactions, by nonce, and their total cost
+            pending = {tx.nonce: tx for tx in self.pool.get_sender_transactions(sender)}
+            spent = sum(tx.amount + tx.fee for tx in pending.values())
+
+            for index in sorted(indexes, key=lambda index: transactions[index].nonce):
+                tx = transactions[index]
+                if tx.nonce < next_nonce:
+                    errors[index] = "Stale nonce"
+                    continue
+
+                cost = tx.amount + tx.fee
+                replaced = pending.get(tx.nonce)
+                if replaced is not None:
+                    # The pool only replaces a pending transaction with a
+                    # higher fee, which then frees the replaced one's cost
+                    if tx.fee <= replaced.fee:
+                        errors[index] = "Fee too low to replace a pending transaction"
+                        continue
+                    cost -= replaced.amount + replaced.fee
+
+                if spent + cost > balance:
+                    errors[index] = "Insufficient balance"
+                    continue
+
+                spent += cost
+                passed.append(index)
+
+        return passed
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from implementation.cryptography.pqc.address import AddressGenerator
+
+    class ExampleState:
+        def get_balance(self, address: str) -> int:
+            return 1000
+
+        def get_nonce(self, address: str) -> int:
+            return 0
+
+    pool = TransactionPool()
+    senders = [AddressGenerator.generate_address(os.urandom(32), prefix="sYnQ") for _ in range(5)]
+    batch = [
+        Transaction(
+            tx_type=TransactionType.TRANSFER,
+            from_address=senders[i % len(senders)],
+            to_address=senders[(i + 1) % len(senders)],
+            amount=100,
+            fee=i,
+            nonce=i // len(senders) + 1
+        )
+        for i in range(60)
+    ]
+    batch.append(batch[0])
+
+    with TransactionAdmission(pool, state=ExampleState()) as admission:
+        start = time.perf_counter()
+        errors = admission.add_transactions(batch)
+        print(f"Admitted in {(time.perf_counter() - start) * 1000:.2f} ms: {admission.stats}")
+        print(f"Errors: {sorted(set(error for error in errors if error))}")
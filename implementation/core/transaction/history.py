@@ -0,0 +1,221 @@
+"""
+Transaction History Module for Synergy Network
+
+This module implements the bounded history of settled (confirmed or rejected)
+transactions kept by the transaction pool. Entries expire after a time to
+live, and the least recently stored entries are dropped once the history is
+full, so that its memory stays flat over long uptimes. It also implements the
+set of confirmed transaction IDs the pool checks for replays, which only
+covers the window of transaction timestamps the pool still admits.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+class TransactionHistory:
+    """Class implementing a mapping of transaction IDs to transactions with TTL and LRU bounds."""
+
+    def __init__(self, max_entries: int = 10000, ttl: int = 3600, clock: Callable[[], float] = time.time):
+        """
+        Initialize a TransactionHistory instance.
+
+        Args:
+            max_entries: Maximum number of transactions kept (unbounded if None)
+            ttl: Seconds a transaction is kept after it was stored (forever if None)
+            clock: Function returning the current time in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+
+        # tx_id -> (transaction, time stored), least recently stored first
+        self.entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self.entries)
+
+    def __contains__(self, tx_id: str) -> bool:
+        self._expire()
+        return tx_id in self.entries
+
+    def __getitem__(self, tx_id: str) -> Any:
+        self._expire()
+        return self.entries[tx_id][0]
+
+    def __setitem__(self, tx_id: str, transaction: Any) -> None:
+        """Store a transaction, as the most recent entry."""
+        self.entries.pop(tx_id, None)
+        self.entries[tx_id] = (transaction, self.clock())
+
+        self._expire()
+        if self.max_entries is not None:
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def __delitem__(self, tx_id: str) -> None:
+        del self.entries[tx_id]
+
+    def __iter__(self) -> Iterator[str]:
+        self._expire()
+        return iter(list(self.entries))
+
+    def get(self, tx_id: str, default: Any = None) -> Optional[Any]:
+        """
+        Get a transaction by ID.
+
+        Args:
+            tx_id: Transaction ID
+            default: Value returned if the transaction is not kept
+
+        Returns:
+            Transaction, or the default
+        """
+        self._expire()
+        entry = self.entries.get(tx_id)
+        return entry[0] if entry is not None else default
+
+    def pop(self, tx_id: str, default: Any = None) -> Optional[Any]:
+        """
+        Remove a transaction by ID.
+
+        Args:
+            tx_id: Transaction ID
+            default: Value returned if the transaction is not kept
+
+        Returns:
+            Removed transaction, or the default
+        """
+        entry = self.entries.pop(tx_id, None)
+        return entry[0] if entry is not None else default
+
+    def values(self) -> List[Any]:
+        """Get the kept transactions, least recently stored first."""
+        self._expire()
+        return [transaction for transaction, _ in self.entries.values()]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Get the kept (tx_id, transaction) pairs, least recently stored first."""
+        self._expire()
+        return [(tx_id, transaction) for tx_id, (transaction, _) in self.entries.items()]
+
+    def _expire(self) -> None:
+        """Drop the entries older than the time to live, oldest first."""
+        if self.ttl is None or not self.entries:
+            return
+
+        deadline = self.clock() - self.ttl
+        while self.entries:
+            tx_id, (_, stored) = next(iter(self.entries.items()))
+            if stored > deadline:
+                break
+            del self.entries[tx_id]
+
+class ReplayFilter:
+    """
+    Class implementing a set of confirmed transaction IDs bounded by a replay window.
+
+    IDs are kept as 64-bit digests in generations by transaction timestamp.
+    A generation is dropped as a whole once all its timestamps are older than
+    the window, so the filter only holds the IDs of transactions that could
+    still be admitted.
+    """
+
+    GENERATIONS = 8
+
+    def __init__(self, window: Optional[int], clock: Callable[[], float] = time.time):
+        """
+        Initialize a ReplayFilter instance.
+
+        Args:
+            window: Age in seconds beyond which transactions are no longer
+                admitted, and their IDs no longer kept (forever if None)
+            clock: Function returning the current time in seconds
+        """
+        self.window = window
+        self.clock = clock
+        self.span = max(window // self.GENERATIONS, 1) if window is not None else None
+
+        # Generation (timestamp // span) -> ID digests
+        self.generations: Dict[int, Set[int]] = {}
+
+    def __len__(self) -> int:
+        self._expire()
+        return sum(len(digests) for digests in self.generations.values())
+
+    def __contains__(self, tx_id: str) -> bool:
+        self._expire()
+        digest = self._digest(tx_id)
+        return any(digest in digests for digests in self.generations.values())
+
+    def add(self, tx_id: str, timestamp: int) -> None:
+        """
+        Add the ID of a confirmed transaction.
+
+        Args:
+            tx_id: Transaction ID
+            timestamp: Transaction timestamp
+        """
+        if timestamp <= self.cutoff():
+            return
+
+        generation = timestamp // self.span if self.span is not None else 0
+        self.generations.setdefault(generation, set()).add(self._digest(tx_id))
+        self._expire()
+
+    def discard(self, tx_id: str) -> None:
+        """
+        Remove a transaction ID if present.
+
+        Args:
+            tx_id: Transaction ID
+        """
+        digest = self._digest(tx_id)
+        for digests in self.generations.values():
+            digests.discard(digest)
+
+    def cutoff(self) -> float:
+        """
+        Get the timestamp at or below which transactions are outside the window.
+
+        Returns:
+            Cutoff timestamp (minus infinity without a window)
+        """
+        if self.window is None:
+            return float("-inf")
+        return self.clock() - self.window
+
+    @staticmethod
+    def _digest(tx_id: str) -> int:
+        """Compute the 64-bit digest of a transaction ID."""
+        return int.from_bytes(hashlib.blake2b(tx_id.encode(), digest_size=8).digest(), "big")
+
+    def _expire(self) -> None:
+        """Drop the generations whose timestamps are all outside the window."""
+        if self.window is None:
+            return
+
+        cutoff = self.cutoff()
+        for generation in [generation for generation in self.generations if (generation + 1) * self.span <= cutoff]:
+            del self.generations[generation]
+
+# Example usage
+if __name__ == "__main__":
+    now = [0.0]
+    history = TransactionHistory(max_entries=3, ttl=60, clock=lambda: now[0])
+
+    for i in range(5):
+        history[f"tx{i}"] = {"index": i}
+        now[0] += 10
+
+    print(f"Kept after 5 inserts: {list(history)}")
+
+    now[0] += 35
+    print(f"Kept after the first expired: {list(history)}")
+
+    replays = ReplayFilter(window=80, clock=lambda: now[0])
+    replays.add("tx1", timestamp=int(now[0]))
+    now[0] += 100
+    print(f"Confirmed ID kept after the window: {'tx1' in replays}")
@@ -5,10 +5,11 @@ This module implements the transaction structure and related functionality
 for the Synergy Network blockchain.
 """
 
+import heapq
+import itertools
 import time
-import json
 import uuid
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable
 import sys
 import os
 
@@ -17,6 +18,15 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.
 from implementation.cryptography.pqc.hash import HashFunctions
 from implementation.cryptography.pqc.dilithium import DilithiumSigner
 from implementation.cryptography.pqc.address import AddressGenerator
+from implementation.core.encoding.codec import CodecError, encode_transaction, decode_transaction, to_json
+from implementation.core.transaction.history import TransactionHistory, ReplayFilter
+
+# Default limits of the transaction pool
+DEFAULT_MAX_PENDING = 100000
+DEFAULT_MAX_PENDING_BYTES = 256 * 1024 * 1024
+DEFAULT_HISTORY_SIZE = 10000
+DEFAULT_HISTORY_TTL = 3600
+DEFAULT_REPLAY_WINDOW = 3600
 
 class TransactionType:
     """Enumeration of transaction types in the Synergy Network."""
@@ -41,6 +51,12 @@ class TransactionStatus:
 class Transaction:
     """Class representing a transaction in the Synergy Network."""
     
+    # Fields covered by the transaction hash (everything but the signature)
+    HASHED_FIELDS = frozenset([
+        "tx_id", "tx_type", "from_address", "to_address", "amount", "fee",
+        "nonce", "data", "timestamp"
+    ])
+    
     def __init__(
         self,
         tx_type: str,
@@ -69,6 +85,9 @@ class Transaction:
             signature: Transaction signature
             tx_id: Transaction ID
         """
+        # Memoized hash, cleared whenever a hashed field is assigned
+        self._hash: Optional[bytes] = None
+        
         self.tx_type = tx_type
         self.from_address = from_address
         self.to_address = to_address
@@ -80,6 +99,21 @@ class Transaction:
         self.signature = signature
         self.tx_id = tx_id or str(uuid.uuid4())
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the memoized hash if it is hashed."""
+        if name in self.HASHED_FIELDS:
+            self.__dict__["_hash"] = None
+        object.__setattr__(self, name, value)
+    
+    def invalidate_hash(self) -> None:
+        """
+        Invalidate the memoized hash.
+        
+        Must be called after modifying the data dictionary in place, as
+        only attribute assignments are detected.
+        """
+        self._hash = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert Transaction to dictionary.
@@ -126,12 +160,12 @@ class Transaction:
     
     def serialize(self) -> bytes:
         """
-        Serialize the transaction to bytes.
+        Serialize the transaction to its canonical binary encoding.
         
         Returns:
             Serialized transaction
         """
-        return json.dumps(self.to_dict(), sort_keys=True).encode('utf-8')
+        return encode_transaction(self)
     
     @classmethod
     def deserialize(cls, data: bytes) -> 'Transaction':
@@ -143,23 +177,37 @@ class Transaction:
         
         Returns:
             Transaction instance
+        
+        Raises:
+            CodecError: If the data is not a valid encoded transaction
+        """
+        return cls(**decode_transaction(data))
+    
+    def to_json(self) -> str:
+        """
+        Render the transaction as JSON for debugging.
+        
+        Returns:
+            Indented JSON string
         """
-        tx_dict = json.loads(data.decode('utf-8'))
-        return cls.from_dict(tx_dict)
+        return to_json(self.to_dict())
     
     def get_hash(self) -> bytes:
         """
         Compute the hash of the transaction.
         
+        The hash is computed once and memoized until a hashed field changes.
+        
         Returns:
             32-byte hash digest
         """
-        # Create a dictionary representation without the signature
-        tx_dict = self.to_dict()
-        tx_dict.pop("signature", None)
+        tx_hash = self._hash
+        if tx_hash is None:
+            # Hash the canonical encoding without the signature
+            tx_hash = HashFunctions.sha3_256(encode_transaction(self, include_signature=False))
+            self._hash = tx_hash
         
-        # Use the hash function from the cryptography package
-        return HashFunctions.hash_transaction(tx_dict)
+        return tx_hash
     
     def sign(self, private_key: bytes) -> bool:
         """
@@ -198,16 +246,36 @@ class Transaction:
         # Verify the signature
         return DilithiumSigner.verify(tx_hash, self.signature, public_key)
     
-    def verify(self, state) -> bool:
+    def has_valid_types(self) -> bool:
         """
-        Verify the transaction's validity.
+        Check the types of the transaction's fields, e.g. of a transaction
+        built from a peer's dictionary.
         
-        Args:
-            state: Current blockchain state
+        Returns:
+            True if the IDs and addresses are strings and the amount, fee,
+            nonce and timestamp are integers, False otherwise
+        """
+        if not isinstance(self.tx_type, str) or not isinstance(self.tx_id, str):
+            return False
+        
+        if not all(address is None or isinstance(address, str) for address in (self.from_address, self.to_address)):
+            return False
+        
+        return all(
+            isinstance(value, int) and not isinstance(value, bool)
+            for value in (self.amount, self.fee, self.nonce, self.timestamp)
+        )
+    
+    def verify_fields(self) -> bool:
+        """
+        Verify the transaction's fields, without the state (types, addresses, amount and fee).
         
         Returns:
-            True if transaction is valid, False otherwise
+            True if the fields are valid, False otherwise
         """
+        if not self.has_valid_types():
+            return False
+        
         # Coinbase transactions don't need verification
         if self.tx_type == TransactionType.COINBASE:
             return True
@@ -228,6 +296,27 @@ class Transaction:
         if self.fee < 0:
             return False
         
+        return True
+    
+    def verify(self, state, allow_future_nonce: bool = False) -> bool:
+        """
+        Verify the transaction's validity.
+        
+        Args:
+            state: Current blockchain state
+            allow_future_nonce: Whether to accept nonces above the next one,
+                for transactions queued in the pool until the gap is filled
+        
+        Returns:
+            True if transaction is valid, False otherwise
+        """
+        # Coinbase transactions don't need verification
+        if self.tx_type == TransactionType.COINBASE:
+            return True
+        
+        if not self.verify_fields():
+            return False
+        
         # Verify sender has enough balance
         sender_balance = state.get_balance(self.from_address)
         if sender_balance < self.amount + self.fee:
@@ -235,41 +324,396 @@ class Transaction:
         
         # Verify nonce is correct
         expected_nonce = state.get_nonce(self.from_address) + 1
-        if self.nonce != expected_nonce:
+        if self.nonce != expected_nonce and not (allow_future_nonce and self.nonce > expected_nonce):
             return False
         
         # Verify signature (would need public key from state)
         # This is a simplified version
         return True
 
+class _SenderQueue:
+    """Pending transactions of one sender, by nonce."""
+    
+    __slots__ = ("base", "ready_end", "transactions")
+    
+    def __init__(self, base: int):
+        # Next nonce the state expects, and the first nonce after the ready
+        # (contiguous from base) transactions
+        self.base = base
+        self.ready_end = base
+        self.transactions: Dict[int, Transaction] = {}
+
 class TransactionPool:
-    """Class for managing pending transactions in the Synergy Network."""
+    """
+    Class for managing pending transactions in the Synergy Network.
+    
+    Pending transactions are indexed by fee in two heaps, highest fee first
+    for block building and lowest fee first for eviction. Heap entries of
+    transactions that leave the pending set are skipped when reached and
+    dropped when the heaps are compacted.
+    
+    Pending transactions are also queued per sender by nonce. Transactions
+    whose nonces run contiguously from the sender's next expected nonce are
+    "ready"; the others wait as "future" transactions until the gap before
+    them is filled. Ready transactions have their own fee heap.
+    
+    The pending set is bounded by count and encoded size, the lowest-fee
+    transactions being evicted when a limit is exceeded, and confirmed and
+    rejected transactions are kept in bounded histories.
+    """
     
-    def __init__(self):
-        """Initialize a TransactionPool instance."""
+    # Events passed to the listeners of the pending set
+    ADDED = "added"
+    REMOVED = "removed"
+    
+    def __init__(
+        self,
+        nonce_provider: Callable[[str], int] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        history_ttl: int = DEFAULT_HISTORY_TTL,
+        replay_window: int = DEFAULT_REPLAY_WINDOW
+    ):
+        """
+        Initialize a TransactionPool instance.
+        
+        Args:
+            nonce_provider: Function mapping a sender address to the nonce of
+                its last applied transaction, e.g. StateManager.get_nonce (if
+                None, a sender's lowest pending nonce is taken as its next one)
+            max_pending: Maximum number of pending transactions (unbounded if None)
+            max_pending_bytes: Maximum total encoded size of the pending
+                transactions (unbounded if None)
+            history_size: Maximum number of confirmed, and of rejected,
+                transactions kept (unbounded if None)
+            history_ttl: Seconds confirmed and rejected transactions are kept
+                (forever if None)
+            replay_window: Maximum age in seconds of transactions whose
+                replays are caught by ID rather than by nonce, i.e. all
+                transactions without a nonce provider; older ones are not
+                admitted (no limit if None)
+        """
+        self.nonce_provider = nonce_provider
+        self.max_pending = max_pending
+        self.max_pending_bytes = max_pending_bytes
+        
         self.pending_transactions: Dict[str, Transaction] = {}
-        self.confirmed_transactions: Dict[str, Transaction] = {}
-        self.rejected_transactions: Dict[str, Transaction] = {}
+        self.confirmed_transactions = TransactionHistory(history_size, history_ttl)
+        self.rejected_transactions = TransactionHistory(history_size, history_ttl)
+        
+        # IDs of the confirmed transactions not covered by the nonce provider
+        # (all of them without one) within the replay window, so that a
+        # confirmed transaction is not admitted again once it leaves the
+        # bounded confirmed history
+        self.confirmed_ids = ReplayFilter(replay_window)
+        
+        # Encoded size of each pending transaction, and their total
+        self.pending_sizes: Dict[str, int] = {}
+        self.pending_bytes = 0
+        
+        # Functions notified when transactions enter or leave the pending set
+        self.listeners: List[Callable[[str, Transaction], None]] = []
+        
+        # Fee index: heap entries are (-fee or fee, sequence, tx_id); an entry
+        # is current if its sequence is the transaction's
+        self._priority_heap: List[tuple] = []
+        self._eviction_heap: List[tuple] = []
+        self._sequences: Dict[str, int] = {}
+        self._counter = itertools.count()
+        
+        # Sender queues, and the fee heap of ready transactions: entries are
+        # (-fee, sequence, ready sequence, tx_id), current if the ready
+        # sequence is the transaction's
+        self.senders: Dict[str, _SenderQueue] = {}
+        self._ready_heap: List[tuple] = []
+        self._ready_sequences: Dict[str, int] = {}
+        
+        # Expiry index: heap entries are (timestamp, sequence, tx_id), current
+        # under the same rule as the fee index
+        self._expiry_heap: List[tuple] = []
+    
+    def add_listener(self, listener: Callable[[str, Transaction], None]) -> None:
+        """
+        Register a function notified when a transaction enters or leaves the
+        pending set, e.g. BlockTemplate.on_pool_event.
+        
+        Args:
+            listener: Function taking the event (ADDED or REMOVED) and the transaction
+        """
+        self.listeners.append(listener)
+    
+    def _notify(self, event: str, transaction: Transaction) -> None:
+        """Notify the listeners of a change of the pending set."""
+        for listener in self.listeners:
+            listener(event, transaction)
+    
+    def _index(self, transaction: Transaction, size: int) -> None:
+        """Add a pending transaction, of the given encoded size, to the fee and expiry indexes."""
+        self.pending_sizes[transaction.tx_id] = size
+        self.pending_bytes += size
+        
+        sequence = next(self._counter)
+        self._sequences[transaction.tx_id] = sequence
+        heapq.heappush(self._priority_heap, (-transaction.fee, sequence, transaction.tx_id))
+        heapq.heappush(self._eviction_heap, (transaction.fee, sequence, transaction.tx_id))
+        heapq.heappush(self._expiry_heap, (transaction.timestamp, sequence, transaction.tx_id))
+    
+    def _promote(self, transaction: Transaction) -> None:
+        """Mark a pending transaction as ready."""
+        tx_id = transaction.tx_id
+        ready_sequence = next(self._counter)
+        self._ready_sequences[tx_id] = ready_sequence
+        heapq.heappush(self._ready_heap, (-transaction.fee, self._sequences[tx_id], ready_sequence, tx_id))
+    
+    def _advance(self, queue: _SenderQueue) -> None:
+        """Promote the transactions that now run contiguously from the ready ones."""
+        while queue.ready_end in queue.transactions:
+            self._promote(queue.transactions[queue.ready_end])
+            queue.ready_end += 1
+    
+    def _truncate(self, queue: _SenderQueue, nonce: int) -> None:
+        """Demote the ready transactions from a nonce on, after a gap opened at it."""
+        for later in range(nonce, queue.ready_end):
+            transaction = queue.transactions.get(later)
+            if transaction is not None:
+                self._ready_sequences.pop(transaction.tx_id, None)
+        
+        queue.ready_end = min(queue.ready_end, nonce)
+    
+    def _rebase(self, sender: str, queue: _SenderQueue, base: int) -> List[Transaction]:
+        """
+        Move a sender's next expected nonce, rejecting the transactions below it.
+        
+        Args:
+            sender: Sender address
+            queue: Sender's queue
+            base: New next expected nonce
+        
+        Returns:
+            List of rejected transactions
+        """
+        stale = []
+        
+        if base > queue.base:
+            if base - queue.base <= len(queue.transactions):
+                nonces = [nonce for nonce in range(queue.base, base) if nonce in queue.transactions]
+            else:
+                nonces = [nonce for nonce in queue.transactions if nonce < base]
+            
+            # Take the stale transactions out of the queue first, so that
+            # rejecting them does not open gaps
+            stale = [queue.transactions.pop(nonce) for nonce in nonces]
+            queue.base = base
+            queue.ready_end = max(queue.ready_end, base)
+        elif base < queue.base:
+            self._truncate(queue, queue.base)
+            queue.base = base
+            queue.ready_end = base
+        
+        self._advance(queue)
+        
+        for transaction in stale:
+            self.mark_as_rejected(transaction.tx_id, "stale nonce")
+        
+        if not queue.transactions and self.senders.get(sender) is queue:
+            del self.senders[sender]
+        
+        return stale
+    
+    def _pop_pending(self, tx_id: str, confirmed: bool = False) -> Transaction:
+        """
+        Remove a transaction from the pending set and its indexes.
+        
+        Args:
+            tx_id: ID of a pending transaction
+            confirmed: Whether the transaction was included in a block, which
+                moves its sender's next expected nonce past it
+        
+        Returns:
+            Removed transaction
+        """
+        tx = self.pending_transactions.pop(tx_id)
+        del self._sequences[tx_id]
+        self._ready_sequences.pop(tx_id, None)
+        self.pending_bytes -= self.pending_sizes.pop(tx_id)
+        
+        sender = tx.from_address
+        queue = self.senders.get(sender)
+        if queue is not None and queue.transactions.get(tx.nonce) is tx:
+            del queue.transactions[tx.nonce]
+            
+            if confirmed and tx.nonce >= queue.base:
+                self._rebase(sender, queue, tx.nonce + 1)
+            else:
+                self._truncate(queue, tx.nonce)
+            
+            if not queue.transactions and self.senders.get(sender) is queue:
+                del self.senders[sender]
+        
+        # Compact the heaps once most of their entries are stale
+        if len(self._priority_heap) > 2 * len(self._sequences) + 64:
+            self._priority_heap = [entry for entry in self._priority_heap if self._sequences.get(entry[2]) == entry[1]]
+            self._eviction_heap = [entry for entry in self._eviction_heap if self._sequences.get(entry[2]) == entry[1]]
+            self._expiry_heap = [entry for entry in self._expiry_heap if self._sequences.get(entry[2]) == entry[1]]
+            heapq.heapify(self._priority_heap)
+            heapq.heapify(self._eviction_heap)
+            heapq.heapify(self._expiry_heap)
+        
+        if len(self._ready_heap) > 2 * len(self._ready_sequences) + 64:
+            self._ready_heap = [entry for entry in self._ready_heap if self._ready_sequences.get(entry[3]) == entry[2]]
+            heapq.heapify(self._ready_heap)
+        
+        self._notify(self.REMOVED, tx)
+        return tx
+    
+    def _enforce_limits(self) -> None:
+        """Evict the lowest-fee pending transactions while a limit is exceeded."""
+        while self.pending_transactions and (
+            (self.max_pending is not None and len(self.pending_transactions) > self.max_pending)
+            or (self.max_pending_bytes is not None and self.pending_bytes > self.max_pending_bytes)
+        ):
+            self.evict_transactions(1)
+    
+    def _top(self, heap: List[tuple], limit: int) -> List[Transaction]:
+        """
+        Get the first pending transactions of a fee heap, leaving it unchanged.
+        
+        Args:
+            heap: Fee heap
+            limit: Maximum number of transactions to return
+        
+        Returns:
+            List of transactions in heap order
+        """
+        sequences = self._sequences
+        popped = []
+        
+        while heap and len(popped) < limit:
+            entry = heapq.heappop(heap)
+            if sequences.get(entry[2]) == entry[1]:
+                popped.append(entry)
+        
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        
+        return [self.pending_transactions[entry[2]] for entry in popped]
     
     def add_transaction(self, transaction: Transaction) -> bool:
         """
         Add a transaction to the pool.
         
+        A transaction with the same sender and nonce as a pending one
+        replaces it if its fee is higher; the replaced transaction is rejected.
+        If the pool is then over its limits, the lowest-fee transactions are
+        evicted.
+        
         Args:
             transaction: Transaction to add
         
         Returns:
-            True if transaction was added, False otherwise
+            True if transaction was added and kept, False otherwise
+        """
+        if not self._insert(transaction):
+            return False
+        
+        self._enforce_limits()
+        return transaction.tx_id in self.pending_transactions
+    
+    def add_transactions(self, transactions: List[Transaction]) -> List[bool]:
+        """
+        Add a batch of transactions to the pool in one pass.
+        
+        Transactions are inserted as by add_transaction, but the pool limits
+        are enforced once for the whole batch. Transactions are not verified;
+        see TransactionAdmission for the checked admission of a batch.
+        
+        Args:
+            transactions: Transactions to add
+        
+        Returns:
+            Whether each transaction was added and kept, in batch order
+        """
+        inserted = []
+        for transaction in transactions:
+            try:
+                inserted.append(self._insert(transaction))
+            except Exception:
+                # A malformed transaction must not stop the rest of the batch
+                inserted.append(False)
+        
+        self._enforce_limits()
+        
+        return [
+            added and transaction.tx_id in self.pending_transactions
+            for transaction, added in zip(transactions, inserted)
+        ]
+    
+    def _insert(self, transaction: Transaction) -> bool:
+        """
+        Insert a transaction into the pending set, without enforcing the limits.
+        
+        Args:
+            transaction: Transaction to add
+        
+        Returns:
+            True if transaction was inserted, False otherwise
         """
         # Check if transaction already exists
         if transaction.tx_id in self.pending_transactions:
             return False
         
-        if transaction.tx_id in self.confirmed_transactions:
+        if self.is_confirmed(transaction.tx_id):
             return False
         
+        # Encode before touching the pool, so that a transaction with
+        # malformed fields leaves it unchanged
+        try:
+            size = len(encode_transaction(transaction))
+        except CodecError:
+            return False
+        
+        # Confirmed IDs are only remembered within the replay window
+        if not self._covered_by_nonce(transaction) and transaction.timestamp <= self.confirmed_ids.cutoff():
+            return False
+        
+        sender = transaction.from_address
+        if transaction.tx_type == TransactionType.COINBASE or sender is None:
+            # Not subject to nonces: always ready
+            self.pending_transactions[transaction.tx_id] = transaction
+            self._index(transaction, size)
+            self._promote(transaction)
+            self._notify(self.ADDED, transaction)
+            return True
+        
+        queue = self.senders.get(sender)
+        if queue is None:
+            base = self.nonce_provider(sender) + 1 if self.nonce_provider else transaction.nonce
+            queue = _SenderQueue(base)
+        
+        if transaction.nonce < queue.base:
+            if self.nonce_provider:
+                # Already used
+                return False
+            
+            # Without a state, an earlier nonce becomes the next expected one
+            self._truncate(queue, queue.base)
+            queue.base = transaction.nonce
+            queue.ready_end = transaction.nonce
+        
+        replaced = queue.transactions.get(transaction.nonce)
+        if replaced is not None:
+            if transaction.fee <= replaced.fee:
+                return False
+            self.mark_as_rejected(replaced.tx_id, "replaced by fee")
+        
         # Add to pending transactions
+        self.senders[sender] = queue
+        queue.transactions[transaction.nonce] = transaction
         self.pending_transactions[transaction.tx_id] = transaction
+        self._index(transaction, size)
+        self._advance(queue)
+        self._notify(self.ADDED, transaction)
         
         return True
     
@@ -297,6 +741,49 @@ class TransactionPool:
         
         return None
     
+    def get_transaction_by_nonce(self, sender: str, nonce: int) -> Optional[Transaction]:
+        """
+        Get the pending transaction of a sender with a nonce.
+        
+        Args:
+            sender: Sender address
+            nonce: Transaction nonce
+        
+        Returns:
+            Transaction instance or None if not found
+        """
+        queue = self.senders.get(sender)
+        return queue.transactions.get(nonce) if queue is not None else None
+    
+    def get_sender_transactions(self, sender: str) -> List[Transaction]:
+        """
+        Get the pending transactions of a sender.
+        
+        Args:
+            sender: Sender address
+        
+        Returns:
+            List of transactions in nonce order
+        """
+        queue = self.senders.get(sender)
+        if queue is None:
+            return []
+        
+        return [queue.transactions[nonce] for nonce in sorted(queue.transactions)]
+    
+    def is_ready(self, tx_id: str) -> bool:
+        """
+        Check whether a pending transaction is ready, i.e. all lower nonces of
+        its sender are applied or pending.
+        
+        Args:
+            tx_id: Transaction ID
+        
+        Returns:
+            True if the transaction is pending and ready, False otherwise
+        """
+        return tx_id in self._ready_sequences
+    
     def get_pending_transactions(self, limit: int = 100) -> List[Transaction]:
         """
         Get pending transactions.
@@ -307,19 +794,130 @@ class TransactionPool:
         Returns:
             List of pending transactions
         """
-        # Sort by fee (highest first)
-        sorted_txs = sorted(
-            self.pending_transactions.values(),
-            key=lambda tx: tx.fee,
-            reverse=True
-        )
+        # Highest fee first, oldest first among equal fees
+        return self._top(self._priority_heap, limit)
+    
+    def get_ready_transactions(self, limit: int = 100) -> List[Transaction]:
+        """
+        Get ready transactions by fee, in an order they can be applied in.
+        
+        Transactions are taken highest fee first, but a transaction is only
+        taken after its sender's lower nonces.
+        
+        Args:
+            limit: Maximum number of transactions to return
+        
+        Returns:
+            List of ready transactions, each sender's in nonce order
+        """
+        heap = self._ready_heap
+        ready_sequences = self._ready_sequences
+        popped = []
+        result = []
+        
+        # Next nonce to take per sender, transactions waiting for a lower
+        # nonce, and waiting transactions whose lower nonce was taken
+        next_nonces: Dict[str, int] = {}
+        waiting: Dict[tuple, tuple] = {}
+        eligible: List[tuple] = []
+        
+        while len(result) < limit:
+            while heap and ready_sequences.get(heap[0][3]) != heap[0][2]:
+                heapq.heappop(heap)
+            
+            if eligible and (not heap or eligible[0] < heap[0]):
+                entry = heapq.heappop(eligible)
+            elif heap:
+                entry = heapq.heappop(heap)
+                popped.append(entry)
+            else:
+                break
+            
+            transaction = self.pending_transactions[entry[3]]
+            sender = transaction.from_address
+            queue = self.senders.get(sender) if transaction.tx_type != TransactionType.COINBASE else None
+            
+            if queue is not None:
+                expected = next_nonces.get(sender, queue.base)
+                if transaction.nonce != expected:
+                    waiting[(sender, transaction.nonce)] = entry
+                    continue
+                
+                next_nonces[sender] = expected + 1
+                following = waiting.pop((sender, expected + 1), None)
+                if following is not None:
+                    heapq.heappush(eligible, following)
+            
+            result.append(transaction)
+        
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        
+        return result
+    
+    def get_lowest_fee_transactions(self, limit: int = 100) -> List[Transaction]:
+        """
+        Get the pending transactions with the lowest fees.
+        
+        Args:
+            limit: Maximum number of transactions to return
+        
+        Returns:
+            List of pending transactions, lowest fee first
+        """
+        return self._top(self._eviction_heap, limit)
+    
+    def evict_transactions(self, count: int) -> List[Transaction]:
+        """
+        Reject the pending transactions with the lowest fees.
+        
+        Args:
+            count: Number of transactions to reject
+        
+        Returns:
+            List of rejected transactions
+        """
+        evicted = []
+        sequences = self._sequences
+        
+        while self._eviction_heap and len(evicted) < count:
+            fee, sequence, tx_id = heapq.heappop(self._eviction_heap)
+            if sequences.get(tx_id) == sequence:
+                evicted.append(self.pending_transactions[tx_id])
+                self.mark_as_rejected(tx_id, "evicted")
+        
+        return evicted
+    
+    def revalidate_senders(self, senders: List[str]) -> List[Transaction]:
+        """
+        Reload the next expected nonce of senders after a block was applied,
+        rejecting their transactions with used nonces and promoting the ones
+        that became ready. Only the given senders' queues are touched.
+        
+        Args:
+            senders: Addresses of the senders whose state changed
+        
+        Returns:
+            List of rejected transactions
+        """
+        rejected = []
+        if self.nonce_provider is None:
+            return rejected
         
-        return sorted_txs[:limit]
+        for sender in senders:
+            queue = self.senders.get(sender)
+            if queue is not None:
+                rejected.extend(self._rebase(sender, queue, self.nonce_provider(sender) + 1))
+        
+        return rejected
     
     def mark_as_confirmed(self, tx_id: str) -> bool:
         """
         Mark a transaction as confirmed.
         
+        The sender's lower pending nonces can no longer be applied and are
+        rejected.
+        
         Args:
             tx_id: Transaction ID
         
@@ -330,11 +928,49 @@ class TransactionPool:
             return False
         
         # Move from pending to confirmed
-        tx = self.pending_transactions.pop(tx_id)
+        tx = self._pop_pending(tx_id, confirmed=True)
         self.confirmed_transactions[tx_id] = tx
         
+        # With a nonce provider, the used nonce already keeps the sender's
+        # transactions out
+        if not self._covered_by_nonce(tx):
+            self.confirmed_ids.add(tx_id, tx.timestamp)
+        
         return True
     
+    def _covered_by_nonce(self, transaction: Transaction) -> bool:
+        """
+        Check whether the nonce provider keeps a transaction from being replayed.
+        
+        Args:
+            transaction: Transaction
+        
+        Returns:
+            True if a confirmed copy of the transaction is rejected by nonce,
+            False if it must be rejected by ID
+        """
+        return (
+            self.nonce_provider is not None
+            and transaction.tx_type != TransactionType.COINBASE
+            and transaction.from_address is not None
+        )
+    
+    def is_confirmed(self, tx_id: str) -> bool:
+        """
+        Check whether a transaction was confirmed, including confirmed
+        transactions no longer kept in the confirmed history.
+        
+        Transactions whose nonce was used are not checked here; they are
+        rejected through the nonce provider.
+        
+        Args:
+            tx_id: Transaction ID
+        
+        Returns:
+            True if transaction was confirmed, False otherwise
+        """
+        return tx_id in self.confirmed_transactions or tx_id in self.confirmed_ids
+    
     def mark_as_rejected(self, tx_id: str, reason: str = None) -> bool:
         """
         Mark a transaction as rejected.
@@ -350,12 +986,13 @@ class TransactionPool:
             return False
         
         # Move from pending to rejected
-        tx = self.pending_transactions.pop(tx_id)
+        tx = self._pop_pending(tx_id)
         self.rejected_transactions[tx_id] = tx
         
         # Add rejection reason to transaction data
         if reason:
             tx.data["rejection_reason"] = reason
+            tx.invalidate_hash()
         
         return True
     
@@ -371,12 +1008,13 @@ class TransactionPool:
         """
         # Check pending transactions
         if tx_id in self.pending_transactions:
-            del self.pending_transactions[tx_id]
+            self._pop_pending(tx_id)
             return True
         
         # Check confirmed transactions
-        if tx_id in self.confirmed_transactions:
-            del self.confirmed_transactions[tx_id]
+        if self.is_confirmed(tx_id):
+            self.confirmed_transactions.pop(tx_id)
+            self.confirmed_ids.discard(tx_id)
             return True
         
         # Check rejected transactions
@@ -390,22 +1028,29 @@ class TransactionPool:
         """
         Clear expired transactions from the pool.
         
+        Pending transactions are visited oldest first through the expiry
+        index, so a call costs O(expired log pool) rather than a scan of the
+        pool; it is meant to run periodically, e.g. from Node's expiry sweep.
+        
         Args:
             max_age: Maximum age of transactions in seconds
         
         Returns:
             Number of transactions cleared
         """
-        current_time = int(time.time())
+        deadline = int(time.time()) - max_age
         expired_count = 0
         
-        # Check pending transactions
-        for tx_id, tx in list(self.pending_transactions.items()):
-            if current_time - tx.timestamp > max_age:
-                self.pending_transactions.pop(tx_id)
-                tx.data["expiration_reason"] = "timeout"
-                self.rejected_transactions[tx_id] = tx
-                expired_count += 1
+        while self._expiry_heap and self._expiry_heap[0][0] < deadline:
+            _, sequence, tx_id = heapq.heappop(self._expiry_heap)
+            if self._sequences.get(tx_id) != sequence:
+                continue
+            
+            tx = self._pop_pending(tx_id)
+            tx.data["expiration_reason"] = "timeout"
+            tx.invalidate_hash()
+            self.rejected_transactions[tx_id] = tx
+            expired_count += 1
         
         return expired_count
     
@@ -418,6 +1063,9 @@ class TransactionPool:
         """
         return {
             "pending": len(self.pending_transactions),
+            "pending_bytes": self.pending_bytes,
+            "ready": len(self._ready_sequences),
+            "future": len(self.pending_transactions) - len(self._ready_sequences),
             "confirmed": len(self.confirmed_transactions),
             "rejected": len(self.rejected_transactions),
             "total": len(self.pending_transactions) + len(self.confirmed_transactions) + len(self.rejected_transactions)
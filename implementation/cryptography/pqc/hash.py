@@ -6,7 +6,9 @@ including SHA3-256 and BLAKE3 for various cryptographic operations.
 """
 
 import hashlib
-from typing import Union, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Optional, List, Iterable, BinaryIO
 
 try:
     import blake3
@@ -15,6 +17,168 @@ except ImportError:
     BLAKE3_AVAILABLE = False
     print("Warning: BLAKE3 library not available. Using fallback implementation.")
 
+# Minimum total input size for hash_many to spread a batch across threads;
+# hashlib only releases the GIL for inputs larger than 2047 bytes
+PARALLEL_HASH_MIN_BYTES = 1024 * 1024
+
+# Size of the reads of hash_file
+HASH_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Thread pool shared by hash_many calls, created on first use
+_hash_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by hash_many calls."""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _hash_executor
+
+def _sha3_256_chunk(inputs: List[bytes]) -> List[bytes]:
+    """Hash a chunk of inputs with SHA3-256."""
+    sha3_256 = hashlib.sha3_256
+    return [sha3_256(data).digest() for data in inputs]
+
+class Sha3Hasher:
+    """Class computing a SHA3-256 hash incrementally."""
+    
+    def __init__(self, data: Union[bytes, str] = None):
+        """
+        Initialize a Sha3Hasher instance.
+        
+        Args:
+            data: Initial input data (bytes or string)
+        """
+        self._hasher = hashlib.sha3_256()
+        
+        if data is not None:
+            self.update(data)
+    
+    def update(self, data: Union[bytes, bytearray, memoryview, str]) -> 'Sha3Hasher':
+        """
+        Add data to the hash.
+        
+        Args:
+            data: Input data (bytes-like or string)
+        
+        Returns:
+            The hasher, so that calls can be chained
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        self._hasher.update(data)
+        return self
+    
+    def digest(self) -> bytes:
+        """
+        Get the hash of the data added so far; more data can still be added.
+        
+        Returns:
+            32-byte hash digest
+        """
+        return self._hasher.digest()
+    
+    def hexdigest(self) -> str:
+        """Get the hash of the data added so far as a hex string."""
+        return self.digest().hex()
+    
+    def copy(self) -> 'Sha3Hasher':
+        """Get an independent copy of the hasher in its current state."""
+        hasher = Sha3Hasher()
+        hasher._hasher = self._hasher.copy()
+        return hasher
+
+class Blake3Hasher:
+    """
+    Class computing a BLAKE3 hash incrementally.
+    
+    Without the BLAKE3 library, outputs of up to 32 bytes are truncated
+    SHA3-256 hashes and longer outputs are read from the SHAKE256 XOF, as
+    HashFunctions.blake3_hash does.
+    """
+    
+    def __init__(self, data: Union[bytes, str] = None, output_length: int = 32):
+        """
+        Initialize a Blake3Hasher instance.
+        
+        Args:
+            data: Initial input data (bytes or string)
+            output_length: Length of output in bytes (default: 32)
+        """
+        self.output_length = output_length
+        
+        if BLAKE3_AVAILABLE:
+            self._hasher = blake3.blake3()
+        elif output_length <= 32:
+            self._hasher = hashlib.sha3_256()
+        else:
+            self._hasher = hashlib.shake_256()
+        
+        if data is not None:
+            self.update(data)
+    
+    def update(self, data: Union[bytes, bytearray, memoryview, str]) -> 'Blake3Hasher':
+        """
+        Add data to the hash.
+        
+        Args:
+            data: Input data (bytes-like or string)
+        
+        Returns:
+            The hasher, so that calls can be chained
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        self._hasher.update(data)
+        return self
+    
+    def digest(self) -> bytes:
+        """
+        Get the hash of the data added so far; more data can still be added.
+        
+        Returns:
+            Hash digest of the hasher's output length
+        """
+        if BLAKE3_AVAILABLE:
+            return self._hasher.digest(length=self.output_length)
+        elif self.output_length <= 32:
+            return self._hasher.digest()[:self.output_length]
+        else:
+            return self._hasher.digest(self.output_length)
+    
+    def hexdigest(self) -> str:
+        """Get the hash of the data added so far as a hex string."""
+        return self.digest().hex()
+    
+    def copy(self) -> 'Blake3Hasher':
+        """Get an independent copy of the hasher in its current state."""
+        hasher = Blake3Hasher(output_length=self.output_length)
+        hasher._hasher = self._hasher.copy()
+        return hasher
+
+def _new_hasher(algorithm: str, output_length: int) -> Union[Sha3Hasher, Blake3Hasher]:
+    """
+    Create a streaming hasher.
+    
+    Args:
+        algorithm: "sha3_256" or "blake3"
+        output_length: Length of output in bytes (BLAKE3 only)
+    
+    Returns:
+        Hasher instance
+    
+    Raises:
+        ValueError: If the algorithm is not supported
+    """
+    if algorithm == "sha3_256":
+        return Sha3Hasher()
+    elif algorithm == "blake3":
+        return Blake3Hasher(output_length=output_length)
+    
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
 class HashFunctions:
     """Class providing hash functions for the Synergy Network."""
     
@@ -46,35 +210,66 @@ class HashFunctions:
         Returns:
             Hash digest of specified length
         """
-        if isinstance(data, str):
-            data = data.encode('utf-8')
+        return Blake3Hasher(data, output_length).digest()
+    
+    @staticmethod
+    def hash_stream(
+        chunks: Iterable[Union[bytes, bytearray, memoryview, str]],
+        algorithm: str = "sha3_256",
+        output_length: int = 32
+    ) -> bytes:
+        """
+        Hash data given as a sequence of chunks, without joining them.
         
-        if BLAKE3_AVAILABLE:
-            # Use native BLAKE3 implementation
-            hasher = blake3.blake3(data)
-            return hasher.digest(length=output_length)
-        else:
-            # Fallback to SHA3 with different lengths
-            if output_length <= 32:
-                # Use SHA3-256 and truncate if needed
-                hash_value = hashlib.sha3_256(data).digest()
-                return hash_value[:output_length]
-            else:
-                # For longer outputs, use multiple SHA3-256 hashes
-                result = bytearray()
-                counter = 0
-                while len(result) < output_length:
-                    # Add counter to data to get different hashes
-                    counter_bytes = counter.to_bytes(4, byteorder='big')
-                    hash_value = hashlib.sha3_256(data + counter_bytes).digest()
-                    
-                    # Add as much as needed
-                    remaining = output_length - len(result)
-                    result.extend(hash_value[:min(32, remaining)])
-                    
-                    counter += 1
-                
-                return bytes(result)
+        The digest equals the hash of the concatenated chunks.
+        
+        Args:
+            chunks: Input data chunks (bytes-like or strings)
+            algorithm: "sha3_256" or "blake3"
+            output_length: Length of output in bytes (BLAKE3 only)
+        
+        Returns:
+            Hash digest
+        """
+        hasher = _new_hasher(algorithm, output_length)
+        for chunk in chunks:
+            hasher.update(chunk)
+        return hasher.digest()
+    
+    @staticmethod
+    def hash_file(
+        file: Union[str, BinaryIO],
+        algorithm: str = "sha3_256",
+        output_length: int = 32,
+        chunk_size: int = HASH_FILE_CHUNK_SIZE
+    ) -> bytes:
+        """
+        Hash the contents of a file in constant memory.
+        
+        Args:
+            file: File path, or binary file object read from its current position
+            algorithm: "sha3_256" or "blake3"
+            output_length: Length of output in bytes (BLAKE3 only)
+            chunk_size: Size of each read in bytes
+        
+        Returns:
+            Hash digest
+        """
+        if isinstance(file, str):
+            with open(file, "rb") as handle:
+                return HashFunctions.hash_file(handle, algorithm, output_length, chunk_size)
+        
+        hasher = _new_hasher(algorithm, output_length)
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+        
+        return hasher.digest()
     
     @staticmethod
     def hash_transaction(tx_data: dict) -> bytes:
@@ -113,9 +308,40 @@ class HashFunctions:
         return HashFunctions.sha3_256(serialized)
     
     @staticmethod
-    def merkle_root(hashes: list) -> bytes:
+    def hash_many(inputs: Iterable[Union[bytes, str]], threads: int = 1) -> List[bytes]:
         """
-        Compute the Merkle root of a list of hashes.
+        Compute the SHA3-256 hashes of many inputs in one call.
+        
+        Args:
+            inputs: Input data (bytes or strings)
+            threads: Maximum number of threads to spread the batch across; large
+                inputs are hashed without holding the GIL, so batches of at
+                least PARALLEL_HASH_MIN_BYTES are split across threads
+        
+        Returns:
+            List of 32-byte hash digests, in input order
+        """
+        inputs = [data.encode('utf-8') if isinstance(data, str) else data for data in inputs]
+        
+        if threads > 1 and len(inputs) > 1 and sum(map(len, inputs)) >= PARALLEL_HASH_MIN_BYTES:
+            chunk_size = -(-len(inputs) // threads)
+            chunks = [inputs[i:i + chunk_size] for i in range(0, len(inputs), chunk_size)]
+            
+            digests = []
+            for chunk_digests in _get_hash_executor().map(_sha3_256_chunk, chunks):
+                digests.extend(chunk_digests)
+            return digests
+        
+        return _sha3_256_chunk(inputs)
+    
+    @staticmethod
+    def merkle_root_batched(hashes: Iterable[bytes]) -> bytes:
+        """
+        Compute the Merkle root of a list of hashes, level by level.
+        
+        The tree is built iteratively without modifying the input. Levels
+        with an odd number of nodes pair their last node with itself, and a
+        single hash is its own root.
         
         Args:
             hashes: List of hash digests (bytes)
@@ -123,28 +349,32 @@ class HashFunctions:
         Returns:
             32-byte Merkle root hash
         """
-        if not hashes:
+        level = list(hashes)
+        if not level:
             # Empty list, return zero hash
             return bytes(32)
         
-        if len(hashes) == 1:
-            # Single hash, return it
-            return hashes[0]
+        sha3_256 = hashlib.sha3_256
+        while len(level) > 1:
+            if len(level) % 2 == 1:
+                level.append(level[-1])  # Duplicate last hash
+            
+            level = [sha3_256(left + right).digest() for left, right in zip(level[0::2], level[1::2])]
         
-        # Make sure we have an even number of hashes
-        if len(hashes) % 2 == 1:
-            hashes.append(hashes[-1])  # Duplicate last hash
+        return level[0]
+    
+    @staticmethod
+    def merkle_root(hashes: list) -> bytes:
+        """
+        Compute the Merkle root of a list of hashes.
         
-        # Compute next level of tree
-        next_level = []
-        for i in range(0, len(hashes), 2):
-            # Concatenate adjacent hashes and hash them
-            combined = hashes[i] + hashes[i+1]
-            next_hash = HashFunctions.sha3_256(combined)
-            next_level.append(next_hash)
+        Args:
+            hashes: List of hash digests (bytes); the list is not modified
         
-        # Recurse to compute root of next level
-        return HashFunctions.merkle_root(next_level)
+        Returns:
+            32-byte Merkle root hash
+        """
+        return HashFunctions.merkle_root_batched(hashes)
     
     @staticmethod
     def kdf(password: Union[bytes, str], salt: bytes, length: int = 32) -> bytes:
@@ -219,6 +449,17 @@ if __name__ == "__main__":
     merkle_root = HashFunctions.merkle_root(hashes)
     print(f"Merkle root of 7 transactions: {merkle_root.hex()}")
     
+    # Test streaming hashing
+    hasher = Sha3Hasher()
+    for part in message.split(" "):
+        hasher.update(part).update(" ")
+    print(f"Streaming hash matches: {hasher.digest() == HashFunctions.sha3_256(message + ' ')}")
+    print(f"Long BLAKE3 output: {HashFunctions.blake3_hash(message, 64).hex()}")
+    
+    # Test batched hashing
+    batch = HashFunctions.hash_many([f"Transaction {i}" for i in range(7)])
+    print(f"Batched hashes match: {batch == hashes}")
+    
     # Test KDF
     password = "secure_password"
     salt = b"synergy_salt"